@@ -0,0 +1,87 @@
+"""Bytes saved and CPU spent compressing GET /api/v1/todo pages, per codec and level,
+and the per-request cost once the compressed body is cached under its ETag.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_compression.py
+"""
+import asyncio
+import time
+import timeit
+from datetime import datetime, timezone
+
+from DalmengSimpleTodo.compression.codecs import CODECS
+from DalmengSimpleTodo.compression.compression_middleware import CompressionMiddleware
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.models.base_model import BaseResponseModel
+from DalmengSimpleTodo.models.response.todo_response_model import TodoResponseModel
+
+LEVELS = {
+    "gzip": ("RESPONSE_COMPRESSION_GZIP_LEVEL", (1, 6, 9)),
+    "br": ("RESPONSE_COMPRESSION_BROTLI_QUALITY", (1, 4, 11)),
+    "zstd": ("RESPONSE_COMPRESSION_ZSTD_LEVEL", (1, 3, 19)),
+}
+
+def make_body(count: int) -> bytes:
+    now = datetime.now(timezone.utc)
+    todos = [
+        TodoResponseModel(id=f"{i:024x}", title=f"Todo {i}", content=f"Some content for todo number {i}",
+                          updatedAt=now, revision=i % 7)
+        for i in range(count)
+    ]
+    return BaseResponseModel.succeed(data={"todos": todos, "next_cursor": None, "prev_cursor": None}).body
+
+def cpu_per_call(func, number: int) -> float:
+    start = time.process_time()
+    for _ in range(number):
+        func()
+    return (time.process_time() - start) / number
+
+async def middleware_per_request(body: bytes, tagged: bool, number: int) -> float:
+    headers = {"content-type": "application/json", "content-length": str(len(body))}
+    if tagged:
+        headers["etag"] = '"v1"'
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(k.encode(), v.encode()) for k, v in headers.items()]})
+        await send({"type": "http.response.body", "body": body})
+
+    async def discard(message):
+        pass
+
+    middleware = CompressionMiddleware(app, encodings=("gzip",))
+    scope = {"type": "http", "path": "/api/v1/todo", "headers": [(b"accept-encoding", b"gzip")]}
+    start = time.process_time()
+    for _ in range(number):
+        await middleware(scope, None, discard)
+    return (time.process_time() - start) / number
+
+def main():
+    print(f"codecs available: {', '.join(CODECS)}")
+    print(f"{'todos':>6} {'raw (KB)':>9} {'codec':>6} {'level':>6} {'out (KB)':>9} {'saved':>7} {'CPU (ms)':>9}")
+    for count in (50, 500):
+        body = make_body(count)
+        number = 200 if count == 50 else 20
+        for codec, (setting, levels) in LEVELS.items():
+            if codec not in CODECS:
+                continue
+            default = getattr(AppConfig, setting)
+            for level in levels:
+                setattr(AppConfig, setting, level)
+                out = CODECS[codec](body)
+                cpu = cpu_per_call(lambda: CODECS[codec](body), number)
+                print(f"{count:>6} {len(body) / 1024:>9.1f} {codec:>6} {level:>6} {len(out) / 1024:>9.1f} "
+                      f"{1 - len(out) / len(body):>7.1%} {cpu * 1000:>9.3f}")
+            setattr(AppConfig, setting, default)
+
+    print()
+    print("gzip through CompressionMiddleware, CPU per request:")
+    for count in (50, 500):
+        body = make_body(count)
+        uncached = asyncio.run(middleware_per_request(body, tagged=False, number=100))
+        cached = asyncio.run(middleware_per_request(body, tagged=True, number=100))
+        print(f"{count:>6} todos: no ETag {uncached * 1000:7.3f}ms  cached by ETag {cached * 1000:7.3f}ms")
+
+if __name__ == "__main__":
+    main()
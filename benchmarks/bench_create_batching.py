@@ -0,0 +1,70 @@
+"""Create throughput with and without write batching (group commit) in TodoService.
+
+The fake Prisma client is given a small connection pool and a fixed cost per round-trip
+plus per document, which is what batching amortises:
+
+    PYTHONPATH=src python benchmarks/bench_create_batching.py [--writers 100 1000] [--latency-ms 1]
+"""
+import argparse
+import asyncio
+import time
+from unittest.mock import patch
+
+from fake_prisma import FakePrisma
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.database.todo_repository import TodoRepositoryProvider
+from DalmengSimpleTodo.models.request.todo_request_model import CreateTodoRequestModel
+from DalmengSimpleTodo.service.todo_service import TodoService
+
+class SlowFakePrisma(FakePrisma):
+    """FakePrisma whose todo calls wait for a pooled connection and a simulated round-trip."""
+
+    def __init__(self, pool_size: int, latency: float, per_document: float):
+        super().__init__()
+        pool = asyncio.Semaphore(pool_size)
+
+        def slow(call, documents):
+            async def wrapper(*args, **kwargs):
+                async with pool:
+                    await asyncio.sleep(latency + per_document * documents(*args, **kwargs))
+                return await call(*args, **kwargs)
+            return wrapper
+
+        todo = self.todo
+        todo.create = slow(todo.create, lambda **kwargs: 1)
+        todo.create_many = slow(todo.create_many, lambda data, **kwargs: len(data))
+        todo.find_many = slow(todo.find_many, lambda where=None, **kwargs: len(where["id"]["in"]))
+
+async def run(writers: int, creates_per_writer: int, batching: bool, args) -> float:
+    AppConfig.TODO_CREATE_BATCHING_ENABLED = batching
+    TodoService.create_batcher = None
+    prisma = SlowFakePrisma(args.pool_size, args.latency_ms / 1000, args.per_document_us / 1_000_000)
+    TodoRepositoryProvider.set_repository(TodoRepositoryProvider.create_repository("prisma"))
+    titles = iter(range(writers * creates_per_writer))
+
+    async def writer():
+        for _ in range(creates_per_writer):
+            await TodoService.create_todo(CreateTodoRequestModel(title=f"Todo {next(titles)}", content="Content"))
+
+    with patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client", return_value=prisma):
+        start = time.perf_counter()
+        await asyncio.gather(*(writer() for _ in range(writers)))
+        elapsed = time.perf_counter() - start
+    assert len(prisma.todo.rows) == writers * creates_per_writer
+    return writers * creates_per_writer / elapsed
+
+async def main(args):
+    for writers in args.writers:
+        direct = await run(writers, args.creates_per_writer, False, args)
+        batched = await run(writers, args.creates_per_writer, True, args)
+        print(f"{writers:>5} writers: direct {direct:>8.0f} creates/s  batched {batched:>8.0f} creates/s  "
+              f"x{batched / direct:.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--writers", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--creates-per-writer", type=int, default=5)
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--per-document-us", type=float, default=20)
+    asyncio.run(main(parser.parse_args()))
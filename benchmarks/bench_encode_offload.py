@@ -0,0 +1,77 @@
+"""Latency of small GET /api/v1/todo?limit=5 requests while other clients keep fetching
+500-todo pages, with large-body encoding inline on the event loop and offloaded to a thread or
+process pool (RESPONSE_ENCODE_OFFLOAD). TodoCache is off, so every large page is encoded anew.
+
+    PYTHONPATH=src python benchmarks/bench_encode_offload.py [--large-clients 4] [--small-requests 300]
+"""
+import argparse
+import asyncio
+import time
+from unittest.mock import patch
+
+from httpx import ASGITransport, AsyncClient
+
+from fake_prisma import FakePrisma
+from DalmengSimpleTodo.cache.todo_cache import TodoCache
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.database.todo_repository import TodoRepositoryProvider
+from DalmengSimpleTodo.main import app
+from DalmengSimpleTodo.models.encode_offload import EncodeOffload
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))]
+
+async def run(mode: str, args):
+    AppConfig.RESPONSE_ENCODE_OFFLOAD = mode
+    EncodeOffload.shutdown()
+    done = False
+    large_served = 0
+
+    async def large_client(client):
+        nonlocal large_served
+        while not done:
+            response = await client.get(
+                "/api/v1/todo", params={"limit": AppConfig.TODO_PAGE_SIZE_MAX}, headers={"Accept-Encoding": "identity"}
+            )
+            large_served += response.status_code == 200
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        # Warm up: the process pool forks its workers on first use.
+        await client.get("/api/v1/todo", params={"limit": AppConfig.TODO_PAGE_SIZE_MAX})
+        large = [asyncio.create_task(large_client(client)) for _ in range(args.large_clients)]
+        latencies = []
+        start = time.perf_counter()
+        for _ in range(args.small_requests):
+            request_start = time.perf_counter()
+            await client.get("/api/v1/todo", params={"limit": 5})
+            latencies.append(time.perf_counter() - request_start)
+            await asyncio.sleep(0.001)
+        elapsed = time.perf_counter() - start
+        done = True
+        await asyncio.gather(*large)
+
+    latencies.sort()
+    print(f"offload {mode:<8} small p50 {percentile(latencies, 0.5) * 1000:7.2f}ms  "
+          f"p99 {percentile(latencies, 0.99) * 1000:7.2f}ms  max {latencies[-1] * 1000:7.2f}ms  "
+          f"large pages {large_served / elapsed:6.1f}/s")
+
+async def main(args):
+    TodoCache.enabled = False
+    prisma = FakePrisma()
+    prisma.todo.seed(AppConfig.TODO_PAGE_SIZE_MAX * 2)
+    content = "x" * args.content_bytes
+    for todo_id, todo in prisma.todo.rows.items():
+        prisma.todo.rows[todo_id] = todo.model_copy(update={"content": content})
+    TodoRepositoryProvider.set_repository(TodoRepositoryProvider.create_repository("prisma"))
+    with patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client", return_value=prisma):
+        for mode in args.modes:
+            await run(mode, args)
+    EncodeOffload.shutdown()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modes", nargs="+", default=["off", "thread", "process"])
+    parser.add_argument("--large-clients", type=int, default=4)
+    parser.add_argument("--small-requests", type=int, default=300)
+    parser.add_argument("--content-bytes", type=int, default=4096)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,78 @@
+"""Throughput of the error paths (bad ids, 404s, validation failures, oversized bodies,
+rate-limit rejections) next to a successful request, calling the ASGI app directly so
+client overhead does not hide the server's cost.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_error_paths.py [--requests 2000]
+"""
+import argparse
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+from fake_prisma import FakePrisma
+from DalmengSimpleTodo.admission.rate_limit_middleware import RateLimitMiddleware
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.database.todo_repository import TodoRepositoryProvider
+from DalmengSimpleTodo.main import app
+
+MISSING_ID = "67e42cbd23fd49969709329a"
+
+def scenarios(existing_id: str):
+    bulk_invalid = json.dumps({"todos": [{}] * AppConfig.TODO_BULK_MAX_ITEMS}).encode()
+    oversized = json.dumps({"title": "Todo", "content": "x" * AppConfig.REQUEST_BODY_MAX_BYTES}).encode()
+    return {
+        "200 GET /api/v1/todo?limit=1": (app, "GET", "/api/v1/todo", b"", b"limit=1"),
+        "200 PUT /api/v1/todo/{id}": (app, "PUT", f"/api/v1/todo/{existing_id}", b'{"content": "Updated"}', b""),
+        "400 malformed id": (app, "DELETE", "/api/v1/todo/not-an-id", b"", b""),
+        "404 missing todo": (app, "DELETE", f"/api/v1/todo/{MISSING_ID}", b"", b""),
+        "422 missing fields": (app, "POST", "/api/v1/todo", b"{}", b""),
+        "422 malformed JSON": (app, "POST", "/api/v1/todo", b"{not json", b""),
+        f"422 bulk, {AppConfig.TODO_BULK_MAX_ITEMS} invalid items": (app, "POST", "/api/v1/todo/bulk", bulk_invalid, b""),
+        "413 oversized body": (app, "POST", "/api/v1/todo", oversized, b""),
+        "429 rate limited": (RateLimitMiddleware(app, rules=[], default_rate=1e-9, default_burst=1),
+                             "GET", "/api/v1/todo", b"", b"limit=1"),
+    }
+
+async def call(asgi_app, method: str, path: str, body: bytes, query_string: bytes) -> int:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "scheme": "http",
+        "method": method, "path": path, "raw_path": path.encode(), "root_path": "", "query_string": query_string,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        "client": ("10.0.0.1", 50000), "server": ("bench", 80),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        return messages.pop() if messages else {"type": "http.disconnect"}
+
+    status = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await asgi_app(scope, receive, send)
+    return status[0]
+
+async def main(requests: int):
+    prisma = FakePrisma()
+    prisma.todo.seed(100)
+    TodoRepositoryProvider.set_repository(TodoRepositoryProvider.create_repository("prisma"))
+    with patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client", return_value=prisma):
+        for name, (asgi_app, method, path, body, query_string) in scenarios(prisma.todo.ids[0]).items():
+            await call(asgi_app, method, path, body, query_string)
+            status = await call(asgi_app, method, path, body, query_string)
+            number = max(1, requests // 10) if len(body) > 10_000 else requests
+            start = time.process_time()
+            for _ in range(number):
+                await call(asgi_app, method, path, body, query_string)
+            cpu = (time.process_time() - start) / number
+            print(f"{name:<40} status {status}  {cpu * 1e6:8.0f}us CPU/request  {1 / cpu:9.0f} req/s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    asyncio.run(main(parser.parse_args().requests))
@@ -0,0 +1,47 @@
+"""Cost of idle event subscribers and of fanning events out to them.
+
+    PYTHONPATH=src python benchmarks/bench_event_broker.py [--subscribers 10000]
+"""
+import argparse
+import asyncio
+import time
+
+from DalmengSimpleTodo.events.event_broker import TodoEvent
+from DalmengSimpleTodo.events.todo_events import TodoEvents
+
+async def consume(received: list, done: asyncio.Event, expected: int):
+    async for batch in TodoEvents.listen(keepalive=15):
+        received[0] += len(batch)
+        if received[0] >= expected:
+            done.set()
+
+async def main(subscribers: int, events: int, idle_seconds: float):
+    received = [0]
+    done = asyncio.Event()
+    consumers = [asyncio.create_task(consume(received, done, subscribers * events)) for _ in range(subscribers)]
+    await asyncio.sleep(0.1)
+
+    cpu = time.process_time()
+    await asyncio.sleep(idle_seconds)
+    idle_cpu = time.process_time() - cpu
+    print(f"{subscribers:,} idle subscribers: {idle_cpu / idle_seconds * 100:.2f}% CPU")
+
+    start = time.perf_counter()
+    for i in range(events):
+        TodoEvents.broker.publish(TodoEvent("updated", f"{i:024x}", {"id": f"{i:024x}", "title": "Todo"}))
+    publish_time = time.perf_counter() - start
+    await done.wait()
+    delivered_time = time.perf_counter() - start
+    print(f"{events} events -> {received[0]:,} deliveries: publish {publish_time * 1000:.1f}ms, "
+          f"all consumers woken {delivered_time * 1000:.1f}ms")
+
+    TodoEvents.close()
+    await asyncio.gather(*consumers)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--subscribers", type=int, default=10_000)
+    parser.add_argument("--events", type=int, default=10)
+    parser.add_argument("--idle-seconds", type=float, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.subscribers, args.events, args.idle_seconds))
@@ -0,0 +1,33 @@
+"""Throughput of MemoryTodoRepository operations.
+
+    PYTHONPATH=src python benchmarks/bench_memory_repository.py [--size 100000]
+"""
+import argparse
+import asyncio
+import random
+from time import perf_counter
+
+from DalmengSimpleTodo.database.memory_todo_repository import MemoryTodoRepository
+
+async def measure(name, operations, func):
+    start = perf_counter()
+    for i in range(operations):
+        await func(i)
+    elapsed = perf_counter() - start
+    print(f"{name:<12} {operations / elapsed:>12,.0f} ops/s")
+
+async def main(size: int):
+    repository = MemoryTodoRepository()
+    await measure("create", size, lambda i: repository.create({"title": f"Todo {i}", "content": "Content"}))
+
+    ids = list(repository.rows)
+    random.shuffle(ids)
+    await measure("find_by_id", size, lambda i: repository.find_by_id(ids[i]))
+    await measure("find_page", size, lambda i: repository.find_page(take=20, after=ids[i]))
+    await measure("update", size, lambda i: repository.update(ids[i], {"title": f"Updated {i}"}))
+    await measure("delete", size, lambda i: repository.delete(ids[i]))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=100_000)
+    asyncio.run(main(parser.parse_args().size))
@@ -0,0 +1,78 @@
+"""Measure the latency overhead MetricsMiddleware adds to a request.
+
+Runs the todo router in-process with TodoService.get_todos and get_collection_version patched
+out, once bare and once wrapped in MetricsMiddleware, and fails if the overhead is above the
+threshold. Rounds alternate which app goes first and the median request latencies are
+compared, so drift, GC pauses and the odd slow round don't decide the result.
+
+    PYTHONPATH=src python benchmarks/bench_metrics_overhead.py [--requests 3000] [--rounds 11] [--max-overhead 0.05]
+"""
+import argparse
+import asyncio
+import gc
+import statistics
+import sys
+from time import perf_counter
+from typing import List
+from unittest.mock import AsyncMock, patch
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from DalmengSimpleTodo.metrics.metrics_middleware import MetricsMiddleware
+from DalmengSimpleTodo.models.response.todo_response_model import TodoResponseModel
+from DalmengSimpleTodo.routers.todo_router import todo_router
+
+def build_app(with_metrics: bool) -> FastAPI:
+    app = FastAPI()
+    app.include_router(todo_router)
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+async def run(app: FastAPI, requests: int) -> List[float]:
+    latencies = []
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for _ in range(requests):
+            start = perf_counter()
+            await client.get("/api/v1/todo")
+            latencies.append(perf_counter() - start)
+    return latencies
+
+async def main(requests: int, rounds: int, max_overhead: float) -> int:
+    page = {
+        "todos": [TodoResponseModel(id=f"{i:024x}", title=f"Todo {i}", content="Content") for i in range(20)],
+        "next_cursor": None,
+        "prev_cursor": None,
+    }
+    bare, instrumented = build_app(False), build_app(True)
+
+    with patch("DalmengSimpleTodo.service.todo_service.TodoService.get_todos", AsyncMock(return_value=page)), \
+            patch("DalmengSimpleTodo.service.todo_service.TodoService.get_collection_version", AsyncMock(return_value="v1")):
+        await run(bare, 500)
+        await run(instrumented, 500)
+        bare_times, instrumented_times = [], []
+        for round_number in range(rounds):
+            gc.collect()
+            if round_number % 2:
+                instrumented_times += await run(instrumented, requests)
+                bare_times += await run(bare, requests)
+            else:
+                bare_times += await run(bare, requests)
+                instrumented_times += await run(instrumented, requests)
+
+    bare_latency = statistics.median(bare_times)
+    instrumented_latency = statistics.median(instrumented_times)
+    overhead = instrumented_latency / bare_latency - 1
+    print(f"bare:         {bare_latency * 1e6:8.1f} us/request")
+    print(f"instrumented: {instrumented_latency * 1e6:8.1f} us/request")
+    print(f"overhead:     {overhead * 100:8.2f} % (max {max_overhead * 100:.1f} %)")
+    return 0 if overhead <= max_overhead else 1
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--rounds", type=int, default=11)
+    parser.add_argument("--max-overhead", type=float, default=0.05)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.requests, args.rounds, args.max_overhead)))
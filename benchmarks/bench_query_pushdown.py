@@ -0,0 +1,59 @@
+"""Answering "how many todos start with X" and "the first page of them by title": fetching every
+page and filtering on the client, against one filtered or count_only request. Reports the bytes
+sent to the client and the wall time through the ASGI app.
+
+    PYTHONPATH=src python benchmarks/bench_query_pushdown.py [--sizes 1000 10000]
+"""
+import argparse
+import asyncio
+import time
+from unittest.mock import patch
+
+from httpx import ASGITransport, AsyncClient
+
+from fake_prisma import FakePrisma
+from DalmengSimpleTodo.cache.todo_cache import TodoCache
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.database.todo_repository import TodoRepositoryProvider
+from DalmengSimpleTodo.main import app
+
+PREFIX = "Todo 1"
+
+async def client_side(client: AsyncClient):
+    todos, received, cursor = [], 0, None
+    while True:
+        response = await client.get("/api/v1/todo", params={"limit": AppConfig.TODO_PAGE_SIZE_MAX, "after": cursor})
+        received += len(response.content)
+        data = response.json()["data"]
+        todos.extend(todo for todo in data["todos"] if todo["title"].startswith(PREFIX))
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+    first_page = sorted(todos, key=lambda todo: todo["title"])[:50]
+    return len(todos), first_page[0]["title"], received
+
+async def pushed_down(client: AsyncClient):
+    count = await client.get("/api/v1/todo", params={"title_prefix": PREFIX, "count_only": "true"})
+    page = await client.get("/api/v1/todo", params={"title_prefix": PREFIX, "sort": "title", "limit": 50})
+    first = page.json()["data"]["todos"][0]["title"]
+    return count.json()["data"]["count"], first, len(count.content) + len(page.content)
+
+async def main(args):
+    TodoCache.enabled = False
+    for size in args.sizes:
+        prisma = FakePrisma()
+        prisma.todo.seed(size)
+        TodoRepositoryProvider.set_repository(TodoRepositoryProvider.create_repository("prisma"))
+        with patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client", return_value=prisma):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+                for name, query in (("client-side", client_side), ("pushed down", pushed_down)):
+                    start = time.perf_counter()
+                    count, first, received = await query(client)
+                    elapsed = time.perf_counter() - start
+                    print(f"size={size:<7} {name:<12} count={count:<6} first={first!r:<12} "
+                          f"{received / 1024:>9.1f} KiB  {elapsed * 1000:>8.1f}ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,56 @@
+"""Poll storm: bursts of identical concurrent GET /api/v1/todo reads, with read coalescing
+(single-flight) on and off. Each burst comes right after a write moved the collection version
+past every cached page. The fake Prisma client takes --latency-ms per query.
+
+    PYTHONPATH=src python benchmarks/bench_read_coalescing.py [--readers 100 1000]
+"""
+import argparse
+import asyncio
+import time
+from unittest.mock import patch
+
+from fake_prisma import FakePrisma
+from DalmengSimpleTodo.cache.todo_cache import TodoCache
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.database.todo_repository import TodoRepositoryProvider
+from DalmengSimpleTodo.service.todo_service import TodoService
+
+async def run(readers: int, bursts: int, coalescing: bool, latency: float):
+    AppConfig.TODO_READ_COALESCING_ENABLED = coalescing
+    # Every fresh fake starts its collection version at 0 again.
+    TodoCache.clear()
+    prisma = FakePrisma()
+    prisma.todo.seed(1_000)
+    find_many = prisma.todo.find_many
+    queries = 0
+
+    async def slow_find_many(*args, **kwargs):
+        nonlocal queries
+        queries += 1
+        await asyncio.sleep(latency)
+        return await find_many(*args, **kwargs)
+
+    prisma.todo.find_many = slow_find_many
+    repository = TodoRepositoryProvider.create_repository("prisma")
+    TodoRepositoryProvider.set_repository(repository)
+    with patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client", return_value=prisma):
+        start = time.perf_counter()
+        for _ in range(bursts):
+            await repository.update(prisma.todo.ids[0], {"content": "Updated"})
+            await asyncio.gather(*(TodoService.get_todos(limit=50) for _ in range(readers)))
+        elapsed = time.perf_counter() - start
+    return readers * bursts / elapsed, queries
+
+async def main(args):
+    for readers in args.readers:
+        for coalescing in (False, True):
+            rps, queries = await run(readers, args.bursts, coalescing, args.latency_ms / 1000)
+            print(f"{readers:>5} readers  coalescing {'on ' if coalescing else 'off'}  {rps:>9.0f} reads/s  "
+                  f"{queries:>6} queries for {readers * args.bursts} reads")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--readers", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--bursts", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=2)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,42 @@
+"""Compare BaseResponseModel encoding against the old jsonable_encoder + json.dumps path.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_response_encoding.py
+"""
+import json
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+
+from DalmengSimpleTodo.models.response.todo_response_model import TodoResponseModel
+from DalmengSimpleTodo.models.response_encoder import ENCODERS, encode_envelope, _envelope
+from DalmengSimpleTodo.config.app_config import AppConfig
+
+def legacy_envelope(data):
+    content = {"status_code": 200, "msg": "succeed", "data": data}
+    return json.dumps(jsonable_encoder(content)).encode()
+
+def make_todos(count):
+    return [
+        TodoResponseModel(id=f"{i:024x}", title=f"Todo {i}", content="Some content for the todo")
+        for i in range(count)
+    ]
+
+def bench(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+def main():
+    print(f"{'todos':>6} {'encoder':>8} {'legacy (ms)':>12} {'fast (ms)':>10} {'speedup':>8}")
+    for count in (1, 100, 10_000):
+        todos = make_todos(count)
+        number = max(1, 10_000 // count)
+        legacy = bench(lambda: legacy_envelope(todos), number)
+        for encoder in ENCODERS:
+            AppConfig.RESPONSE_JSON_ENCODER = encoder
+            _envelope.cache_clear()
+            fast = bench(lambda: encode_envelope(200, "succeed", todos), number)
+            print(f"{count:>6} {encoder:>8} {legacy * 1000:>12.3f} {fast * 1000:>10.3f} {legacy / fast:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
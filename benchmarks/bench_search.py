@@ -0,0 +1,47 @@
+"""Latency of MemoryTodoRepository.search over a large collection.
+
+    PYTHONPATH=src python benchmarks/bench_search.py [--size 1000000]
+"""
+import argparse
+import asyncio
+import random
+from time import perf_counter
+
+from DalmengSimpleTodo.database.memory_todo_repository import MemoryTodoRepository
+from DalmengSimpleTodo.utils.text_search import parse_query
+
+WORDS = [f"word{i}" for i in range(5_000)]
+
+async def main(size: int, queries: int):
+    rng = random.Random(0)
+    repository = MemoryTodoRepository()
+    start = perf_counter()
+    while len(repository.rows) < size:
+        title = " ".join(rng.choices(WORDS, k=3))
+        if title not in repository.titles:
+            await repository.create({"title": title, "content": " ".join(rng.choices(WORDS, k=8))})
+    print(f"seeded {size:,} todos in {perf_counter() - start:.1f}s")
+
+    for label, make_query in {
+        "one term": lambda: f"{rng.choice(WORDS)} ",
+        "two terms": lambda: f"{rng.choice(WORDS)} {rng.choice(WORDS)} ",
+        "prefix": lambda: f"{rng.choice(WORDS)[:6]}",
+        "term + prefix": lambda: f"{rng.choice(WORDS)} {rng.choice(WORDS)[:7]}",
+    }.items():
+        latencies = []
+        for _ in range(queries):
+            terms, prefix = parse_query(make_query())
+            start = perf_counter()
+            await repository.search(terms, prefix, take=21)
+            latencies.append(perf_counter() - start)
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[int(len(latencies) * 0.99)] * 1000
+        print(f"{label:<14} p50 {p50:7.2f}ms  p99 {p99:7.2f}ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.size, args.queries))
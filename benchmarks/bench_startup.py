@@ -0,0 +1,133 @@
+"""Cold-start profile: import time per module, time until the app accepts requests and time
+to the first successful GET /api/v1/todo, with the database connected eagerly or in the
+background (DATABASE_CONNECT_IN_BACKGROUND). Every run is a fresh interpreter.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_startup.py --output startup.json
+    PYTHONPATH=src python benchmarks/bench_startup.py --baseline startup.json --max-regression 0.2
+
+The Prisma client is patched to benchmarks/fake_prisma.py with --connect-ms of connect
+latency, so the generated client must still be importable. With --baseline the run exits
+non-zero when a timing is worse than the baseline by more than --max-regression.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+IGNORED_MODULES = set(sys.stdlib_module_names) | {"sitecustomize", "usercustomize", "DalmengSimpleTodo"}
+
+CHILD = """
+import asyncio, json, sys, time
+start = time.perf_counter()
+from DalmengSimpleTodo.main import app
+imported = time.perf_counter()
+
+from unittest.mock import patch
+from asgi_lifespan import LifespanManager
+from httpx import ASGITransport, AsyncClient
+from fake_prisma import FakePrisma
+
+class SlowConnectPrisma(FakePrisma):
+    def __init__(self):
+        super().__init__()
+        self._connected = False
+
+    async def connect(self):
+        await asyncio.sleep({connect_seconds})
+        await super().connect()
+
+async def main():
+    with patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client",
+               return_value=SlowConnectPrisma()):
+        async with LifespanManager(app):
+            accepting = time.perf_counter()
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+                while (await client.get("/api/v1/todo")).status_code != 200:
+                    pass
+            first = time.perf_counter()
+    print(json.dumps({{"import_ms": (imported - start) * 1000, "accepting_ms": (accepting - start) * 1000,
+                      "first_response_ms": (first - start) * 1000}}))
+
+asyncio.run(main())
+"""
+
+def child_env(background: bool) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [HERE, env.get("PYTHONPATH")]))
+    env["DATABASE_CONNECT_IN_BACKGROUND"] = "true" if background else "false"
+    env["TODO_REPOSITORY_BACKEND"] = "prisma"
+    return env
+
+def import_profile(top: int):
+    """Cumulative import time (ms) of the heaviest modules, from python -X importtime."""
+    code = "import DalmengSimpleTodo.main, DalmengSimpleTodo.database.prisma_todo_repository"
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            env=child_env(False), capture_output=True, text=True, check=True).stderr
+    modules = {}
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| *(\S+)", line)
+        if not match:
+            continue
+        name = match.group(2)
+        # Our own modules, plus third-party packages at their top level; interpreter startup is not ours.
+        if name.startswith("DalmengSimpleTodo.") or ("." not in name and name not in IGNORED_MODULES):
+            modules[name] = int(match.group(1)) / 1000
+    return sorted(modules.items(), key=lambda item: -item[1])[:top]
+
+def measure(background: bool, connect_seconds: float, runs: int):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", CHILD.format(connect_seconds=connect_seconds)],
+                                env=child_env(background), capture_output=True, text=True, check=True).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+
+def compare(results, baseline, max_regression):
+    regressions = []
+    for mode, timings in results.items():
+        for key, value in timings.items():
+            previous = baseline.get(mode, {}).get(key)
+            if previous is not None and value > previous * (1 + max_regression):
+                regressions.append(f"{mode} {key}: {previous:.1f}ms -> {value:.1f}ms")
+    return regressions
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--connect-ms", type=float, default=200)
+    parser.add_argument("--top", type=int, default=12, help="modules to list in the import profile")
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", help="JSON results from a previous run to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    args = parser.parse_args()
+
+    print("Heaviest imports (cumulative ms):")
+    for module, ms in import_profile(args.top):
+        print(f"  {module:<55} {ms:8.1f}")
+
+    results = {}
+    for mode, background in (("eager", False), ("background", True)):
+        results[mode] = measure(background, args.connect_ms / 1000, args.runs)
+        timings = results[mode]
+        print(f"{mode:>10}: import {timings['import_ms']:7.1f}ms  accepting {timings['accepting_ms']:7.1f}ms  "
+              f"first 200 {timings['first_response_ms']:7.1f}ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
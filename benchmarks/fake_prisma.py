@@ -0,0 +1,221 @@
+"""In-memory stand-in for the generated Prisma client, covering the calls TodoService makes.
+
+Only meant for benchmarks: it lets the real app run in-process without MongoDB or the
+Prisma query engine. Pass write_latency (seconds) to make every todo write wait that long, as a
+database round-trip would, so concurrent writers actually overlap.
+"""
+import asyncio
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from DalmengSimpleTodo.utils.object_id import new_object_id
+
+class FakeTodo(BaseModel):
+    id: str
+    title: str
+    content: str
+    updatedAt: Optional[datetime] = None
+    revision: Optional[int] = 0
+
+class FakeCounter(BaseModel):
+    id: str
+    value: int
+
+class FakeTodoActions:
+    def __init__(self, write_latency: float = 0):
+        self.rows: Dict[str, FakeTodo] = {}
+        self.ids: List[str] = []
+        self.write_latency = write_latency
+
+    def seed(self, count: int):
+        for i in range(count):
+            self._insert({"title": f"Todo {i}", "content": "Seeded content for benchmarking"})
+
+    def top_up(self, size: int):
+        self.seed(max(size - len(self.ids), 0))
+
+    def _insert(self, data: Dict[str, Any]) -> FakeTodo:
+        todo = FakeTodo(
+            id=data.get("id") or new_object_id(), title=data["title"], content=data["content"],
+            updatedAt=datetime.now(timezone.utc),
+        )
+        self.rows[todo.id] = todo
+        insort(self.ids, todo.id)
+        return todo
+
+    def _matching_ids(self, where: Optional[Dict[str, Any]]) -> List[str]:
+        if not where:
+            return self.ids
+        if set(where) != {"id"}:
+            # Filters on other fields: a plain scan, like MongoDB without a usable index.
+            return [todo_id for todo_id in self.ids if self._matches(self.rows[todo_id], where)]
+        condition = where["id"]
+        if isinstance(condition, str):
+            return [condition] if condition in self.rows else []
+        if "in" in condition:
+            return [todo_id for todo_id in condition["in"] if todo_id in self.rows]
+        if "gt" in condition:
+            return self.ids[bisect_right(self.ids, condition["gt"]):]
+        if "lt" in condition:
+            return self.ids[:bisect_left(self.ids, condition["lt"])]
+        raise NotImplementedError(where)
+
+    @staticmethod
+    def _matches(todo: FakeTodo, where: Dict[str, Any]) -> bool:
+        for field, condition in where.items():
+            if field == "AND":
+                if not all(FakeTodoActions._matches(todo, part) for part in condition):
+                    return False
+                continue
+            value = getattr(todo, field)
+            if not isinstance(condition, dict):
+                condition = {"equals": condition}
+            for operator, operand in condition.items():
+                if not {
+                    "equals": lambda: value == operand,
+                    "in": lambda: value in operand,
+                    "gt": lambda: value > operand,
+                    "lt": lambda: value < operand,
+                    "startsWith": lambda: value.startswith(operand),
+                    "contains": lambda: operand in value,
+                }[operator]():
+                    return False
+        return True
+
+    async def find_many(self, take=None, skip=None, where=None, order=None, **kwargs):
+        ids = self._matching_ids(where)
+        if order and "title" in order:
+            ids = sorted(ids, key=lambda todo_id: self.rows[todo_id].title, reverse=order["title"] == "desc")
+        elif order and order.get("id") == "desc":
+            ids = ids[::-1]
+        if take is not None:
+            ids = ids[:take]
+        return [self.rows[todo_id] for todo_id in ids]
+
+    async def find_first(self, order=None, **kwargs):
+        todos = await self.find_many(take=1, order=order, **kwargs)
+        return todos[0] if todos else None
+
+    async def count(self, where=None, **kwargs):
+        return len(self._matching_ids(where)) if where else len(self.rows)
+
+    async def find_unique(self, where):
+        return self.rows.get(where["id"])
+
+    async def _round_trip(self):
+        if self.write_latency:
+            await asyncio.sleep(self.write_latency)
+
+    async def create(self, data):
+        await self._round_trip()
+        return self._insert(data)
+
+    async def create_many(self, data, **kwargs):
+        await self._round_trip()
+        for row in data:
+            self._insert(row)
+        return len(data)
+
+    async def update(self, where, data):
+        await self._round_trip()
+        return self._update(where, data)
+
+    def _update(self, where, data):
+        todo = self.rows.get(where["id"])
+        if todo is None:
+            return None
+        values = {key: value for key, value in data.items() if key in ("title", "content") and value is not None}
+        values.update(updatedAt=datetime.now(timezone.utc), revision=(todo.revision or 0) + 1)
+        updated = todo.model_copy(update=values)
+        self.rows[todo.id] = updated
+        return updated
+
+    async def delete(self, where):
+        await self._round_trip()
+        return self._delete(where["id"])
+
+    def _delete(self, todo_id: str):
+        todo = self.rows.pop(todo_id, None)
+        if todo is not None:
+            self.ids.pop(bisect_left(self.ids, todo.id))
+        return todo
+
+    async def delete_many(self, where=None):
+        await self._round_trip()
+        ids = list(self._matching_ids(where))
+        for todo_id in ids:
+            self._delete(todo_id)
+        return len(ids)
+
+class FakeTombstoneActions:
+    def __init__(self):
+        self.rows: Dict[str, Dict[str, Any]] = {}
+
+    async def upsert(self, where, data):
+        self.rows.pop(where["id"], None)
+        self.rows[where["id"]] = data["create"]
+
+    async def create_many(self, data, **kwargs):
+        for row in data:
+            self.rows.pop(row["id"], None)
+            self.rows[row["id"]] = row
+        return len(data)
+
+    async def delete_many(self, where=None):
+        ids = [todo_id for todo_id in where["id"]["in"] if todo_id in self.rows]
+        for todo_id in ids:
+            del self.rows[todo_id]
+        return len(ids)
+
+class FakeCounterActions:
+    def __init__(self):
+        self.rows: Dict[str, FakeCounter] = {}
+
+    async def find_unique(self, where):
+        return self.rows.get(where["id"])
+
+    async def upsert(self, where, data):
+        counter = self.rows.get(where["id"])
+        if counter is None:
+            counter = self.rows[where["id"]] = FakeCounter(**data["create"])
+        else:
+            counter.value += data["update"]["value"]["increment"]
+        return counter
+
+class FakeBatch:
+    def __init__(self, client: "FakePrisma"):
+        self._client = client
+        self._queries = []
+        self.todo = self
+
+    def update(self, where, data):
+        self._queries.append((where, data))
+
+    async def commit(self):
+        # One round-trip for the whole batch, like a Prisma batch transaction.
+        await self._client.todo._round_trip()
+        for where, data in self._queries:
+            self._client.todo._update(where, data)
+        self._queries = []
+
+class FakePrisma:
+    def __init__(self, write_latency: float = 0):
+        self.todo = FakeTodoActions(write_latency)
+        self.todotombstone = FakeTombstoneActions()
+        self.todocollectionversion = FakeCounterActions()
+        self._connected = True
+
+    def is_connected(self):
+        return self._connected
+
+    async def connect(self):
+        self._connected = True
+
+    async def disconnect(self):
+        self._connected = False
+
+    def batch_(self):
+        return FakeBatch(self)
@@ -0,0 +1,211 @@
+"""In-process load test for the todo API.
+
+Drives the real ASGI app through httpx's ASGITransport (as tests/conftest.py does) with
+DatabaseRepository patched to an in-memory fake Prisma client (or, with --backend memory,
+the MemoryTodoRepository), and reports p50/p95/p99 latency and throughput for each endpoint
+at every concurrency / collection size. Fake Prisma writes wait --write-latency-ms, so the
+POST/PUT/DELETE scenarios overlap at higher concurrency the way they would against MongoDB.
+
+    PYTHONPATH=src python benchmarks/load_test.py --output bench.json
+    PYTHONPATH=src python benchmarks/load_test.py --baseline bench.json --max-regression 0.15
+
+With --baseline the run exits non-zero if any scenario's p95 latency or throughput is worse
+than the baseline by more than --max-regression.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+from contextlib import nullcontext
+from itertools import count
+from time import perf_counter
+from typing import Callable, Dict, List
+from unittest.mock import patch
+
+from httpx import ASGITransport, AsyncClient
+
+from fake_prisma import FakePrisma
+from DalmengSimpleTodo.cache.todo_cache import TodoCache
+from DalmengSimpleTodo.database.memory_todo_repository import MemoryTodoRepository
+from DalmengSimpleTodo.database.todo_repository import TodoRepositoryProvider
+from DalmengSimpleTodo.main import app
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+class PrismaBackend:
+    """The default Prisma repository, with the client patched to FakePrisma."""
+
+    def __init__(self, args):
+        self.prisma = FakePrisma(write_latency=args.write_latency_ms / 1000)
+
+    def ids(self) -> List[str]:
+        return self.prisma.todo.ids
+
+    async def top_up(self, size: int):
+        self.prisma.todo.top_up(size)
+
+    def activate(self):
+        TodoRepositoryProvider.set_repository(TodoRepositoryProvider.create_repository("prisma"))
+        return patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client", return_value=self.prisma)
+
+class MemoryBackend:
+    def __init__(self, args):
+        self.repository = MemoryTodoRepository()
+
+    def ids(self) -> List[str]:
+        return self.repository.index
+
+    async def top_up(self, size: int):
+        for _ in range(size - len(self.repository.rows)):
+            await self.repository.create({"title": next(titles), "content": "Seeded content for benchmarking"})
+
+    def activate(self):
+        TodoRepositoryProvider.set_repository(self.repository)
+        return nullcontext()
+
+BACKENDS = {"prisma": PrismaBackend, "memory": MemoryBackend}
+
+# Titles are unique, so every write gets a fresh one.
+titles = (f"Todo {i}" for i in count())
+
+def make_scenarios(backend) -> Dict[str, Callable]:
+    def next_id():
+        # Update/delete targets rotate through the live ids so every request hits a real record.
+        ids = backend.ids()
+        next_id.position = (getattr(next_id, "position", -1) + 1) % len(ids)
+        return ids[next_id.position]
+
+    async def conditional_get(client):
+        # An idle poller: after the first response every request revalidates to a 304.
+        response = await client.get("/api/v1/todo", headers={"If-None-Match": conditional_get.etag})
+        conditional_get.etag = response.headers.get("etag", "")
+        return response
+    conditional_get.etag = ""
+
+    return {
+        "GET /api/v1/todo": lambda client: client.get("/api/v1/todo"),
+        "GET /api/v1/todo If-None-Match": conditional_get,
+        "GET /api/v1/todo?after": lambda client: client.get(f"/api/v1/todo?limit=20&after={_cursor(next_id())}"),
+        "POST /api/v1/todo": lambda client: client.post("/api/v1/todo", json={"title": next(titles), "content": "Test"}),
+        "PUT /api/v1/todo/{id}": lambda client: client.put(f"/api/v1/todo/{next_id()}", json={"title": next(titles)}),
+        "DELETE /api/v1/todo/{id}": lambda client: client.delete(f"/api/v1/todo/{next_id()}"),
+    }
+
+def _cursor(todo_id: str) -> str:
+    from DalmengSimpleTodo.service.todo_service import TodoService
+    return TodoService._encode_cursor(todo_id)
+
+async def run_scenario(client: AsyncClient, request: Callable, total: int, concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            start = perf_counter()
+            response = await request(client)
+            latencies.append(perf_counter() - start)
+            if response.status_code >= 500:
+                errors += 1
+
+    start = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "errors": errors,
+        "rps": total / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+async def run(args) -> Dict[str, Dict[str, float]]:
+    TodoCache.enabled = not args.no_cache
+    results = {}
+    for size in args.collection_sizes:
+        for concurrency in args.concurrency:
+            backend = BACKENDS[args.backend](args)
+            TodoCache.clear()
+            with backend.activate():
+                async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+                    for name, request in make_scenarios(backend).items():
+                        if args.endpoints and name not in args.endpoints:
+                            continue
+                        # Keep the collection at its nominal size; POST grows it and DELETE shrinks it.
+                        await backend.top_up(size)
+                        await run_scenario(client, request, min(args.warmup, size), concurrency)
+                        await backend.top_up(size)
+                        key = f"{name} | size={size} | concurrency={concurrency}"
+                        results[key] = await run_scenario(client, request, min(args.requests, size), concurrency)
+                        print(f"{key:<70} {_format(results[key])}")
+    return results
+
+def _format(result: Dict[str, float]) -> str:
+    return (
+        f"{result['rps']:>9.0f} req/s  p50 {result['p50_ms']:7.2f}ms  "
+        f"p95 {result['p95_ms']:7.2f}ms  p99 {result['p99_ms']:7.2f}ms  errors {result['errors']}"
+    )
+
+def compare(results: Dict, baseline: Dict, max_regression: float) -> List[str]:
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        if result["p95_ms"] > previous["p95_ms"] * (1 + max_regression):
+            regressions.append(f"{key}: p95 {previous['p95_ms']:.2f}ms -> {result['p95_ms']:.2f}ms")
+        if result["rps"] < previous["rps"] * (1 - max_regression):
+            regressions.append(f"{key}: throughput {previous['rps']:.0f} -> {result['rps']:.0f} req/s")
+    return regressions
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--collection-sizes", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--requests", type=int, default=2_000, help="requests per scenario")
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--endpoints", nargs="*", help="only run these scenario names")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="prisma")
+    parser.add_argument("--no-cache", action="store_true", help="disable TodoCache")
+    parser.add_argument("--write-latency-ms", type=float, default=1.0,
+                        help="simulated round-trip of each fake Prisma write (prisma backend only)")
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", help="JSON results from a previous run to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.10)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "revision": git_revision(),
+                "python": platform.python_version(),
+                "args": vars(args),
+                "results": results,
+            }, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f)["results"], args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.models.base_model import BaseResponseModel
+
+class BodySizeLimitMiddleware:
+    """Rejects request bodies over `max_bytes` with a 413 before anything parses them: at once
+    when Content-Length says so, otherwise as soon as the streamed body crosses the limit."""
+
+    def __init__(self, app, max_bytes: int = AppConfig.REQUEST_BODY_MAX_BYTES):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_bytes:
+                    await self._reject(scope, receive, send)
+                    return
+                break
+
+        received = 0
+        started = False
+        rejected = False
+
+        async def receive_wrapper():
+            # Past the limit the 413 is sent from here, not raised: the app's body parsing would
+            # catch an exception and answer 400 itself. The app is told the client went away,
+            # and whatever it sends afterwards is dropped.
+            nonlocal received, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    rejected = True
+                    if not started:
+                        await self._reject(scope, receive, send)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def send_wrapper(message):
+            nonlocal started
+            if rejected:
+                return
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        except Exception:
+            if not rejected:
+                raise
+
+    async def _reject(self, scope, receive, send):
+        response = BaseResponseModel.failed(status_code=413, msg="Request body too large.")
+        await response(scope, receive, send)
@@ -0,0 +1,82 @@
+import asyncio
+import functools
+from collections import deque
+from typing import Deque, Dict
+
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.exceptions.admission_exception import ServiceOverloadedException
+
+class ConcurrencyLimiter:
+    """Caps concurrent calls at `max_concurrency`. Up to `max_queue` callers wait, each for at
+    most `queue_timeout` seconds; anyone beyond that is rejected at once with
+    ServiceOverloadedException, so an overload turns into fast 503s instead of a growing
+    database queue. `max_concurrency` 0 disables the limit.
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int, queue_timeout: float, retry_after: int = 1):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.waiting = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.rejected = 0
+
+    async def acquire(self):
+        if self.in_flight < self.max_concurrency and not self.waiting:
+            self.in_flight += 1
+            return
+        if self.waiting >= self.max_queue:
+            self._reject("queue is full")
+
+        future = asyncio.get_running_loop().create_future()
+        self.waiters.append(future)
+        self.waiting += 1
+        try:
+            # release() hands its slot straight to the future, so in_flight is already counted.
+            await asyncio.wait_for(future, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._reject(f"no slot within {self.queue_timeout}s")
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        finally:
+            self.waiting -= 1
+
+    def release(self):
+        while self.waiters:
+            future = self.waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def limit(self, func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if self.max_concurrency <= 0:
+                return await func(*args, **kwargs)
+            await self.acquire()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                self.release()
+        return wrapper
+
+    def stats(self) -> Dict[str, int]:
+        return {"in_flight": self.in_flight, "waiting": self.waiting, "rejected": self.rejected}
+
+    def _reject(self, reason: str):
+        self.rejected += 1
+        error = ServiceOverloadedException(f"Service overloaded: {reason}")
+        error.retry_after = self.retry_after
+        raise error
+
+database_limiter = ConcurrencyLimiter(
+    max_concurrency=AppConfig.ADMISSION_MAX_CONCURRENCY,
+    max_queue=AppConfig.ADMISSION_MAX_QUEUE,
+    queue_timeout=AppConfig.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    retry_after=AppConfig.ADMISSION_RETRY_AFTER_SECONDS,
+)
@@ -0,0 +1,102 @@
+import math
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from DalmengSimpleTodo.admission.token_bucket import TokenBucketLimiter
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.models.base_model import BaseResponseModel
+
+class RateLimitRule(NamedTuple):
+    method: str
+    segments: Tuple[str, ...]
+    rate: float
+    burst: float
+
+    @staticmethod
+    def parse(rules: str) -> List["RateLimitRule"]:
+        """Parse `METHOD /path=rate/burst` rules separated by `;`, e.g.
+        `POST /api/v1/todo=10/20; * /api/v1/todo/{id}=50/100`. `*` matches any method and
+        a `{...}` segment any single path segment; the first matching rule wins."""
+        parsed = []
+        for rule in filter(None, (rule.strip() for rule in rules.split(";"))):
+            route, limit = rule.rsplit("=", 1)
+            method, path = route.split()
+            rate, burst = limit.split("/")
+            if float(rate) <= 0 or float(burst) < 1:
+                raise ValueError(f"Rate limit rule {rule} needs a rate above 0 and a burst of at least 1")
+            parsed.append(RateLimitRule(method.upper(), _segments(path), float(rate), float(burst)))
+        return parsed
+
+    def matches(self, method: str, segments: Tuple[str, ...]) -> bool:
+        if self.method != "*" and self.method != method:
+            return False
+        if len(self.segments) != len(segments):
+            return False
+        return all(rule == "*" or rule == segment for rule, segment in zip(self.segments, segments))
+
+def _segments(path: str) -> Tuple[str, ...]:
+    return tuple("*" if segment.startswith("{") else segment for segment in path.strip("/").split("/"))
+
+class RateLimitMiddleware:
+    """Per-client token-bucket rate limits, answered with a 429 envelope and Retry-After
+    before the request reaches routing. Each rule keeps its own buckets, so a client's
+    writes and reads are limited independently.
+
+    Clients are told apart by their address. `client_header` (an X-Forwarded-For style list)
+    is only read when `trusted_proxies` proxies append to it: the entry the outermost trusted
+    proxy appended is the client, and anything left of it is whatever the client sent."""
+
+    def __init__(
+        self,
+        app,
+        rules: Optional[List[RateLimitRule]] = None,
+        default_rate: float = AppConfig.RATE_LIMIT_PER_SECOND,
+        default_burst: float = AppConfig.RATE_LIMIT_BURST,
+        client_header: str = AppConfig.RATE_LIMIT_CLIENT_HEADER,
+        trusted_proxies: int = AppConfig.RATE_LIMIT_TRUSTED_PROXIES,
+        max_clients: int = AppConfig.RATE_LIMIT_MAX_CLIENTS,
+        excluded_paths: Iterable[str] = ("/health/live", "/health/ready", "/metrics"),
+    ):
+        self.app = app
+        self.rules = RateLimitRule.parse(AppConfig.RATE_LIMIT_ROUTES) if rules is None else rules
+        self.default = RateLimitRule("*", (), default_rate, default_burst) if default_rate > 0 else None
+        self.client_header = client_header.lower().encode() if trusted_proxies > 0 else b""
+        self.trusted_proxies = trusted_proxies
+        self.limiter = TokenBucketLimiter(max_keys=max_clients)
+        self.excluded_paths = frozenset(excluded_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        rule_index, rule = self._rule(scope["method"], _segments(scope["path"]))
+        if rule is not None:
+            retry_after = self.limiter.acquire((rule_index, self._client(scope)), rule.rate, rule.burst)
+            if retry_after:
+                seconds = max(1, math.ceil(retry_after))
+                response = BaseResponseModel.failed(
+                    status_code=429,
+                    msg="Too many requests.",
+                    headers={"Retry-After": str(seconds)},
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+    def _rule(self, method: str, segments: Tuple[str, ...]) -> Tuple[int, Optional[RateLimitRule]]:
+        for index, rule in enumerate(self.rules):
+            if rule.matches(method, segments):
+                return index, rule
+        return -1, self.default
+
+    def _client(self, scope) -> str:
+        if self.client_header:
+            hops = [
+                hop.strip()
+                for name, value in scope["headers"] if name == self.client_header
+                for hop in value.decode("latin-1").split(",")
+            ]
+            if len(hops) >= self.trusted_proxies:
+                return hops[-self.trusted_proxies]
+        client = scope.get("client")
+        return client[0] if client else "unknown"
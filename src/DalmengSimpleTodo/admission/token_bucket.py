@@ -0,0 +1,35 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, List
+
+class TokenBucketLimiter:
+    """Token buckets keyed by client, kept in LRU order so idle clients are dropped first
+    once `max_keys` is reached. A dropped client simply starts again with a full bucket."""
+
+    def __init__(self, max_keys: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self.buckets: "OrderedDict[Hashable, List[float]]" = OrderedDict()
+
+    def acquire(self, key: Hashable, rate: float, burst: float) -> float:
+        """Take one token. Returns 0 when allowed, otherwise the seconds until a token is available."""
+        now = self.clock()
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            if rate <= 0:
+                raise ValueError(f"Token bucket rate must be above 0, got {rate}")
+            if len(self.buckets) >= self.max_keys:
+                self.buckets.popitem(last=False)
+            bucket = self.buckets[key] = [burst, now]
+        else:
+            self.buckets.move_to_end(key)
+            bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return 0.0
+        return (1 - bucket[0]) / rate
+
+    def clear(self):
+        self.buckets.clear()
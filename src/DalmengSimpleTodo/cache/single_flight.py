@@ -0,0 +1,31 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class SingleFlight:
+    """Concurrent calls with the same key share one run of `load`. The run is its own task,
+    so a caller that gives up (client disconnect) does not cancel it for the others."""
+
+    def __init__(self):
+        self.flights: Dict[Hashable, asyncio.Future] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    async def do(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self.flights.get(key)
+        if flight is None:
+            self.leaders += 1
+            flight = self.flights[key] = asyncio.ensure_future(load())
+            flight.add_done_callback(lambda done: self._land(key, done))
+        else:
+            self.followers += 1
+        return await asyncio.shield(flight)
+
+    def _land(self, key: Hashable, flight: asyncio.Future):
+        if self.flights.get(key) is flight:
+            del self.flights[key]
+        if not flight.cancelled():
+            # Mark the exception retrieved even if every caller was cancelled meanwhile.
+            flight.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {"leaders": self.leaders, "followers": self.followers, "in_flight": len(self.flights)}
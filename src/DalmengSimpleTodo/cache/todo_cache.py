@@ -0,0 +1,48 @@
+from typing import Any, Dict, Optional
+
+from DalmengSimpleTodo.cache.cache_backend import CacheBackend, LRUTTLCache
+from DalmengSimpleTodo.config.app_config import AppConfig
+
+class TodoCache:
+    """Read-through cache under TodoService.
+
+    Every key carries the collection version read from the database before the entry was
+    loaded. A write from any worker changes that version, so readers everywhere move on to
+    new keys: writes never touch the cache, and superseded entries age out through LRU/TTL.
+    """
+
+    enabled = AppConfig.TODO_CACHE_ENABLED
+    backend: CacheBackend = LRUTTLCache(
+        max_entries=AppConfig.TODO_CACHE_MAX_ENTRIES, ttl=AppConfig.TODO_CACHE_TTL_SECONDS
+    )
+
+    @staticmethod
+    def set_backend(backend: CacheBackend):
+        TodoCache.backend = backend
+
+    @staticmethod
+    def list_key(version: str, *params: Any) -> str:
+        return f"todos:{version}:list:{params!r}"
+
+    @staticmethod
+    def todo_key(version: str, todo_id: str) -> str:
+        return f"todos:{version}:id:{todo_id}"
+
+    @staticmethod
+    def get(key: str) -> Optional[Any]:
+        if not TodoCache.enabled:
+            return None
+        return TodoCache.backend.get(key)
+
+    @staticmethod
+    def set(key: str, value: Any):
+        if TodoCache.enabled:
+            TodoCache.backend.set(key, value)
+
+    @staticmethod
+    def clear():
+        TodoCache.backend.clear()
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        return TodoCache.backend.stats()
@@ -0,0 +1,57 @@
+import gzip
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Optional
+
+from DalmengSimpleTodo.config.app_config import AppConfig
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:  # pragma: no cover
+        zstd = None
+
+def _gzip(data: bytes) -> bytes:
+    # mtime=0 keeps the output identical for identical input.
+    return gzip.compress(data, compresslevel=AppConfig.RESPONSE_COMPRESSION_GZIP_LEVEL, mtime=0)
+
+def _brotli(data: bytes) -> bytes:
+    return brotli.compress(data, quality=AppConfig.RESPONSE_COMPRESSION_BROTLI_QUALITY)
+
+def _zstd(data: bytes) -> bytes:
+    if hasattr(zstd, "ZstdCompressor"):
+        return zstd.ZstdCompressor(level=AppConfig.RESPONSE_COMPRESSION_ZSTD_LEVEL).compress(data)
+    return zstd.compress(data, level=AppConfig.RESPONSE_COMPRESSION_ZSTD_LEVEL)
+
+CODECS: Dict[str, Callable[[bytes], bytes]] = {"gzip": _gzip}
+if brotli is not None:
+    CODECS["br"] = _brotli
+if zstd is not None:
+    CODECS["zstd"] = _zstd
+
+@lru_cache(maxsize=256)
+def negotiate(accept_encoding: str, preferred: Iterable[str]) -> Optional[str]:
+    """The first of `preferred` that is available and accepted with q > 0, else None.
+    Browsers send a handful of distinct headers, so the parse is cached."""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    for encoding in preferred:
+        if encoding in CODECS and accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
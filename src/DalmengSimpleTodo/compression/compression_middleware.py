@@ -0,0 +1,98 @@
+from typing import Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from DalmengSimpleTodo.cache.cache_backend import LRUTTLCache
+from DalmengSimpleTodo.compression.codecs import CODECS, negotiate
+from DalmengSimpleTodo.config.app_config import AppConfig
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+STREAMING_TYPES = ("text/event-stream",)
+
+class CompressionMiddleware:
+    """Compresses complete response bodies of at least `minimum_size` bytes with the best
+    encoding the client accepts. Streamed responses (export, event streams) have no
+    Content-Length and pass through untouched, their headers sent at once. Bodies carrying an
+    ETag are fully determined by it, so their compressed form is cached per ETag and encoding
+    and repeated reads skip the compressor."""
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = AppConfig.RESPONSE_COMPRESSION_MIN_SIZE,
+        encodings: Iterable[str] = tuple(AppConfig.RESPONSE_COMPRESSION_ENCODINGS.split(",")),
+        cache: Optional[LRUTTLCache] = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = tuple(encoding.strip() for encoding in encodings)
+        self.cache = cache or LRUTTLCache(
+            max_entries=AppConfig.RESPONSE_COMPRESSION_CACHE_ENTRIES,
+            ttl=AppConfig.RESPONSE_COMPRESSION_CACHE_TTL_SECONDS,
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+
+        async def send_wrapper(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                # Only a complete body large enough to compress is worth holding the headers for.
+                if self._compressible(Headers(raw=message["headers"])):
+                    start = message
+                    return
+                await send(message)
+                return
+            if start is None:
+                await send(message)
+                return
+            held, start = start, None
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=held["headers"])
+            if message.get("more_body"):
+                await send(held)
+                await send(message)
+                return
+
+            compressed = self._compress(headers.get("etag"), encoding, body)
+            headers.add_vary_header("Accept-Encoding")
+            if len(compressed) < len(body):
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(compressed))
+                if "etag" in headers and not headers["etag"].startswith("W/"):
+                    # Another encoding means other bytes, so the tag can only be weak (RFC 9110 8.8.1).
+                    headers["ETag"] = "W/" + headers["etag"]
+                body = compressed
+            await send(held)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _compressible(self, headers: Headers) -> bool:
+        content_length = headers.get("content-length", "")
+        content_type = headers.get("content-type", "")
+        return (
+            content_length.isdigit()
+            and int(content_length) >= self.minimum_size
+            and "content-encoding" not in headers
+            and content_type.startswith(COMPRESSIBLE_TYPES)
+            and not content_type.startswith(STREAMING_TYPES)
+        )
+
+    def _compress(self, etag: Optional[str], encoding: str, body: bytes) -> bytes:
+        if etag is None:
+            return CODECS[encoding](body)
+        key = f"{encoding}:{etag}"
+        compressed = self.cache.get(key)
+        if compressed is None:
+            compressed = CODECS[encoding](body)
+            self.cache.set(key, compressed)
+        return compressed
@@ -0,0 +1,66 @@
+import os
+
+class AppConfig:
+    TODO_PAGE_SIZE_DEFAULT = int(os.getenv("TODO_PAGE_SIZE_DEFAULT", "50"))
+    TODO_PAGE_SIZE_MAX = int(os.getenv("TODO_PAGE_SIZE_MAX", "500"))
+    TODO_EXPORT_BATCH_SIZE = int(os.getenv("TODO_EXPORT_BATCH_SIZE", "1000"))
+    RESPONSE_JSON_ENCODER = os.getenv("RESPONSE_JSON_ENCODER", "stdlib")
+    RESPONSE_COMPRESSION_ENABLED = os.getenv("RESPONSE_COMPRESSION_ENABLED", "true").lower() == "true"
+    RESPONSE_COMPRESSION_MIN_SIZE = int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "1024"))
+    RESPONSE_COMPRESSION_ENCODINGS = os.getenv("RESPONSE_COMPRESSION_ENCODINGS", "zstd,br,gzip")
+    RESPONSE_COMPRESSION_GZIP_LEVEL = int(os.getenv("RESPONSE_COMPRESSION_GZIP_LEVEL", "6"))
+    RESPONSE_COMPRESSION_BROTLI_QUALITY = int(os.getenv("RESPONSE_COMPRESSION_BROTLI_QUALITY", "4"))
+    RESPONSE_COMPRESSION_ZSTD_LEVEL = int(os.getenv("RESPONSE_COMPRESSION_ZSTD_LEVEL", "3"))
+    RESPONSE_COMPRESSION_CACHE_ENTRIES = int(os.getenv("RESPONSE_COMPRESSION_CACHE_ENTRIES", "256"))
+    RESPONSE_COMPRESSION_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_COMPRESSION_CACHE_TTL_SECONDS", "300"))
+    # off, thread or process
+    RESPONSE_ENCODE_OFFLOAD = os.getenv("RESPONSE_ENCODE_OFFLOAD", "off")
+    RESPONSE_ENCODE_OFFLOAD_MIN_ITEMS = int(os.getenv("RESPONSE_ENCODE_OFFLOAD_MIN_ITEMS", "200"))
+    RESPONSE_ENCODE_OFFLOAD_WORKERS = int(os.getenv("RESPONSE_ENCODE_OFFLOAD_WORKERS", "2"))
+    RESPONSE_ENCODE_OFFLOAD_MAX_QUEUE = int(os.getenv("RESPONSE_ENCODE_OFFLOAD_MAX_QUEUE", "32"))
+    RESPONSE_ENCODE_OFFLOAD_QUEUE_TIMEOUT_SECONDS = float(os.getenv("RESPONSE_ENCODE_OFFLOAD_QUEUE_TIMEOUT_SECONDS", "5"))
+    TODO_CACHE_ENABLED = os.getenv("TODO_CACHE_ENABLED", "true").lower() == "true"
+    TODO_CACHE_MAX_ENTRIES = int(os.getenv("TODO_CACHE_MAX_ENTRIES", "10000"))
+    TODO_CACHE_TTL_SECONDS = float(os.getenv("TODO_CACHE_TTL_SECONDS", "30"))
+    TODO_READ_COALESCING_ENABLED = os.getenv("TODO_READ_COALESCING_ENABLED", "true").lower() == "true"
+    TODO_BULK_MAX_ITEMS = int(os.getenv("TODO_BULK_MAX_ITEMS", "500"))
+    TODO_CREATE_BATCHING_ENABLED = os.getenv("TODO_CREATE_BATCHING_ENABLED", "false").lower() == "true"
+    TODO_CREATE_BATCH_MAX_SIZE = int(os.getenv("TODO_CREATE_BATCH_MAX_SIZE", "100"))
+    TODO_CREATE_BATCH_MAX_DELAY_SECONDS = float(os.getenv("TODO_CREATE_BATCH_MAX_DELAY_SECONDS", "0.002"))
+    DATABASE_URL_ENV = os.getenv("DATABASE_URL_ENV", "TEST_APP_DATABASE_URL")
+    DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "0"))
+    DATABASE_CONNECT_TIMEOUT_SECONDS = float(os.getenv("DATABASE_CONNECT_TIMEOUT_SECONDS", "10"))
+    DATABASE_QUERY_TIMEOUT_SECONDS = float(os.getenv("DATABASE_QUERY_TIMEOUT_SECONDS", "30"))
+    DATABASE_CONNECT_RETRIES = int(os.getenv("DATABASE_CONNECT_RETRIES", "5"))
+    DATABASE_CONNECT_BACKOFF_SECONDS = float(os.getenv("DATABASE_CONNECT_BACKOFF_SECONDS", "0.5"))
+    DATABASE_CONNECT_IN_BACKGROUND = os.getenv("DATABASE_CONNECT_IN_BACKGROUND", "false").lower() == "true"
+    DATABASE_STARTUP_WAIT_SECONDS = float(os.getenv("DATABASE_STARTUP_WAIT_SECONDS", "10"))
+    DATABASE_HEALTH_CHECK_INTERVAL_SECONDS = float(os.getenv("DATABASE_HEALTH_CHECK_INTERVAL_SECONDS", "15"))
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    TODO_REPOSITORY_BACKEND = os.getenv("TODO_REPOSITORY_BACKEND", "prisma")
+    TODO_MEMORY_PERSIST_PATH = os.getenv("TODO_MEMORY_PERSIST_PATH") or None
+    TODO_SEARCH_MAX_CANDIDATES = int(os.getenv("TODO_SEARCH_MAX_CANDIDATES", "1000"))
+    TODO_SEARCH_PREFIX_MIN_LENGTH = int(os.getenv("TODO_SEARCH_PREFIX_MIN_LENGTH", "2"))
+    TODO_SEARCH_PREFIX_MAX_LENGTH = int(os.getenv("TODO_SEARCH_PREFIX_MAX_LENGTH", "10"))
+    TODO_FILTER_MAX_LENGTH = int(os.getenv("TODO_FILTER_MAX_LENGTH", "200"))
+    TODO_UNINDEXED_SCAN_MAX_TODOS = int(os.getenv("TODO_UNINDEXED_SCAN_MAX_TODOS", "10000"))
+    TODO_CHANGES_SETTLE_SECONDS = float(os.getenv("TODO_CHANGES_SETTLE_SECONDS", "1"))
+    TODO_TOMBSTONE_RETENTION_SECONDS = float(os.getenv("TODO_TOMBSTONE_RETENTION_SECONDS", str(30 * 24 * 3600)))
+    TODO_TOMBSTONE_PURGE_INTERVAL_SECONDS = float(os.getenv("TODO_TOMBSTONE_PURGE_INTERVAL_SECONDS", "3600"))
+    TODO_EVENTS_ENABLED = os.getenv("TODO_EVENTS_ENABLED", "true").lower() == "true"
+    TODO_EVENTS_MAX_PENDING = int(os.getenv("TODO_EVENTS_MAX_PENDING", "1000"))
+    TODO_EVENTS_KEEPALIVE_SECONDS = float(os.getenv("TODO_EVENTS_KEEPALIVE_SECONDS", "15"))
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "false").lower() == "true"
+    RATE_LIMIT_PER_SECOND = float(os.getenv("RATE_LIMIT_PER_SECOND", "50"))
+    RATE_LIMIT_BURST = float(os.getenv("RATE_LIMIT_BURST", "100"))
+    RATE_LIMIT_ROUTES = os.getenv("RATE_LIMIT_ROUTES", "")
+    RATE_LIMIT_CLIENT_HEADER = os.getenv("RATE_LIMIT_CLIENT_HEADER", "")
+    # Proxies in front of the app that append to RATE_LIMIT_CLIENT_HEADER; 0 ignores the header.
+    RATE_LIMIT_TRUSTED_PROXIES = int(os.getenv("RATE_LIMIT_TRUSTED_PROXIES", "0"))
+    RATE_LIMIT_MAX_CLIENTS = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "10000"))
+    ADMISSION_MAX_CONCURRENCY = int(os.getenv("ADMISSION_MAX_CONCURRENCY", "0"))
+    ADMISSION_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", "256"))
+    ADMISSION_QUEUE_TIMEOUT_SECONDS = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_SECONDS", "1"))
+    ADMISSION_RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "1"))
+    REQUEST_BODY_MAX_BYTES = int(os.getenv("REQUEST_BODY_MAX_BYTES", str(1024 * 1024)))
+    VALIDATION_MAX_ERRORS = int(os.getenv("VALIDATION_MAX_ERRORS", "10"))
@@ -1,12 +1,98 @@
+import asyncio
+import logging
+import os
+from datetime import timedelta
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
 from prisma import Prisma
 
+from DalmengSimpleTodo.config.app_config import AppConfig
+
+logger = logging.getLogger(__name__)
+
 class DatabaseRepository:
-    client = Prisma()
+    client: Optional[Prisma] = None
+    # The Prisma query engine is a child process and its connection can't be shared
+    # across fork(), so each worker process builds its own client on first use.
+    client_pid: Optional[int] = None
+
+    @staticmethod
+    def build_datasource_url() -> Optional[str]:
+        url = os.getenv(AppConfig.DATABASE_URL_ENV)
+        if not url or not AppConfig.DATABASE_POOL_SIZE:
+            return url
+
+        parts = urlsplit(url)
+        query = dict(parse_qsl(parts.query))
+        query["maxPoolSize"] = str(AppConfig.DATABASE_POOL_SIZE)
+        return urlunsplit(parts._replace(query=urlencode(query)))
 
     @staticmethod
-    async def connect():
-        await DatabaseRepository.client.connect() # pragma: no cover
+    def create_client() -> Prisma:
+        url = DatabaseRepository.build_datasource_url()
+        return Prisma(
+            datasource={"url": url} if url else None,
+            connect_timeout=timedelta(seconds=AppConfig.DATABASE_CONNECT_TIMEOUT_SECONDS),
+            http={"timeout": AppConfig.DATABASE_QUERY_TIMEOUT_SECONDS},
+        )
 
     @staticmethod
     def get_client():
+        if DatabaseRepository.client is None or DatabaseRepository.client_pid != os.getpid():
+            DatabaseRepository.client = DatabaseRepository.create_client()
+            DatabaseRepository.client_pid = os.getpid()
         return DatabaseRepository.client
+
+    @staticmethod
+    async def connect(retries: int = AppConfig.DATABASE_CONNECT_RETRIES):
+        client = DatabaseRepository.get_client()
+        for attempt in range(retries + 1):
+            try:
+                if not client.is_connected():
+                    await client.connect()
+                return
+            except Exception as e:
+                if attempt == retries:
+                    raise
+                delay = AppConfig.DATABASE_CONNECT_BACKOFF_SECONDS * 2 ** attempt
+                logger.warning("Database connect failed (%s), retrying in %.2fs", e, delay)
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    async def disconnect():
+        client = DatabaseRepository.client
+        if client is not None and DatabaseRepository.client_pid == os.getpid() and client.is_connected():
+            await client.disconnect()
+
+    @staticmethod
+    async def is_ready() -> bool:
+        try:
+            client = DatabaseRepository.get_client()
+            if not client.is_connected():
+                return False
+            await client.todo.find_first()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    async def reconnect():
+        try:
+            await DatabaseRepository.disconnect()
+        except Exception as e:
+            logger.warning("Database disconnect failed (%s), replacing client", e)
+            DatabaseRepository.client = None
+        await DatabaseRepository.connect()
+
+    @staticmethod
+    async def watch(interval: float = AppConfig.DATABASE_HEALTH_CHECK_INTERVAL_SECONDS):
+        while True:
+            await asyncio.sleep(interval)
+            if await DatabaseRepository.is_ready():
+                continue
+            logger.warning("Database health check failed, reconnecting")
+            try:
+                await DatabaseRepository.reconnect()
+            except Exception as e:
+                logger.error("Database reconnect failed: %s", e)
@@ -0,0 +1,59 @@
+import asyncio
+import logging
+from typing import Optional
+
+from DalmengSimpleTodo.database.todo_repository import TodoRepositoryProvider
+
+logger = logging.getLogger(__name__)
+
+class DatabaseStartup:
+    """Connects the todo repository in the background so the app can start serving while
+    the Prisma client is imported and the query engine comes up. StartupGateMiddleware
+    holds requests that need the database until `wait()` says it is connected."""
+
+    task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def start():
+        DatabaseStartup.task = asyncio.ensure_future(DatabaseStartup._connect())
+
+    @staticmethod
+    def connected() -> bool:
+        task = DatabaseStartup.task
+        return task is None or (task.done() and not task.cancelled() and task.exception() is None)
+
+    @staticmethod
+    async def wait(timeout: float) -> bool:
+        task = DatabaseStartup.task
+        if task is None:
+            return True
+        if task.done() and not DatabaseStartup.connected():
+            # The last attempt gave up (after its own retries); the next request tries again.
+            DatabaseStartup.start()
+            task = DatabaseStartup.task
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout)
+        except Exception:
+            return False
+        return True
+
+    @staticmethod
+    async def stop():
+        task, DatabaseStartup.task = DatabaseStartup.task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    @staticmethod
+    async def _connect():
+        # Importing the generated Prisma client is most of a cold start; a worker thread
+        # keeps the event loop free to answer health checks meanwhile.
+        repository = await asyncio.get_running_loop().run_in_executor(None, TodoRepositoryProvider.get_repository)
+        try:
+            await repository.connect()
+        except Exception as e:
+            logger.error("Background database connect failed: %s", e)
+            raise
@@ -0,0 +1,351 @@
+import json
+import os
+import time
+from datetime import datetime, timezone
+from bisect import bisect_left, bisect_right, insort
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.database.search_index import InvertedIndex
+from DalmengSimpleTodo.database.todo_repository import TodoChange, TodoFilter, TodoRepository
+from DalmengSimpleTodo.exceptions.todo_exception import TodoAlreadyExistsException, TodoNotFoundException
+from DalmengSimpleTodo.utils.object_id import new_object_id
+
+TODO_RECORD_FIELDS = ("id", "title", "content", "updatedAt", "revision")
+
+class TodoRecord:
+    """Mirrors the Prisma Todo model; updatedAt is kept as the ISO 8601 string it encodes to."""
+
+    __slots__ = TODO_RECORD_FIELDS
+
+    def __init__(self, id: str, title: str, content: str, updatedAt: Optional[str] = None, revision: int = 0):
+        self.id = id
+        self.title = title
+        self.content = content
+        self.updatedAt = updatedAt
+        self.revision = revision
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "content": self.content,
+            "updatedAt": self.updatedAt,
+            "revision": self.revision,
+        }
+
+    def __eq__(self, other):
+        return isinstance(other, TodoRecord) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"TodoRecord({', '.join(f'{field}={getattr(self, field)!r}' for field in TODO_RECORD_FIELDS)})"
+
+class MemoryTodoRepository(TodoRepository):
+    """Todos kept in a dict keyed by ObjectId, with an optional append-only log for persistence.
+
+    Ordered reads go through a sorted id index. Deletes only tombstone the index entry; the
+    index is compacted once tombstones make up half of it, so deletes stay O(1) amortized.
+    Search goes through an inverted index updated on every write, and a title -> id map
+    plays the part of the unique index on title. `version` counts writes; together with a
+    per-instance epoch it is the collection version behind list ETags.
+
+    The changes feed reads a sorted list of (updatedAt millis, id) keys. A write appends the
+    todo's new key and leaves the old one behind, skipped on read via `change_keys` and
+    dropped when the list is compacted, along with tombstones past their retention.
+    """
+
+    COMPACT_MIN_TOMBSTONES = 1024
+    clock: Tuple[int, str] = (0, "")
+
+    def __init__(self, persist_path: Optional[str] = None):
+        self.rows: Dict[str, TodoRecord] = {}
+        self.index: List[str] = []
+        self.tombstones: Set[str] = set()
+        self.titles: Dict[str, str] = {}
+        self.epoch = new_object_id()
+        self.version = 0
+        self.changes_index: List[Tuple[int, str]] = []
+        self.change_keys: Dict[str, Tuple[int, str]] = {}
+        self.deleted: Dict[str, int] = {}
+        self.search_index = InvertedIndex(max_candidates=AppConfig.TODO_SEARCH_MAX_CANDIDATES)
+        self.persist_path = persist_path
+        self.log = None
+        if persist_path:
+            self._replay(persist_path)
+            self.log = open(persist_path, "a", encoding="utf-8")
+
+    async def disconnect(self):
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+
+    async def find_page(
+        self,
+        take: int,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        filters: Optional[TodoFilter] = None,
+        sort: str = "id",
+        descending: bool = False,
+    ) -> List[Any]:
+        reverse = descending != bool(before)
+        cursor = before or after
+        matches = self._matcher(filters)
+
+        if sort != "id" or (filters is not None and filters.title is not None):
+            # No ordered title index here, so title order means sorting the matching todos.
+            key = attrgetter(sort)
+            todos = sorted(
+                (todo for todo in self._candidates(filters) if matches is None or matches(todo)),
+                key=key,
+                reverse=reverse,
+            )
+            if cursor:
+                todos = [todo for todo in todos if (key(todo) < cursor if reverse else key(todo) > cursor)]
+            return todos[:take]
+
+        index, rows = self.index, self.rows
+        todos = []
+        if reverse:
+            position, step, end = (bisect_left(index, cursor) if cursor else len(index)) - 1, -1, -1
+        else:
+            position, step, end = (bisect_right(index, cursor) if cursor else 0), 1, len(index)
+        while position != end and len(todos) < take:
+            todo = rows.get(index[position])
+            if todo is not None and (matches is None or matches(todo)):
+                todos.append(todo)
+            position += step
+        return todos
+
+    async def count(self, filters: Optional[TodoFilter] = None) -> int:
+        matches = self._matcher(filters)
+        if matches is None:
+            return len(self.rows)
+        return sum(1 for todo in self._candidates(filters) if matches(todo))
+
+    async def find_by_id(self, todo_id: str) -> Optional[Any]:
+        return self.rows.get(todo_id)
+
+    async def find_by_ids(self, todo_ids: List[str]) -> List[Any]:
+        return [self.rows[todo_id] for todo_id in dict.fromkeys(todo_ids) if todo_id in self.rows]
+
+    async def create(self, data: Dict[str, Any]) -> Any:
+        self._check_titles([(data.get("id"), data["title"])])
+        at, timestamp = self._now()
+        return self._put(self._new_record(data, timestamp), at=at)
+
+    async def create_many(self, rows: List[Dict[str, Any]]) -> int:
+        self._check_titles([(row.get("id"), row["title"]) for row in rows])
+        at, timestamp = self._now()
+        for row in rows:
+            self._put(self._new_record(row, timestamp), at=at)
+        return len(rows)
+
+    async def update(self, todo_id: str, data: Dict[str, Any]) -> Optional[Any]:
+        todo = self.rows.get(todo_id)
+        if todo is None:
+            return None
+        if data.get("title") is not None:
+            self._check_titles([(todo_id, data["title"])])
+        at, timestamp = self._now()
+        return self._put(self._updated_record(todo, data, timestamp), at=at)
+
+    async def update_many(self, updates: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        # Check everything first so a missing todo leaves the batch unapplied, like a transaction.
+        missing = [todo_id for todo_id, _ in updates if todo_id not in self.rows]
+        if missing:
+            raise TodoNotFoundException(f"Todos not found: {', '.join(missing)}")
+        self._check_titles([(todo_id, data["title"]) for todo_id, data in updates if data.get("title") is not None])
+        at, timestamp = self._now()
+        return [self._put(self._updated_record(self.rows[todo_id], data, timestamp), at=at) for todo_id, data in updates]
+
+    async def delete(self, todo_id: str) -> Optional[Any]:
+        todo = self.rows.pop(todo_id, None)
+        if todo is None:
+            return None
+        self.tombstones.add(todo_id)
+        self.titles.pop(todo.title, None)
+        self.search_index.update(todo_id, None)
+        self.version += 1
+        deleted_at, _ = self._now()
+        self._record_change(todo_id, deleted_at, deleted=True)
+        self._append({"op": "delete", "id": todo_id, "at": deleted_at})
+        if len(self.tombstones) >= max(self.COMPACT_MIN_TOMBSTONES, len(self.index) // 2):
+            self._compact_index()
+        return todo
+
+    async def delete_many(self, todo_ids: List[str]) -> int:
+        deleted = 0
+        for todo_id in todo_ids:
+            if await self.delete(todo_id) is not None:
+                deleted += 1
+        return deleted
+
+    async def search(self, terms: List[str], prefix: Optional[str], take: int, skip: int = 0) -> List[Any]:
+        return [self.rows[todo_id] for todo_id in self.search_index.search(terms, prefix, take, skip)]
+
+    async def changes(self, since: Optional[Tuple[int, str]], until: int, take: int) -> List[TodoChange]:
+        index, change_keys = self.changes_index, self.change_keys
+        position = bisect_right(index, since) if since else 0
+        changes = []
+        while position < len(index) and len(changes) < take:
+            key = index[position]
+            if key[0] > until:
+                break
+            if change_keys.get(key[1]) == key:
+                changes.append(TodoChange(position=key, id=key[1], todo=self.rows.get(key[1])))
+            position += 1
+        return changes
+
+    async def collection_version(self) -> str:
+        return f"{self.epoch}:{self.version}"
+
+    def compact_log(self):
+        """Rewrite the append-only log as a snapshot of the live todos and retained tombstones."""
+        if not self.persist_path:
+            return
+        temp_path = self.persist_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as snapshot:
+            for todo_id in self.index:
+                if todo_id in self.rows:
+                    snapshot.write(json.dumps({"op": "put", "todo": self.rows[todo_id].to_dict()}) + "\n")
+            for todo_id, at in self.deleted.items():
+                snapshot.write(json.dumps({"op": "tombstone", "id": todo_id, "at": at}) + "\n")
+        if self.log is not None:
+            self.log.close()
+        os.replace(temp_path, self.persist_path)
+        self.log = open(self.persist_path, "a", encoding="utf-8")
+
+    def _put(self, todo: TodoRecord, persist: bool = True, at: Optional[int] = None) -> TodoRecord:
+        previous = self.rows.get(todo.id)
+        if previous is not None:
+            if self.titles.get(previous.title) == previous.id:
+                del self.titles[previous.title]
+        elif todo.id in self.tombstones:
+            self.tombstones.discard(todo.id)
+        elif not self.index or todo.id > self.index[-1]:
+            # Fresh ObjectIds are increasing, so inserts are almost always appends.
+            self.index.append(todo.id)
+        else:
+            insort(self.index, todo.id)
+        self.rows[todo.id] = todo
+        self.titles[todo.title] = todo.id
+        self.search_index.update(todo.id, todo)
+        self.version += 1
+        self._record_change(todo.id, self._millis(todo.updatedAt) if at is None else at)
+        if persist:
+            self._append({"op": "put", "todo": todo.to_dict()})
+        return todo
+
+    def _candidates(self, filters: Optional[TodoFilter]) -> Iterable[TodoRecord]:
+        if filters is not None and filters.title is not None:
+            todo_id = self.titles.get(filters.title)
+            return [self.rows[todo_id]] if todo_id is not None else []
+        return self.rows.values()
+
+    @staticmethod
+    def _matcher(filters: Optional[TodoFilter]) -> Optional[Callable[[TodoRecord], bool]]:
+        if filters is None or filters == TodoFilter():
+            return None
+
+        def matches(todo: TodoRecord) -> bool:
+            return (
+                (filters.title is None or todo.title == filters.title)
+                and (filters.title_prefix is None or todo.title.startswith(filters.title_prefix))
+                and (filters.content_contains is None or filters.content_contains in todo.content)
+            )
+        return matches
+
+    @staticmethod
+    def _now() -> Tuple[int, str]:
+        """Epoch millis and updatedAt string for a write. The string has millisecond precision and
+        a Z suffix, which is how a Prisma (MongoDB) datetime encodes; it's reused within a millisecond."""
+        millis = time.time_ns() // 1_000_000
+        if millis != MemoryTodoRepository.clock[0]:
+            moment = datetime.fromtimestamp(millis // 1000, tz=timezone.utc).replace(microsecond=millis % 1000 * 1000)
+            MemoryTodoRepository.clock = (millis, moment.isoformat().replace("+00:00", "Z"))
+        return MemoryTodoRepository.clock
+
+    @staticmethod
+    def _millis(timestamp: Optional[str]) -> int:
+        # datetime.fromisoformat only reads a Z suffix from Python 3.11 on.
+        return int(datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp() * 1000) if timestamp else 0
+
+    def _record_change(self, todo_id: str, at: int, deleted: bool = False):
+        if deleted:
+            self.deleted[todo_id] = at
+        else:
+            self.deleted.pop(todo_id, None)
+        key = (at, todo_id)
+        self.change_keys[todo_id] = key
+        if not self.changes_index or key > self.changes_index[-1]:
+            self.changes_index.append(key)
+        else:
+            insort(self.changes_index, key)
+        if len(self.changes_index) - len(self.change_keys) >= max(self.COMPACT_MIN_TOMBSTONES, len(self.change_keys)):
+            self._compact_changes()
+
+    def _compact_changes(self):
+        horizon = (datetime.now(timezone.utc).timestamp() - AppConfig.TODO_TOMBSTONE_RETENTION_SECONDS) * 1000
+        for todo_id, at in list(self.deleted.items()):
+            if at < horizon:
+                del self.deleted[todo_id]
+                del self.change_keys[todo_id]
+        self.changes_index = sorted(self.change_keys.values())
+
+    @staticmethod
+    def _new_record(data: Dict[str, Any], timestamp: str) -> TodoRecord:
+        return TodoRecord(id=data.get("id") or new_object_id(), title=data["title"], content=data["content"], updatedAt=timestamp)
+
+    @staticmethod
+    def _updated_record(todo: TodoRecord, data: Dict[str, Any], timestamp: str) -> TodoRecord:
+        title = data.get("title")
+        content = data.get("content")
+        return TodoRecord(
+            id=todo.id,
+            title=todo.title if title is None else title,
+            content=todo.content if content is None else content,
+            updatedAt=timestamp,
+            revision=(todo.revision or 0) + 1,
+        )
+
+    def _check_titles(self, titles: List[Tuple[Optional[str], str]]):
+        """Raise before writing anything if a title is taken by another todo or repeated in the batch."""
+        seen = set()
+        for todo_id, title in titles:
+            owner = self.titles.get(title)
+            if title in seen or (owner is not None and owner != todo_id):
+                raise TodoAlreadyExistsException(f"Todo with title {title} already exists")
+            seen.add(title)
+
+    def _compact_index(self):
+        self.index = [todo_id for todo_id in self.index if todo_id in self.rows]
+        self.tombstones.clear()
+
+    def _append(self, entry: Dict[str, Any]):
+        if self.log is not None:
+            self.log.write(json.dumps(entry) + "\n")
+            self.log.flush()
+
+    def _replay(self, path: str):
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as log:
+            for line in log:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if entry["op"] == "put":
+                    self._put(TodoRecord(**entry["todo"]), persist=False)
+                elif entry["op"] == "tombstone":
+                    self._record_change(entry["id"], entry["at"], deleted=True)
+                else:
+                    todo = self.rows.pop(entry["id"], None)
+                    if todo is not None:
+                        self.tombstones.add(todo.id)
+                        self.titles.pop(todo.title, None)
+                        self.search_index.update(todo.id, None)
+                        self._record_change(todo.id, entry.get("at", 0), deleted=True)
+        self._compact_index()
+        self._compact_changes()
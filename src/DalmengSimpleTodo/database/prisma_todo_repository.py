@@ -0,0 +1,271 @@
+import asyncio
+import logging
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from prisma.errors import RecordNotFoundError, UniqueViolationError
+
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.database.database_repository import DatabaseRepository
+from DalmengSimpleTodo.database.todo_repository import TodoChange, TodoFilter, TodoRepository
+from DalmengSimpleTodo.exceptions.todo_exception import TodoAlreadyExistsException, TodoNotFoundException
+from DalmengSimpleTodo.utils.text_search import prefixes, rank, tokenize
+
+logger = logging.getLogger(__name__)
+
+# The single TodoCollectionVersion document.
+COLLECTION_VERSION_ID = "todos"
+
+class PrismaTodoRepository(TodoRepository):
+    """Todos in MongoDB through Prisma.
+
+    prisma-client-py can't send `$text` queries to MongoDB, so search runs on the indexed
+    titleTerms/contentTerms word lists this repository writes alongside title and content.
+
+    The collection version is a counter document every write increments once it has gone
+    through, so it changes on each commit whatever the timestamps or the writers' clocks say,
+    and reading it is a single point read.
+
+    Title uniqueness is left to the unique index on title: a violation comes back from the
+    insert/update itself and is raised as TodoAlreadyExistsException, with no lookup first.
+
+    Deletes leave a TodoTombstone behind for the changes feed, which reads todos and
+    tombstones through their (updatedAt, id) / (deletedAt, id) indexes and merges the two.
+    """
+
+    def __init__(self):
+        self.tasks: List[asyncio.Task] = []
+
+    async def connect(self):
+        await DatabaseRepository.connect()
+        self.tasks = [
+            asyncio.create_task(DatabaseRepository.watch()),
+            asyncio.create_task(self._purge_tombstones_periodically()),
+        ]
+
+    async def disconnect(self):
+        for task in self.tasks:
+            task.cancel()
+        self.tasks = []
+        await DatabaseRepository.disconnect()
+
+    async def is_ready(self) -> bool:
+        return await DatabaseRepository.is_ready()
+
+    async def find_page(
+        self,
+        take: int,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        filters: Optional[TodoFilter] = None,
+        sort: str = "id",
+        descending: bool = False,
+    ) -> List[Any]:
+        # Walking backwards from `before` flips the direction, as does a descending sort.
+        reverse = descending != bool(before)
+        conditions = self._filter_conditions(filters)
+        cursor = before or after
+        if cursor:
+            conditions.append({sort: {"lt" if reverse else "gt": cursor}})
+
+        query = {"take": take, "order": {sort: "desc" if reverse else "asc"}}
+        if conditions:
+            query["where"] = conditions[0] if len(conditions) == 1 else {"AND": conditions}
+        return await DatabaseRepository.get_client().todo.find_many(**query)
+
+    async def count(self, filters: Optional[TodoFilter] = None) -> int:
+        conditions = self._filter_conditions(filters)
+        if not conditions:
+            return await DatabaseRepository.get_client().todo.count()
+        where = conditions[0] if len(conditions) == 1 else {"AND": conditions}
+        return await DatabaseRepository.get_client().todo.count(where=where)
+
+    async def find_by_id(self, todo_id: str) -> Optional[Any]:
+        return await DatabaseRepository.get_client().todo.find_unique(where={"id": todo_id})
+
+    async def find_by_ids(self, todo_ids: List[str]) -> List[Any]:
+        return await DatabaseRepository.get_client().todo.find_many(where={"id": {"in": todo_ids}})
+
+    async def create(self, data: Dict[str, Any]) -> Any:
+        with self._unique_title(data.get("title")):
+            created = await DatabaseRepository.get_client().todo.create(data=self._with_terms(data))
+        await self._bump_version()
+        return created
+
+    async def create_many(self, rows: List[Dict[str, Any]]) -> int:
+        try:
+            with self._unique_title():
+                return await DatabaseRepository.get_client().todo.create_many(data=[self._with_terms(row) for row in rows])
+        finally:
+            # Rows ahead of a taken title are inserted even when the call fails.
+            await self._bump_version()
+
+    async def update(self, todo_id: str, data: Dict[str, Any]) -> Optional[Any]:
+        # Prisma returns None instead of raising when the record is missing,
+        # so the existence check costs no extra round-trip.
+        with self._unique_title(data.get("title")):
+            updated = await DatabaseRepository.get_client().todo.update(where={"id": todo_id}, data=self._for_update(data))
+        if updated is not None:
+            await self._bump_version()
+        return updated
+
+    async def update_many(self, updates: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        # A batch commit returns no records, so the updated todos are read back in one query.
+        batcher = DatabaseRepository.get_client().batch_()
+        for todo_id, data in updates:
+            batcher.todo.update(where={"id": todo_id}, data=self._for_update(data))
+        with self._unique_title():
+            try:
+                await batcher.commit()
+            except RecordNotFoundError as e:
+                raise TodoNotFoundException(str(e))
+        await self._bump_version()
+        return await self.find_by_ids([todo_id for todo_id, _ in updates])
+
+    async def delete(self, todo_id: str) -> Optional[Any]:
+        client = DatabaseRepository.get_client()
+        deleted = await client.todo.delete(where={"id": todo_id})
+        if deleted is not None:
+            deleted_at = datetime.now(timezone.utc)
+            await client.todotombstone.upsert(
+                where={"id": todo_id},
+                data={"create": {"id": todo_id, "deletedAt": deleted_at}, "update": {"deletedAt": deleted_at}},
+            )
+            await self._bump_version()
+        return deleted
+
+    async def delete_many(self, todo_ids: List[str]) -> int:
+        client = DatabaseRepository.get_client()
+        deleted = await client.todo.delete_many(where={"id": {"in": todo_ids}})
+        # Callers only pass ids they just found, so a tombstone is written for each of them.
+        deleted_at = datetime.now(timezone.utc)
+        await client.todotombstone.delete_many(where={"id": {"in": todo_ids}})
+        await client.todotombstone.create_many(data=[{"id": todo_id, "deletedAt": deleted_at} for todo_id in todo_ids])
+        await self._bump_version()
+        return deleted
+
+    async def changes(self, since: Optional[Tuple[int, str]], until: int, take: int) -> List[TodoChange]:
+        client = DatabaseRepository.get_client()
+        todos, tombstones = await asyncio.gather(
+            client.todo.find_many(**self._changes_query("updatedAt", since, until, take)),
+            client.todotombstone.find_many(**self._changes_query("deletedAt", since, until, take)),
+        )
+        changes = [TodoChange(position=(self._millis(todo.updatedAt), todo.id), id=todo.id, todo=todo) for todo in todos]
+        changes += [
+            TodoChange(position=(self._millis(tombstone.deletedAt), tombstone.id), id=tombstone.id, todo=None)
+            for tombstone in tombstones
+        ]
+        changes.sort(key=lambda change: change.position)
+        return changes[:take]
+
+    async def purge_tombstones(self, before: datetime) -> int:
+        return await DatabaseRepository.get_client().todotombstone.delete_many(where={"deletedAt": {"lt": before}})
+
+    async def collection_version(self) -> str:
+        counter = await DatabaseRepository.get_client().todocollectionversion.find_unique(where={"id": COLLECTION_VERSION_ID})
+        return str(counter.value) if counter is not None else "0"
+
+    @staticmethod
+    async def _bump_version():
+        # Only after the write: a reader that sees the new version must also see the new data.
+        await DatabaseRepository.get_client().todocollectionversion.upsert(
+            where={"id": COLLECTION_VERSION_ID},
+            data={"create": {"id": COLLECTION_VERSION_ID, "value": 1}, "update": {"value": {"increment": 1}}},
+        )
+
+    async def search(self, terms: List[str], prefix: Optional[str], take: int, skip: int = 0) -> List[Any]:
+        conditions = [
+            {"OR": [{"titleTerms": {"has": term}}, {"contentTerms": {"has": term}}]}
+            for term in dict.fromkeys(terms)
+        ]
+        if prefix and len(prefix) >= AppConfig.TODO_SEARCH_PREFIX_MIN_LENGTH:
+            # Prefixes are stored like terms, from TODO_SEARCH_PREFIX_MIN_LENGTH to
+            # TODO_SEARCH_PREFIX_MAX_LENGTH characters (TodoService cuts the query prefix to the
+            # latter), so the array indexes serve them too. A shorter prefix is left to rank().
+            conditions.append({"OR": [{"titlePrefixes": {"has": prefix}}, {"contentPrefixes": {"has": prefix}}]})
+        if not conditions:
+            return []
+
+        # Only the newest TODO_SEARCH_MAX_CANDIDATES matches are ranked, as in MemoryTodoRepository;
+        # TodoService keeps offset + limit within that window.
+        candidates = await DatabaseRepository.get_client().todo.find_many(
+            where={"AND": conditions}, order={"id": "desc"}, take=AppConfig.TODO_SEARCH_MAX_CANDIDATES
+        )
+        return rank(candidates, terms, prefix)[skip:skip + take]
+
+    async def backfill_search_terms(self, batch_size: int = AppConfig.TODO_EXPORT_BATCH_SIZE):
+        """Write the search term and prefix arrays for todos stored without them."""
+        last_id = None
+        while True:
+            todos = await self.find_page(take=batch_size, after=last_id)
+            if todos:
+                await self.update_many([(todo.id, {"title": todo.title, "content": todo.content}) for todo in todos])
+            if len(todos) < batch_size:
+                return
+            last_id = todos[-1].id
+
+    async def _purge_tombstones_periodically(self, interval: float = AppConfig.TODO_TOMBSTONE_PURGE_INTERVAL_SECONDS):
+        while True:
+            try:
+                retention = timedelta(seconds=AppConfig.TODO_TOMBSTONE_RETENTION_SECONDS)
+                await self.purge_tombstones(datetime.now(timezone.utc) - retention)
+            except Exception as e:
+                logger.warning("Tombstone purge failed: %s", e)
+            await asyncio.sleep(interval)
+
+    @staticmethod
+    def _filter_conditions(filters: Optional[TodoFilter]) -> List[Dict[str, Any]]:
+        # Title equality and startsWith (an anchored regex) use the unique index on title;
+        # contains on content has no index to use.
+        if filters is None:
+            return []
+        conditions = []
+        if filters.title is not None:
+            conditions.append({"title": filters.title})
+        if filters.title_prefix is not None:
+            conditions.append({"title": {"startsWith": filters.title_prefix}})
+        if filters.content_contains is not None:
+            conditions.append({"content": {"contains": filters.content_contains}})
+        return conditions
+
+    @staticmethod
+    def _changes_query(field: str, since: Optional[Tuple[int, str]], until: int, take: int) -> Dict[str, Any]:
+        where: Dict[str, Any] = {field: {"lte": PrismaTodoRepository._datetime(until)}}
+        if since:
+            since_at = PrismaTodoRepository._datetime(since[0])
+            where["OR"] = [{field: {"gt": since_at}}, {field: since_at, "id": {"gt": since[1]}}]
+        return {"where": where, "order": [{field: "asc"}, {"id": "asc"}], "take": take}
+
+    @staticmethod
+    def _datetime(millis: int) -> datetime:
+        return datetime.fromtimestamp(millis / 1000, tz=timezone.utc)
+
+    @staticmethod
+    def _millis(value: datetime) -> int:
+        return int(value.timestamp() * 1000)
+
+    @staticmethod
+    @contextmanager
+    def _unique_title(title: Optional[str] = None):
+        try:
+            yield
+        except UniqueViolationError:
+            raise TodoAlreadyExistsException(f"Todo with title {title} already exists" if title else "Todo title already exists")
+
+    @staticmethod
+    def _for_update(data: Dict[str, Any]) -> Dict[str, Any]:
+        # updatedAt is maintained by Prisma (@updatedAt); the revision is bumped in the same write.
+        return {**PrismaTodoRepository._with_terms(data), "revision": {"increment": 1}}
+
+    @staticmethod
+    def _with_terms(data: Dict[str, Any]) -> Dict[str, Any]:
+        data = dict(data)
+        lengths = (AppConfig.TODO_SEARCH_PREFIX_MAX_LENGTH, AppConfig.TODO_SEARCH_PREFIX_MIN_LENGTH)
+        if data.get("title") is not None:
+            data["titleTerms"] = sorted(set(tokenize(data["title"])))
+            data["titlePrefixes"] = prefixes(data["title"], *lengths)
+        if data.get("content") is not None:
+            data["contentTerms"] = sorted(set(tokenize(data["content"])))
+            data["contentPrefixes"] = prefixes(data["content"], *lengths)
+        return data
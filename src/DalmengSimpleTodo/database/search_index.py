@@ -0,0 +1,110 @@
+from bisect import bisect_left, insort
+from heapq import nlargest, nsmallest
+from typing import Any, Dict, List, Optional
+
+from DalmengSimpleTodo.utils.text_search import term_weights
+
+class InvertedIndex:
+    """Term -> {todo id: weight} postings.
+
+    Writes only record the todo's latest state; the postings catch up on the next search, so
+    tokenizing stays off the write path and a todo rewritten many times between searches is
+    indexed once. The vocabulary is kept sorted so a prefix expands to its terms with a bisect.
+    """
+
+    def __init__(self, max_candidates: int):
+        self.max_candidates = max_candidates
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.vocabulary: List[str] = []
+        self.indexed: Dict[str, Any] = {}
+        self.pending: Dict[str, Optional[Any]] = {}
+
+    def update(self, todo_id: str, todo: Optional[Any]):
+        """Record the todo's new state; None when it was deleted."""
+        self.pending[todo_id] = todo
+
+    def search(self, terms: List[str], prefix: Optional[str], take: int, skip: int = 0) -> List[str]:
+        """Ids of the todos matching every term and the prefix, best score first. Like the Prisma
+        backend, only the `max_candidates` newest matches (highest ids) are ranked."""
+        self._flush()
+        matches: List[Dict[str, int]] = []
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                return []
+            matches.append(postings)
+
+        expanded = self._expand_prefix(prefix) if prefix else []
+        if prefix and not expanded:
+            return []
+
+        if matches:
+            # Intersect starting from the rarest term so the candidate set stays small.
+            matches.sort(key=len)
+            scores = dict(matches[0])
+            for postings in matches[1:]:
+                scores = {todo_id: score + postings[todo_id] for todo_id, score in scores.items() if todo_id in postings}
+                if not scores:
+                    return []
+            if expanded:
+                scores = self._filter_by_prefix(scores, expanded)
+        else:
+            scores = self._union(expanded)
+
+        if len(scores) > self.max_candidates:
+            scores = {todo_id: scores[todo_id] for todo_id in nlargest(self.max_candidates, scores)}
+        ranked = nsmallest(skip + take, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [todo_id for todo_id, _ in ranked[skip:]]
+
+    def _flush(self):
+        pending, self.pending = self.pending, {}
+        for todo_id, todo in pending.items():
+            previous = self.indexed.pop(todo_id, None)
+            if previous is not None:
+                self._remove(previous)
+            if todo is not None:
+                self._add(todo)
+                self.indexed[todo_id] = todo
+
+    def _add(self, todo):
+        for term, weight in term_weights(todo.title, todo.content).items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = {}
+                insort(self.vocabulary, term)
+            postings[todo.id] = weight
+
+    def _remove(self, todo):
+        for term in term_weights(todo.title, todo.content):
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(todo.id, None)
+            if not postings:
+                del self.postings[term]
+                self.vocabulary.pop(bisect_left(self.vocabulary, term))
+
+    def _expand_prefix(self, prefix: str) -> List[Dict[str, int]]:
+        vocabulary = self.vocabulary
+        position = bisect_left(vocabulary, prefix)
+        expanded = []
+        while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+            expanded.append(self.postings[vocabulary[position]])
+            position += 1
+        return expanded
+
+    def _filter_by_prefix(self, scores: Dict[str, int], expanded: List[Dict[str, int]]) -> Dict[str, int]:
+        # Set intersections run in C, which beats probing every expanded term per candidate.
+        weights: Dict[str, int] = {}
+        candidates = scores.keys()
+        for postings in expanded:
+            for todo_id in candidates & postings.keys():
+                weights[todo_id] = weights.get(todo_id, 0) + postings[todo_id]
+        return {todo_id: scores[todo_id] + weight for todo_id, weight in weights.items()}
+
+    def _union(self, expanded: List[Dict[str, int]]) -> Dict[str, int]:
+        union: Dict[str, int] = {}
+        for postings in expanded:
+            for todo_id, weight in postings.items():
+                union[todo_id] = union.get(todo_id, 0) + weight
+        return union
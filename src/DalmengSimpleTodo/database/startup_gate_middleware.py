@@ -0,0 +1,36 @@
+from typing import Iterable
+
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.database.database_startup import DatabaseStartup
+from DalmengSimpleTodo.models.base_model import BaseResponseModel
+
+class StartupGateMiddleware:
+    """Holds requests until the background database connect has finished, for up to
+    `timeout` seconds, then answers 503 with Retry-After. Once connected it costs one check."""
+
+    def __init__(
+        self,
+        app,
+        timeout: float = AppConfig.DATABASE_STARTUP_WAIT_SECONDS,
+        excluded_paths: Iterable[str] = ("/health/live", "/health/ready", "/metrics"),
+    ):
+        self.app = app
+        self.timeout = timeout
+        self.excluded_paths = frozenset(excluded_paths)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["path"] in self.excluded_paths
+            or DatabaseStartup.connected()
+            or await DatabaseStartup.wait(self.timeout)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        response = BaseResponseModel.failed(
+            status_code=503,
+            msg="Database is not ready",
+            headers={"Retry-After": str(AppConfig.ADMISSION_RETRY_AFTER_SECONDS)},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,124 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+class TodoChange(NamedTuple):
+    """One entry of the changes feed. `todo` is None when the todo was deleted."""
+    position: Tuple[int, str]
+    id: str
+    todo: Optional[Any]
+
+class TodoFilter(NamedTuple):
+    """Conditions a todo must all meet; None leaves that condition out. Matching is case-sensitive."""
+    title: Optional[str] = None
+    title_prefix: Optional[str] = None
+    content_contains: Optional[str] = None
+
+class TodoRepository(ABC):
+    """Storage for todos. TodoService only talks to this, never to a client directly.
+
+    Records returned by a repository expose `id`, `title`, `content`, `updatedAt` and
+    `revision` attributes and can be encoded by BaseResponseModel. `revision` starts at 0
+    and goes up by one on every update.
+    """
+
+    async def connect(self):
+        pass
+
+    async def disconnect(self):
+        pass
+
+    async def is_ready(self) -> bool:
+        return True
+
+    @abstractmethod
+    async def find_page(
+        self,
+        take: int,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        filters: Optional[TodoFilter] = None,
+        sort: str = "id",
+        descending: bool = False,
+    ) -> List[Any]:
+        """Up to `take` todos matching `filters`, ordered by `sort` ("id" or "title", both unique),
+        starting after the `after` sort value, or walking backwards from `before` (closest first)."""
+
+    @abstractmethod
+    async def count(self, filters: Optional[TodoFilter] = None) -> int:
+        ...
+
+    @abstractmethod
+    async def find_by_id(self, todo_id: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    async def find_by_ids(self, todo_ids: List[str]) -> List[Any]:
+        ...
+
+    @abstractmethod
+    async def create(self, data: Dict[str, Any]) -> Any:
+        """Raises TodoAlreadyExistsException when another todo has the same title."""
+
+    @abstractmethod
+    async def create_many(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert rows that already carry their ids. Raises TodoAlreadyExistsException on a taken title."""
+
+    @abstractmethod
+    async def update(self, todo_id: str, data: Dict[str, Any]) -> Optional[Any]:
+        """Returns None when the todo does not exist. Raises TodoAlreadyExistsException when the
+        new title belongs to another todo."""
+
+    @abstractmethod
+    async def update_many(self, updates: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """Apply all updates atomically, in one round-trip where the backend allows it, and
+        return the updated todos as stored. Raises TodoAlreadyExistsException when a new title
+        belongs to another todo, and TodoNotFoundException when a todo does not exist."""
+
+    @abstractmethod
+    async def delete(self, todo_id: str) -> Optional[Any]:
+        """Returns None when the todo does not exist."""
+
+    @abstractmethod
+    async def delete_many(self, todo_ids: List[str]) -> int:
+        ...
+
+    @abstractmethod
+    async def collection_version(self) -> str:
+        """An opaque string that changes whenever any todo is created, updated or deleted.
+        Must be much cheaper than reading the todos themselves."""
+
+    @abstractmethod
+    async def changes(self, since: Optional[Tuple[int, str]], until: int, take: int) -> List[TodoChange]:
+        """Latest change of every todo created, updated or deleted after `since`, ordered by
+        position: (updatedAt or deletedAt in epoch milliseconds, id). Changes after `until`
+        (epoch milliseconds) are left out."""
+
+    @abstractmethod
+    async def search(self, terms: List[str], prefix: Optional[str], take: int, skip: int = 0) -> List[Any]:
+        """Todos containing every term (and a word starting with `prefix`), best match first.
+        See utils.text_search for tokenizing and scoring."""
+
+class TodoRepositoryProvider:
+    repository: Optional[TodoRepository] = None
+
+    @staticmethod
+    def create_repository(backend: str) -> TodoRepository:
+        if backend == "prisma":
+            from DalmengSimpleTodo.database.prisma_todo_repository import PrismaTodoRepository
+            return PrismaTodoRepository()
+        if backend == "memory":
+            from DalmengSimpleTodo.config.app_config import AppConfig
+            from DalmengSimpleTodo.database.memory_todo_repository import MemoryTodoRepository
+            return MemoryTodoRepository(persist_path=AppConfig.TODO_MEMORY_PERSIST_PATH)
+        raise ValueError(f"Unknown todo repository backend {backend}")
+
+    @staticmethod
+    def get_repository() -> TodoRepository:
+        if TodoRepositoryProvider.repository is None:
+            from DalmengSimpleTodo.config.app_config import AppConfig
+            TodoRepositoryProvider.repository = TodoRepositoryProvider.create_repository(AppConfig.TODO_REPOSITORY_BACKEND)
+        return TodoRepositoryProvider.repository
+
+    @staticmethod
+    def set_repository(repository: Optional[TodoRepository]):
+        TodoRepositoryProvider.repository = repository
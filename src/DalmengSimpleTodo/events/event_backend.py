@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Callable, List
+
+class EventBackend(ABC):
+    """Fans published events out to every worker's broker. Implement this (e.g. on Redis
+    pub/sub) when the app runs in several processes; events expose `type`, `id` and the
+    already-encoded `data` bytes, so they serialize cheaply."""
+
+    @abstractmethod
+    def publish(self, event) -> None:
+        ...
+
+    @abstractmethod
+    def subscribe(self, handler: Callable[[object], None]) -> None:
+        """Call `handler` with every event published by any worker, this one included."""
+
+class LocalEventBackend(EventBackend):
+    """Single-process fan-out: events go straight to this process's handlers."""
+
+    def __init__(self):
+        self.handlers: List[Callable[[object], None]] = []
+
+    def publish(self, event) -> None:
+        for handler in self.handlers:
+            handler(event)
+
+    def subscribe(self, handler: Callable[[object], None]) -> None:
+        self.handlers.append(handler)
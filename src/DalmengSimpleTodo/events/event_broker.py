@@ -0,0 +1,120 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set
+
+from DalmengSimpleTodo.events.event_backend import EventBackend
+from DalmengSimpleTodo.models.response_encoder import encode_json
+
+class TodoEvent:
+    __slots__ = ("type", "id", "todo", "_data")
+
+    def __init__(self, type: str, id: Optional[str], todo: Any = None, data: Optional[bytes] = None):
+        self.type = type
+        self.id = id
+        self.todo = todo
+        self._data = data
+
+    @property
+    def data(self) -> bytes:
+        # Encoded on first use and shared by every subscriber; never encoded if nobody listens.
+        if self._data is None:
+            self._data = encode_json({"id": self.id, "todo": self.todo})
+        return self._data
+
+    def coalesce(self, previous: "TodoEvent") -> "TodoEvent":
+        # A todo the subscriber hasn't been told about yet is still new to it after an update.
+        if previous.type == "created" and self.type == "updated":
+            return TodoEvent("created", self.id, self.todo, self._data)
+        return self
+
+RESYNC = TodoEvent("resync", None, data=b"{}")
+
+class Subscription:
+    """Events waiting for one subscriber, at most one per todo.
+
+    A new event for a todo that is still pending replaces it, so a slow consumer gets the
+    latest state instead of every step. Past `max_pending` todos the pending events are
+    dropped for a single resync event telling the client to reload.
+    """
+
+    def __init__(self, max_pending: int):
+        self.max_pending = max_pending
+        self.pending: "OrderedDict[str, TodoEvent]" = OrderedDict()
+        self.overflowed = False
+        self.closed = False
+        self.wakeup = asyncio.Event()
+
+    def push(self, event: TodoEvent) -> str:
+        """Queue `event`; returns "queued", "coalesced" or "overflowed"."""
+        if self.overflowed:
+            return "overflowed"
+        outcome = "queued"
+        previous = self.pending.pop(event.id, None)
+        if previous is not None:
+            event = event.coalesce(previous)
+            outcome = "coalesced"
+        if len(self.pending) >= self.max_pending:
+            self.pending.clear()
+            self.overflowed = True
+            outcome = "overflowed"
+        else:
+            self.pending[event.id] = event
+        self.wakeup.set()
+        return outcome
+
+    def close(self):
+        self.closed = True
+        self.wakeup.set()
+
+    async def next_batch(self, timeout: float) -> Optional[List[TodoEvent]]:
+        """Pending events, an empty list if none arrived within `timeout`, or None once closed."""
+        if not self.pending and not self.overflowed and not self.closed:
+            self.wakeup.clear()
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        if self.closed:
+            return None
+        if self.overflowed:
+            self.overflowed = False
+            return [RESYNC]
+        events = list(self.pending.values())
+        self.pending.clear()
+        return events
+
+class EventBroker:
+    """In-process pub/sub. Publishing goes through the backend so every worker's broker
+    dispatches it to its own subscribers. An idle subscriber is just a waiting asyncio.Event."""
+
+    def __init__(self, backend: EventBackend, max_pending: int):
+        self.backend = backend
+        self.max_pending = max_pending
+        self.subscriptions: Set[Subscription] = set()
+        self.counters = {"published": 0, "delivered": 0, "coalesced": 0, "overflowed": 0}
+        backend.subscribe(self.dispatch)
+
+    def publish(self, event: TodoEvent):
+        self.counters["published"] += 1
+        self.backend.publish(event)
+
+    def dispatch(self, event: TodoEvent):
+        for subscription in self.subscriptions:
+            outcome = subscription.push(event)
+            self.counters["delivered" if outcome == "queued" else outcome] += 1
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self.max_pending)
+        self.subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self.subscriptions.discard(subscription)
+
+    def close(self):
+        for subscription in self.subscriptions:
+            subscription.close()
+        self.subscriptions.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"subscribers": len(self.subscriptions), **self.counters}
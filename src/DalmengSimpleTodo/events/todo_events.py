@@ -0,0 +1,42 @@
+from typing import Any, AsyncIterator, Dict, List
+
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.events.event_backend import EventBackend, LocalEventBackend
+from DalmengSimpleTodo.events.event_broker import EventBroker, TodoEvent
+
+class TodoEvents:
+    enabled = AppConfig.TODO_EVENTS_ENABLED
+    broker = EventBroker(LocalEventBackend(), max_pending=AppConfig.TODO_EVENTS_MAX_PENDING)
+
+    @staticmethod
+    def set_backend(backend: EventBackend):
+        TodoEvents.broker.close()
+        TodoEvents.broker = EventBroker(backend, max_pending=AppConfig.TODO_EVENTS_MAX_PENDING)
+
+    @staticmethod
+    def publish(event_type: str, todo_id: str, todo: Any = None):
+        if TodoEvents.enabled:
+            TodoEvents.broker.publish(TodoEvent(event_type, todo_id, todo))
+
+    @staticmethod
+    async def listen(keepalive: float = AppConfig.TODO_EVENTS_KEEPALIVE_SECONDS) -> AsyncIterator[List[TodoEvent]]:
+        """Batches of events for one subscriber, and an empty batch every `keepalive` seconds
+        of silence. Ends when the broker is closed."""
+        broker = TodoEvents.broker
+        subscription = broker.subscribe()
+        try:
+            while True:
+                events = await subscription.next_batch(keepalive)
+                if events is None:
+                    return
+                yield events
+        finally:
+            broker.unsubscribe(subscription)
+
+    @staticmethod
+    def close():
+        TodoEvents.broker.close()
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        return TodoEvents.broker.stats()
@@ -0,0 +1,4 @@
+class ServiceOverloadedException(Exception):
+    status_code = 503
+    msg = "Service is overloaded. Try again later."
+    retry_after = 1
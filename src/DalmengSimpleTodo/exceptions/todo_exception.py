@@ -5,3 +5,19 @@ class TodoNotFoundException(Exception):
 class TodoAlreadyExistsException(Exception):
     status_code = 400
     msg = "Todo already exists. Use a different title."
+
+class InvalidTodoQueryException(Exception):
+    status_code = 400
+    msg = "Invalid query parameters."
+
+class InvalidTodoIdException(Exception):
+    status_code = 400
+    msg = "Invalid todo id."
+
+class DuplicateTodoIdException(Exception):
+    status_code = 400
+    msg = "Todo id appears more than once in the request."
+
+class TodoChangesExpiredException(Exception):
+    status_code = 410
+    msg = "Sync token expired. Fetch all todos again."
@@ -1,35 +1,78 @@
 from fastapi import FastAPI
-import uvicorn
 
 from DalmengSimpleTodo.routers.todo_router import todo_router
-from DalmengSimpleTodo.database.database_repository import DatabaseRepository
+from DalmengSimpleTodo.database.todo_repository import TodoRepositoryProvider
+from DalmengSimpleTodo.database.database_startup import DatabaseStartup
+from DalmengSimpleTodo.database.startup_gate_middleware import StartupGateMiddleware
+from DalmengSimpleTodo.events.todo_events import TodoEvents
 
 from contextlib import asynccontextmanager
 
 from fastapi.exceptions import RequestValidationError
-from fastapi import Request
+from fastapi import Request, Response
 from DalmengSimpleTodo.models.base_model import BaseResponseModel
+from DalmengSimpleTodo.models.encode_offload import EncodeOffload
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.metrics.metrics_middleware import MetricsMiddleware
+from DalmengSimpleTodo.metrics.request_metrics import RequestMetrics
+from DalmengSimpleTodo.admission.rate_limit_middleware import RateLimitMiddleware
+from DalmengSimpleTodo.admission.body_size_limit_middleware import BodySizeLimitMiddleware
+from DalmengSimpleTodo.compression.compression_middleware import CompressionMiddleware
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    database_client = DatabaseRepository.get_client()
-    await database_client.connect()
+    if AppConfig.DATABASE_CONNECT_IN_BACKGROUND:
+        DatabaseStartup.start()
+    else:
+        await TodoRepositoryProvider.get_repository().connect()
     yield
-    await database_client.disconnect()
-    
+    TodoEvents.close()
+    EncodeOffload.shutdown()
+    await DatabaseStartup.stop()
+    if TodoRepositoryProvider.repository is not None:
+        await TodoRepositoryProvider.repository.disconnect()
+
 app = FastAPI(lifespan=lifespan)
 app.include_router(todo_router)
+# The last middleware added runs outermost: metrics see rejected requests and compressed sizes.
+app.add_middleware(BodySizeLimitMiddleware)
+if AppConfig.DATABASE_CONNECT_IN_BACKGROUND:
+    app.add_middleware(StartupGateMiddleware)
+if AppConfig.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+if AppConfig.RESPONSE_COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+if AppConfig.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+
+@app.get("/health/live")
+async def health_live():
+    return BaseResponseModel.succeed()
+
+
+@app.get("/health/ready")
+async def health_ready():
+    if DatabaseStartup.connected() and await TodoRepositoryProvider.get_repository().is_ready():
+        return BaseResponseModel.succeed()
+    return BaseResponseModel.failed(status_code=503, msg="Database is not ready")
+
+
+@app.get("/metrics")
+async def metrics():
+    return Response(content=RequestMetrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError) -> BaseResponseModel:
     error_details = exc.errors()
-    error_messages = []
-
-    for error in error_details:
-        loc = ".".join([str(i) for i in error["loc"]])
-        msg = f"{loc}: {error['msg']}"
-        error_messages.append(msg)
+    # A bulk body can fail on every item; only the first few are worth reporting.
+    error_messages = [
+        f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+        for error in error_details[:AppConfig.VALIDATION_MAX_ERRORS]
+    ]
+    if len(error_details) > AppConfig.VALIDATION_MAX_ERRORS:
+        error_messages.append(f"and {len(error_details) - AppConfig.VALIDATION_MAX_ERRORS} more errors")
 
     return BaseResponseModel.failed(
         status_code=422,
@@ -37,4 +80,5 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 if __name__ == "__main__":
+    import uvicorn # pragma: no cover
     uvicorn.run(app, host="0.0.0.0", port=8181) # pragma: no cover
\ No newline at end of file
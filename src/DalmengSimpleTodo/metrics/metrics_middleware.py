@@ -0,0 +1,53 @@
+from time import perf_counter
+from typing import Iterable
+
+from DalmengSimpleTodo.metrics.request_metrics import RequestMetrics
+from DalmengSimpleTodo.metrics.request_timings import request_timings
+
+class MetricsMiddleware:
+    """Plain ASGI middleware; BaseHTTPMiddleware would add a task and a queue per request."""
+
+    def __init__(self, app, excluded_paths: Iterable[str] = ("/metrics",)):
+        self.app = app
+        self.excluded_paths = frozenset(excluded_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        timings = {}
+        token = request_timings.set(timings)
+        RequestMetrics.in_flight.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = perf_counter() - start
+            RequestMetrics.in_flight.dec()
+            request_timings.reset(token)
+
+            # Label by route template, not raw path, to keep label cardinality bounded.
+            route = scope.get("route")
+            labels = (scope["method"], route.path if route is not None else "unmatched")
+            RequestMetrics.requests.inc(labels + (str(status_code),))
+            RequestMetrics.latency.observe(labels, elapsed)
+            RequestMetrics.response_size.observe(labels, size)
+
+            service = timings.get("service", 0.0)
+            serialization = timings.get("serialization", 0.0)
+            RequestMetrics.phase_latency.observe(labels + ("service",), service)
+            RequestMetrics.phase_latency.observe(labels + ("serialization",), serialization)
+            overhead = max(elapsed - service - serialization, 0.0)
+            RequestMetrics.phase_latency.observe(labels + ("framework_overhead",), overhead)
@@ -0,0 +1,103 @@
+from typing import List
+
+from DalmengSimpleTodo.admission.concurrency_limiter import database_limiter
+from DalmengSimpleTodo.cache.todo_cache import TodoCache
+from DalmengSimpleTodo.events.todo_events import TodoEvents
+from DalmengSimpleTodo.metrics.metrics_registry import Counter, Gauge, Histogram, Metric, MetricsRegistry
+from DalmengSimpleTodo.models.encode_offload import EncodeOffload
+from DalmengSimpleTodo.models.response_encoder import shared_body_stats
+from DalmengSimpleTodo.service.todo_service import TodoService
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+def _collect_cache_metrics() -> List[Metric]:
+    metrics = []
+    for key, value in TodoCache.stats().items():
+        metric_type = Gauge if key == "entries" else Counter
+        suffix = "" if key == "entries" else "_total"
+        metric = metric_type(f"todo_cache_{key}{suffix}", f"Todo cache {key}.")
+        metric.inc((), value)
+        metrics.append(metric)
+    return metrics
+
+def _collect_event_metrics() -> List[Metric]:
+    metrics = []
+    for key, value in TodoEvents.stats().items():
+        if key == "subscribers":
+            metric = Gauge("todo_event_subscribers", "Connected event stream subscribers.")
+        else:
+            metric = Counter(f"todo_events_{key}_total", f"Todo events {key}.")
+        metric.inc((), value)
+        metrics.append(metric)
+    return metrics
+
+def _collect_admission_metrics() -> List[Metric]:
+    stats = database_limiter.stats()
+    in_flight = Gauge("todo_service_calls_in_flight", "Admitted TodoService calls in progress.")
+    in_flight.inc((), stats["in_flight"])
+    waiting = Gauge("todo_service_calls_waiting", "TodoService calls queued for admission.")
+    waiting.inc((), stats["waiting"])
+    rejected = Counter("todo_service_calls_rejected_total", "TodoService calls rejected as overloaded.")
+    rejected.inc((), stats["rejected"])
+    return [in_flight, waiting, rejected]
+
+def _collect_read_coalescing_metrics() -> List[Metric]:
+    stats = TodoService.reads.stats()
+    loads = Counter("todo_read_loads_total", "Reads that missed the cache, by whether they ran the load "
+                    "(leader) or joined an identical one in flight (follower).", ("role",))
+    loads.inc(("leader",), stats["leaders"])
+    loads.inc(("follower",), stats["followers"])
+    total = stats["leaders"] + stats["followers"]
+    ratio = Gauge("todo_read_dedup_ratio", "Share of cache-missing reads served by another read's load.")
+    ratio.set((), stats["followers"] / total if total else 0.0)
+    bodies = Counter("todo_shared_body_encodes_total", "Shared read results by whether their body was "
+                     "encoded (miss) or reused (hit).", ("result",))
+    bodies.inc(("hit",), shared_body_stats["hits"])
+    bodies.inc(("miss",), shared_body_stats["misses"])
+    return [loads, ratio, bodies]
+
+def _collect_encode_offload_metrics() -> List[Metric]:
+    stats = EncodeOffload.stats()
+    offloaded = Counter("response_encodes_offloaded_total", "Response bodies encoded in the worker pool.")
+    offloaded.inc((), stats["offloaded"])
+    in_flight = Gauge("response_encodes_in_flight", "Response bodies being encoded in the worker pool.")
+    in_flight.inc((), stats["in_flight"])
+    waiting = Gauge("response_encodes_waiting", "Response bodies queued for a pool worker.")
+    waiting.inc((), stats["waiting"])
+    rejected = Counter("response_encodes_rejected_total", "Responses rejected because the encode queue was full.")
+    rejected.inc((), stats["rejected"])
+    return [offloaded, in_flight, waiting, rejected]
+
+class RequestMetrics:
+    registry = MetricsRegistry()
+
+    requests = registry.register(Counter(
+        "http_requests_total", "HTTP requests by route and status code.", ("method", "route", "status_code")
+    ))
+    in_flight = registry.register(Gauge(
+        "http_requests_in_flight", "HTTP requests currently being served."
+    ))
+    latency = registry.register(Histogram(
+        "http_request_duration_seconds", "HTTP request latency.", LATENCY_BUCKETS, ("method", "route")
+    ))
+    phase_latency = registry.register(Histogram(
+        "http_request_phase_duration_seconds",
+        "Time spent per request phase. 'framework_overhead' is the rest of the request, not measured "
+        "on its own: routing, body parsing, pydantic validation and the other middleware.",
+        LATENCY_BUCKETS,
+        ("method", "route", "phase"),
+    ))
+    response_size = registry.register(Histogram(
+        "http_response_size_bytes", "HTTP response body size.", SIZE_BUCKETS, ("method", "route")
+    ))
+
+    registry.register_collector(_collect_cache_metrics)
+    registry.register_collector(_collect_event_metrics)
+    registry.register_collector(_collect_admission_metrics)
+    registry.register_collector(_collect_read_coalescing_metrics)
+    registry.register_collector(_collect_encode_offload_metrics)
+
+    @staticmethod
+    def render() -> str:
+        return RequestMetrics.registry.render()
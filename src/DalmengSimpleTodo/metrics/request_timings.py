@@ -0,0 +1,30 @@
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Dict, Optional
+
+# Set by MetricsMiddleware for the duration of a request; phases add their elapsed time to it.
+request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_timings", default=None)
+
+@contextmanager
+def track_phase(phase: str):
+    timings = request_timings.get()
+    if timings is None:
+        yield
+        return
+
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = timings.get(phase, 0.0) + perf_counter() - start
+
+def timed_phase(phase: str):
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with track_phase(phase):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,9 +1,16 @@
-import json
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, AsyncIterator, Dict, Generic, List, Optional, TypeVar
 
 from fastapi import Response
-from fastapi.encoders import jsonable_encoder   
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from starlette.types import Receive, Scope, Send
+
+from DalmengSimpleTodo.exceptions.admission_exception import ServiceOverloadedException
+from DalmengSimpleTodo.metrics.request_timings import track_phase
+from DalmengSimpleTodo.models.encode_offload import EncodeOffload
+from DalmengSimpleTodo.models.response_encoder import (
+    encode_envelope, encode_error, encode_json, encode_shared_envelope, find_shared_envelope, store_shared_envelope,
+)
 
 T = TypeVar("T")
 
@@ -13,27 +20,128 @@ class BaseResponseModel(BaseModel, Generic[T]):
     data: Optional[T] = None
 
     @staticmethod
-    def succeed(status_code: int = 200, msg: str = "succeed", data: Any = None) -> Response:
-        content = {"status_code": status_code, "msg": msg, "data": data}
-
-        json_compatible = jsonable_encoder(content)
-
+    def succeed(
+        status_code: int = 200,
+        msg: str = "succeed",
+        data: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        shared: bool = False,
+    ) -> Response:
+        # shared: `data` is a cached or coalesced read result handed to many requests as is,
+        # so its body is encoded once and reused.
+        if EncodeOffload.should_offload(data):
+            return OffloadedResponse(status_code, msg, data, headers, shared)
+        with track_phase("serialization"):
+            content = (encode_shared_envelope if shared else encode_envelope)(status_code, msg, data)
         return Response(
             status_code=status_code,
-            content=json.dumps(json_compatible),
+            content=content,
             media_type="application/json",
+            headers=headers,
         )
 
+    @staticmethod
+    def not_modified(etag: str) -> Response:
+        # 304 has no body, so nothing is loaded or serialized.
+        return Response(status_code=304, headers={"ETag": etag})
+
     @staticmethod
     def failed(
-        status_code: int = 500, msg: str = "failed", data: Any = None
+        status_code: int = 500, msg: str = "failed", data: Any = None, headers: Optional[Dict[str, str]] = None
     ) -> Response:
-        content = {"status_code": status_code, "msg": msg, "data": data}
-
-        json_compatible = jsonable_encoder(content)
-
+        if data is None:
+            return Response(
+                status_code=status_code,
+                content=encode_error(status_code, msg),
+                media_type="application/json",
+                headers=headers,
+            )
+        with track_phase("serialization"):
+            content = encode_envelope(status_code, msg, data)
         return Response(
             status_code=status_code,
-            content=json.dumps(json_compatible),
+            content=content,
             media_type="application/json",
+            headers=headers,
         )
+
+    @staticmethod
+    def stream(
+        batches: AsyncIterator[List[Any]], status_code: int = 200, msg: str = "succeed"
+    ) -> StreamingResponse:
+        # Same bytes as succeed(data=[...]), but the array is written one batch at a time.
+        head = encode_envelope(status_code, msg)[: -len(b"null}")] + b"["
+
+        async def body():
+            yield head
+            first = True
+            async for batch in batches:
+                chunk = b", ".join(encode_json(row) for row in batch)
+                yield chunk if first else b", " + chunk
+                first = False
+            yield b"]}"
+
+        return StreamingResponse(body(), status_code=status_code, media_type="application/json")
+
+    @staticmethod
+    def stream_ndjson(batches: AsyncIterator[List[Any]], status_code: int = 200) -> StreamingResponse:
+        async def body():
+            async for batch in batches:
+                yield b"".join(encode_json(row) + b"\n" for row in batch)
+
+        return StreamingResponse(body(), status_code=status_code, media_type="application/x-ndjson")
+
+    @staticmethod
+    def stream_events(batches: AsyncIterator[List[Any]]) -> StreamingResponse:
+        """Server-Sent Events: one frame per event (`type`, encoded `data`), a comment line
+        for every empty batch to keep idle connections open through proxies."""
+        async def body():
+            async for batch in batches:
+                if not batch:
+                    yield b": keepalive\n\n"
+                    continue
+                yield b"".join(b"event: " + event.type.encode() + b"\ndata: " + event.data + b"\n\n" for event in batch)
+
+        return StreamingResponse(
+            body(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+class OffloadedResponse(Response):
+    """BaseResponseModel.succeed for large data: the body is encoded by EncodeOffload while the
+    response is being sent, so the event loop keeps serving other requests meanwhile."""
+
+    media_type = "application/json"
+
+    def __init__(self, status_code: int, msg: str, data: Any, headers: Optional[Dict[str, str]], shared: bool):
+        super().__init__(status_code=status_code, headers=headers)
+        self.msg = msg
+        self.data = data
+        self.shared = shared
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        try:
+            with track_phase("serialization"):
+                body = await self._encode()
+        except ServiceOverloadedException as e:
+            response = BaseResponseModel.failed(
+                status_code=e.status_code, msg=e.msg, headers={"Retry-After": str(e.retry_after)}
+            )
+            return await response(scope, receive, send)
+        except Exception as e:
+            return await BaseResponseModel.failed(msg=str(e))(scope, receive, send)
+
+        self.body = body
+        self.raw_headers = [(name, value) for name, value in self.raw_headers if name != b"content-length"]
+        self.raw_headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await super().__call__(scope, receive, send)
+
+    async def _encode(self) -> bytes:
+        if not self.shared:
+            return await EncodeOffload.encode(self.status_code, self.msg, self.data)
+        body = find_shared_envelope(self.status_code, self.msg, self.data)
+        if body is None:
+            body = await EncodeOffload.encode(self.status_code, self.msg, self.data)
+            store_shared_envelope(self.status_code, self.msg, self.data, body)
+        return body
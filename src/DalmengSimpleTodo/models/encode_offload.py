@@ -0,0 +1,75 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from DalmengSimpleTodo.admission.concurrency_limiter import ConcurrencyLimiter
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.models.response_encoder import encode_envelope_with
+
+def count_items(data: Any) -> int:
+    """Rough size of a response: the rows it holds, top-level or in list values of a dict."""
+    if isinstance(data, list):
+        return len(data)
+    if isinstance(data, dict):
+        return sum(len(value) for value in data.values() if isinstance(value, list))
+    return 0
+
+class EncodeOffload:
+    """Encodes large response bodies in a worker pool instead of on the event loop.
+
+    RESPONSE_ENCODE_OFFLOAD picks the pool: "thread" keeps the data in process, and the loop
+    gets the GIL back every switch interval instead of once the whole body is done; "process"
+    encodes truly in parallel but pickles the data over to the worker first. At most
+    RESPONSE_ENCODE_OFFLOAD_WORKERS bodies are encoded at once and RESPONSE_ENCODE_OFFLOAD_MAX_QUEUE
+    more may wait; beyond that the limiter rejects with ServiceOverloadedException.
+    """
+
+    executor: Optional[Executor] = None
+    limiter = ConcurrencyLimiter(
+        max_concurrency=max(AppConfig.RESPONSE_ENCODE_OFFLOAD_WORKERS, 1),
+        max_queue=AppConfig.RESPONSE_ENCODE_OFFLOAD_MAX_QUEUE,
+        queue_timeout=AppConfig.RESPONSE_ENCODE_OFFLOAD_QUEUE_TIMEOUT_SECONDS,
+        retry_after=AppConfig.ADMISSION_RETRY_AFTER_SECONDS,
+    )
+    offloaded = 0
+
+    @staticmethod
+    def should_offload(data: Any) -> bool:
+        return AppConfig.RESPONSE_ENCODE_OFFLOAD != "off" and count_items(data) >= AppConfig.RESPONSE_ENCODE_OFFLOAD_MIN_ITEMS
+
+    @staticmethod
+    async def encode(status_code: int, msg: str, data: Any) -> bytes:
+        limiter = EncodeOffload.limiter
+        await limiter.acquire()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(
+                EncodeOffload._executor(), encode_envelope_with, AppConfig.RESPONSE_JSON_ENCODER, status_code, msg, data
+            )
+        except BaseException:
+            limiter.release()
+            raise
+        # The slot is held until the worker is done, even if this request goes away meanwhile.
+        future.add_done_callback(lambda _: limiter.release())
+        EncodeOffload.offloaded += 1
+        return await asyncio.shield(future)
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        return {**EncodeOffload.limiter.stats(), "offloaded": EncodeOffload.offloaded}
+
+    @staticmethod
+    def shutdown():
+        if EncodeOffload.executor is not None:
+            # The limiter never submits more bodies than there are workers, so none are left queued.
+            EncodeOffload.executor.shutdown(wait=True)
+            EncodeOffload.executor = None
+
+    @staticmethod
+    def _executor() -> Executor:
+        if EncodeOffload.executor is None:
+            workers = max(AppConfig.RESPONSE_ENCODE_OFFLOAD_WORKERS, 1)
+            if AppConfig.RESPONSE_ENCODE_OFFLOAD == "process":
+                EncodeOffload.executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                EncodeOffload.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="response-encode")
+        return EncodeOffload.executor
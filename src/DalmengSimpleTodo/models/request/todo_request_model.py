@@ -1,5 +1,7 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from DalmengSimpleTodo.config.app_config import AppConfig
 
 class BaseModelWrapper(BaseModel):
     def to_dict(self):
@@ -12,3 +14,15 @@ class CreateTodoRequestModel(BaseModelWrapper):
 class UpdateTodoRequestModel(BaseModelWrapper):
     title: Optional[str] = None
     content: Optional[str] = None
+
+class BulkCreateTodoRequestModel(BaseModelWrapper):
+    todos: List[CreateTodoRequestModel] = Field(min_length=1, max_length=AppConfig.TODO_BULK_MAX_ITEMS)
+
+class BulkUpdateTodoItemRequestModel(UpdateTodoRequestModel):
+    id: str
+
+class BulkUpdateTodoRequestModel(BaseModelWrapper):
+    todos: List[BulkUpdateTodoItemRequestModel] = Field(min_length=1, max_length=AppConfig.TODO_BULK_MAX_ITEMS)
+
+class BulkDeleteTodoRequestModel(BaseModelWrapper):
+    ids: List[str] = Field(min_length=1, max_length=AppConfig.TODO_BULK_MAX_ITEMS)
@@ -1,10 +1,33 @@
+from datetime import datetime
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
 class TodoResponseModel(BaseModel):
-    id: int
+    id: str
     title: str
     content: str
+    updatedAt: Optional[datetime] = None
+    revision: Optional[int] = None
 
 class TodoListResponseModel(BaseModel):
     todos: List[TodoResponseModel]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    next_offset: Optional[int] = None
+    # Search only: the last query word as it was matched, cut to TODO_SEARCH_PREFIX_MAX_LENGTH
+    # characters, and how many of the newest matching todos were ranked; older matches are left out.
+    matched_prefix: Optional[str] = None
+    candidate_limit: Optional[int] = None
+
+class TodoCountResponseModel(BaseModel):
+    count: int
+
+class TodoChangeResponseModel(BaseModel):
+    id: str
+    deleted: bool
+    todo: Optional[TodoResponseModel] = None
+
+class TodoChangesResponseModel(BaseModel):
+    changes: List[TodoChangeResponseModel]
+    next_token: Optional[str] = None
+    has_more: bool
@@ -0,0 +1,97 @@
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from DalmengSimpleTodo.config.app_config import AppConfig
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Storage-only fields on Prisma models that are never part of an API response.
+HIDDEN_FIELDS = {"titleTerms", "contentTerms", "titlePrefixes", "contentPrefixes"}
+
+def _default(obj: Any) -> Any:
+    # Only objects json can't handle natively land here, so plain dicts/lists/strs
+    # are never copied. Pydantic (and Prisma) models dump straight to JSON-ready data.
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True, exclude=HIDDEN_FIELDS)
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    return jsonable_encoder(obj)
+
+def _stdlib_dumps(data: Any) -> bytes:
+    return json.dumps(data, default=_default).encode()
+
+def _orjson_dumps(data: Any) -> bytes:
+    return orjson.dumps(data, default=_default)
+
+ENCODERS: Dict[str, Callable[[Any], bytes]] = {"stdlib": _stdlib_dumps}
+if orjson is not None:
+    ENCODERS["orjson"] = _orjson_dumps
+
+def get_encoder(name: Optional[str] = None) -> Callable[[Any], bytes]:
+    name = name or AppConfig.RESPONSE_JSON_ENCODER
+    if name not in ENCODERS:
+        raise ValueError(f"Unknown response encoder {name}. Available: {', '.join(ENCODERS)}")
+    return ENCODERS[name]
+
+def encode_json(data: Any) -> bytes:
+    return get_encoder()(data)
+
+@lru_cache(maxsize=256)
+def _envelope(encoder: str, status_code: int, msg: str) -> Tuple[bytes, bytes]:
+    envelope = get_encoder(encoder)({"status_code": status_code, "msg": msg, "data": None})
+    return envelope[: -len(b"null}")], b"}"
+
+def encode_envelope(status_code: int, msg: str, data: Any = None) -> bytes:
+    return encode_envelope_with(AppConfig.RESPONSE_JSON_ENCODER, status_code, msg, data)
+
+def encode_envelope_with(encoder: str, status_code: int, msg: str, data: Any = None) -> bytes:
+    # The encoder is passed in, not read from AppConfig, so a worker process encodes the same way.
+    head, tail = _envelope(encoder, status_code, msg)
+    return head + get_encoder(encoder)(data) + tail
+
+# Bodies of results that many requests receive as the same object (single-flight followers,
+# cache hits), keyed by object identity. Each entry holds its object, so the id stays unique.
+SHARED_BODIES: "OrderedDict[Tuple[int, str, int, str], Tuple[Any, bytes]]" = OrderedDict()
+SHARED_BODIES_MAX_ENTRIES = 64
+shared_body_stats = {"hits": 0, "misses": 0}
+
+def encode_shared_envelope(status_code: int, msg: str, data: Any) -> bytes:
+    """encode_envelope, encoded once per `data` object. Only for data nobody mutates afterwards."""
+    body = find_shared_envelope(status_code, msg, data)
+    if body is None:
+        body = encode_envelope(status_code, msg, data)
+        store_shared_envelope(status_code, msg, data, body)
+    return body
+
+def find_shared_envelope(status_code: int, msg: str, data: Any) -> Optional[bytes]:
+    key = (id(data), AppConfig.RESPONSE_JSON_ENCODER, status_code, msg)
+    entry = SHARED_BODIES.get(key)
+    if entry is None:
+        shared_body_stats["misses"] += 1
+        return None
+    SHARED_BODIES.move_to_end(key)
+    shared_body_stats["hits"] += 1
+    return entry[1]
+
+def store_shared_envelope(status_code: int, msg: str, data: Any, body: bytes):
+    SHARED_BODIES[(id(data), AppConfig.RESPONSE_JSON_ENCODER, status_code, msg)] = (data, body)
+    if len(SHARED_BODIES) > SHARED_BODIES_MAX_ENTRIES:
+        SHARED_BODIES.popitem(last=False)
+
+@lru_cache(maxsize=256)
+def _error(encoder: str, status_code: int, msg: str) -> bytes:
+    head, tail = _envelope(encoder, status_code, msg)
+    return head + b"null" + tail
+
+def encode_error(status_code: int, msg: str) -> bytes:
+    """A data-less envelope. Error paths repeat a small set of (status_code, msg) pairs, so
+    after the first occurrence the body is a cached bytes template."""
+    return _error(AppConfig.RESPONSE_JSON_ENCODER, status_code, msg)
@@ -1,24 +1,111 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Request
 from pydantic import BaseModel
-from typing import Dict, List
+from typing import Dict, List, Optional, Union
+
+from DalmengSimpleTodo.config.app_config import AppConfig
 
 from DalmengSimpleTodo.models.base_model import BaseResponseModel
-from DalmengSimpleTodo.models.response.todo_response_model import TodoListResponseModel, TodoResponseModel
-from DalmengSimpleTodo.models.request.todo_request_model import CreateTodoRequestModel, UpdateTodoRequestModel
+from DalmengSimpleTodo.database.todo_repository import TodoFilter
+from DalmengSimpleTodo.models.response.todo_response_model import TodoListResponseModel, TodoResponseModel, TodoChangesResponseModel, TodoCountResponseModel
+from DalmengSimpleTodo.models.request.todo_request_model import CreateTodoRequestModel, UpdateTodoRequestModel, BulkCreateTodoRequestModel, BulkUpdateTodoRequestModel, BulkDeleteTodoRequestModel
 
 from DalmengSimpleTodo.service.todo_service import TodoService
-from DalmengSimpleTodo.exceptions.todo_exception import TodoNotFoundException, TodoAlreadyExistsException
+from DalmengSimpleTodo.events.todo_events import TodoEvents
+from DalmengSimpleTodo.exceptions.admission_exception import ServiceOverloadedException
+from DalmengSimpleTodo.exceptions.todo_exception import TodoNotFoundException, TodoAlreadyExistsException, InvalidTodoQueryException, InvalidTodoIdException, TodoChangesExpiredException
+from DalmengSimpleTodo.utils.etag import etag_matches, make_etag
 
 todo_router = APIRouter(prefix="/api/v1/todo", tags=["todo"])
 
-@todo_router.get("", response_model=BaseResponseModel[TodoListResponseModel])
-async def api_get_todos():
+@todo_router.get("", response_model=Union[BaseResponseModel[TodoListResponseModel], BaseResponseModel[TodoCountResponseModel]])
+async def api_get_todos(
+    request: Request,
+    limit: int = Query(default=AppConfig.TODO_PAGE_SIZE_DEFAULT, ge=1, le=AppConfig.TODO_PAGE_SIZE_MAX),
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    fields: Optional[str] = None,
+    title: Optional[str] = Query(default=None, min_length=1, max_length=AppConfig.TODO_FILTER_MAX_LENGTH),
+    title_prefix: Optional[str] = Query(default=None, min_length=1, max_length=AppConfig.TODO_FILTER_MAX_LENGTH),
+    content_contains: Optional[str] = Query(default=None, min_length=1, max_length=AppConfig.TODO_FILTER_MAX_LENGTH),
+    sort: str = Query(default="id", pattern="^-?(id|title)$"),
+    count_only: bool = False,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    try:
+        # The version is read before the page: a write in between yields fresh data under
+        # the old ETag, which only costs the client one extra download, never a stale 304.
+        version = await TodoService.get_collection_version()
+        etag = _collection_etag(request, version)
+        if etag_matches(if_none_match, etag):
+            return BaseResponseModel.not_modified(etag)
+        filters = None
+        if title or title_prefix or content_contains:
+            filters = TodoFilter(title=title, title_prefix=title_prefix, content_contains=content_contains)
+        if count_only:
+            count = await TodoService.count_todos(filters, version=version)
+            return BaseResponseModel.succeed(data={"count": count}, headers={"ETag": etag})
+        field_list = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+        todos = await TodoService.get_todos(
+            limit=limit, after=after, before=before, fields=field_list, filters=filters, sort=sort, version=version
+        )
+        return BaseResponseModel.succeed(data=todos, headers={"ETag": etag}, shared=True)
+    except InvalidTodoQueryException as e:
+        return BaseResponseModel.failed(status_code=e.status_code, msg=e.msg)
+    except ServiceOverloadedException as e:
+        return _overloaded(e)
+    except Exception as e:
+        return BaseResponseModel.failed(msg=str(e))
+
+@todo_router.get("/search", response_model=BaseResponseModel[TodoListResponseModel])
+async def api_search_todos(
+    request: Request,
+    q: str = Query(min_length=1),
+    limit: int = Query(default=AppConfig.TODO_PAGE_SIZE_DEFAULT, ge=1, le=AppConfig.TODO_PAGE_SIZE_MAX),
+    offset: int = Query(default=0, ge=0),
+    if_none_match: Optional[str] = Header(default=None),
+):
     try:
-        todos = await TodoService.get_todos()
-        return BaseResponseModel.succeed(data=todos)
+        version = await TodoService.get_collection_version()
+        etag = _collection_etag(request, version)
+        if etag_matches(if_none_match, etag):
+            return BaseResponseModel.not_modified(etag)
+        todos = await TodoService.search_todos(q, limit=limit, offset=offset, version=version)
+        return BaseResponseModel.succeed(data=todos, headers={"ETag": etag}, shared=True)
+    except InvalidTodoQueryException as e:
+        return BaseResponseModel.failed(status_code=e.status_code, msg=e.msg)
+    except ServiceOverloadedException as e:
+        return _overloaded(e)
     except Exception as e:
         return BaseResponseModel.failed(msg=str(e))
 
+@todo_router.get("/changes", response_model=BaseResponseModel[TodoChangesResponseModel])
+async def api_get_changes(
+    since: Optional[str] = None,
+    limit: int = Query(default=AppConfig.TODO_PAGE_SIZE_DEFAULT, ge=1, le=AppConfig.TODO_PAGE_SIZE_MAX),
+):
+    try:
+        changes = await TodoService.get_changes(since=since, limit=limit)
+        return BaseResponseModel.succeed(data=changes)
+    except (InvalidTodoQueryException, TodoChangesExpiredException) as e:
+        return BaseResponseModel.failed(status_code=e.status_code, msg=e.msg)
+    except ServiceOverloadedException as e:
+        return _overloaded(e)
+    except Exception as e:
+        return BaseResponseModel.failed(msg=str(e))
+
+@todo_router.get("/events")
+async def api_todo_events():
+    # Events since the last connection are not replayed: reconnecting clients catch up
+    # through /changes with their last sync token.
+    return BaseResponseModel.stream_events(TodoEvents.listen())
+
+@todo_router.get("/export")
+async def api_export_todos(format: str = Query(default="ndjson", pattern="^(ndjson|json)$")):
+    batches = TodoService.iter_todo_batches()
+    if format == "json":
+        return BaseResponseModel.stream(batches)
+    return BaseResponseModel.stream_ndjson(batches)
+
 @todo_router.post("", response_model=BaseResponseModel[TodoResponseModel])
 async def create_todo(todo: CreateTodoRequestModel):
     try:
@@ -26,6 +113,58 @@ async def create_todo(todo: CreateTodoRequestModel):
         return BaseResponseModel.succeed(data=todo)
     except TodoAlreadyExistsException as e:
         return BaseResponseModel.failed(status_code=e.status_code, msg=e.msg)
+    except ServiceOverloadedException as e:
+        return _overloaded(e)
+    except Exception as e:
+        return BaseResponseModel.failed(msg=str(e))
+
+@todo_router.post("/bulk", response_model=BaseResponseModel[List[Dict]])
+async def create_todos(request: BulkCreateTodoRequestModel):
+    try:
+        results = await TodoService.create_todos(request.todos)
+        return BaseResponseModel.succeed(data=results)
+    except TodoAlreadyExistsException as e:
+        return BaseResponseModel.failed(status_code=e.status_code, msg=e.msg)
+    except ServiceOverloadedException as e:
+        return _overloaded(e)
+    except Exception as e:
+        return BaseResponseModel.failed(msg=str(e))
+
+@todo_router.put("/bulk", response_model=BaseResponseModel[List[Dict]])
+async def update_todos(request: BulkUpdateTodoRequestModel):
+    try:
+        results = await TodoService.update_todos(request.todos)
+        return BaseResponseModel.succeed(data=results)
+    except TodoAlreadyExistsException as e:
+        return BaseResponseModel.failed(status_code=e.status_code, msg=e.msg)
+    except ServiceOverloadedException as e:
+        return _overloaded(e)
+    except Exception as e:
+        return BaseResponseModel.failed(msg=str(e))
+
+@todo_router.post("/bulk/delete", response_model=BaseResponseModel[List[Dict]])
+async def delete_todos(request: BulkDeleteTodoRequestModel):
+    try:
+        results = await TodoService.delete_todos(request.ids)
+        return BaseResponseModel.succeed(data=results)
+    except ServiceOverloadedException as e:
+        return _overloaded(e)
+    except Exception as e:
+        return BaseResponseModel.failed(msg=str(e))
+
+@todo_router.get("/{todo_id}", response_model=BaseResponseModel[TodoResponseModel])
+async def api_get_todo(request: Request, todo_id: str, if_none_match: Optional[str] = Header(default=None)):
+    try:
+        version = await TodoService.get_collection_version()
+        etag = _collection_etag(request, version)
+        if etag_matches(if_none_match, etag):
+            return BaseResponseModel.not_modified(etag)
+        todo = await TodoService.get_todo(todo_id, version=version)
+        return BaseResponseModel.succeed(data=todo, headers={"ETag": etag})
+    except (TodoNotFoundException, InvalidTodoIdException) as e:
+        return BaseResponseModel.failed(status_code=e.status_code, msg=e.msg)
+    except ServiceOverloadedException as e:
+        return _overloaded(e)
     except Exception as e:
         return BaseResponseModel.failed(msg=str(e))
 
@@ -34,8 +173,10 @@ async def update_todo(todo_id: str, todo: UpdateTodoRequestModel):
     try:
         todo = await TodoService.update_todo(todo_id, todo)
         return BaseResponseModel.succeed(data=todo)
-    except TodoNotFoundException as e:
+    except (TodoNotFoundException, TodoAlreadyExistsException, InvalidTodoIdException) as e:
         return BaseResponseModel.failed(status_code=e.status_code, msg=e.msg)
+    except ServiceOverloadedException as e:
+        return _overloaded(e)
     except Exception as e:
         return BaseResponseModel.failed(msg=str(e))
 
@@ -44,7 +185,15 @@ async def delete_todo(todo_id: str):
     try:
         todo = await TodoService.delete_todo(todo_id)
         return BaseResponseModel.succeed(data=todo)
-    except TodoNotFoundException as e:
+    except (TodoNotFoundException, InvalidTodoIdException) as e:
         return BaseResponseModel.failed(status_code=e.status_code, msg=e.msg)
+    except ServiceOverloadedException as e:
+        return _overloaded(e)
     except Exception as e:
-        return BaseResponseModel.failed(msg=str(e))
\ No newline at end of file
+        return BaseResponseModel.failed(msg=str(e))
+
+def _collection_etag(request: Request, version: str) -> str:
+    return make_etag(version, request.url.path, request.url.query)
+
+def _overloaded(e: ServiceOverloadedException):
+    return BaseResponseModel.failed(status_code=e.status_code, msg=e.msg, headers={"Retry-After": str(e.retry_after)})
@@ -1,31 +1,489 @@
-from DalmengSimpleTodo.database.database_repository import DatabaseRepository
-from DalmengSimpleTodo.models.request.todo_request_model import CreateTodoRequestModel, UpdateTodoRequestModel
-from DalmengSimpleTodo.exceptions.todo_exception import TodoNotFoundException
+import base64
+import binascii
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from DalmengSimpleTodo.admission.concurrency_limiter import database_limiter
+from DalmengSimpleTodo.cache.single_flight import SingleFlight
+from DalmengSimpleTodo.cache.todo_cache import TodoCache
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.database.todo_repository import TodoFilter, TodoRepository, TodoRepositoryProvider
+from DalmengSimpleTodo.events.todo_events import TodoEvents
+from DalmengSimpleTodo.models.request.todo_request_model import CreateTodoRequestModel, UpdateTodoRequestModel, BulkUpdateTodoItemRequestModel
+from DalmengSimpleTodo.metrics.request_timings import timed_phase
+from DalmengSimpleTodo.service.write_batcher import WriteBatcher
+from DalmengSimpleTodo.exceptions.todo_exception import TodoNotFoundException, TodoAlreadyExistsException, InvalidTodoQueryException, InvalidTodoIdException, DuplicateTodoIdException, TodoChangesExpiredException
+from DalmengSimpleTodo.utils.object_id import is_object_id, new_object_id
+from DalmengSimpleTodo.utils.text_search import parse_query
+
+TODO_FIELDS = ("id", "title", "content", "updatedAt", "revision")
+# Only unique, indexed fields: a keyset cursor on them names exactly one position.
+TODO_SORTS = ("id", "-id", "title", "-title")
 
 class TodoService:
+    create_batcher: Optional[WriteBatcher] = None
+    reads = SingleFlight()
+
+    @staticmethod
+    @timed_phase("service")
+    async def get_todos(
+        limit: int = AppConfig.TODO_PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        filters: Optional[TodoFilter] = None,
+        sort: str = "id",
+        version: Optional[str] = None,
+    ):
+        if after and before:
+            raise InvalidTodoQueryException("Use either 'after' or 'before', not both")
+        if not 1 <= limit <= AppConfig.TODO_PAGE_SIZE_MAX:
+            raise InvalidTodoQueryException(f"limit must be between 1 and {AppConfig.TODO_PAGE_SIZE_MAX}")
+        if fields and any(field not in TODO_FIELDS for field in fields):
+            raise InvalidTodoQueryException(f"fields must be a subset of {', '.join(TODO_FIELDS)}")
+        if sort not in TODO_SORTS:
+            raise InvalidTodoQueryException(f"sort must be one of {', '.join(TODO_SORTS)}")
+        await TodoService._check_unindexed_scan(filters)
+
+        # Keyset pagination on the sort field: one extra row tells us whether another page exists.
+        sort_field, descending = sort.lstrip("-"), sort.startswith("-")
+        after_key = TodoService._decode_cursor(after, sort_field == "id") if after else None
+        before_key = TodoService._decode_cursor(before, sort_field == "id") if before else None
+
+        async def load():
+            todos = await TodoService._repository().find_page(
+                take=limit + 1,
+                after=after_key,
+                before=before_key,
+                filters=filters,
+                sort=sort_field,
+                descending=descending,
+            )
+            has_more = len(todos) > limit
+            todos = todos[:limit]
+            if before:
+                todos.reverse()
+
+            next_cursor = None
+            prev_cursor = None
+            if todos:
+                if has_more or before:
+                    next_cursor = TodoService._encode_cursor(getattr(todos[-1], sort_field))
+                if after or (before and has_more):
+                    prev_cursor = TodoService._encode_cursor(getattr(todos[0], sort_field))
+
+            if fields:
+                todos = [{field: getattr(todo, field) for field in fields} for todo in todos]
+            return {"todos": todos, "next_cursor": next_cursor, "prev_cursor": prev_cursor}
+
+        return await TodoService._cached_read(
+            lambda version: TodoCache.list_key(version, limit, after, before, fields, filters, sort), load, version
+        )
+
     @staticmethod
-    async def get_todos():
-        todos = await DatabaseRepository.get_client().todo.find_many()
-        return todos
+    @timed_phase("service")
+    async def get_todo(todo_id: str, version: Optional[str] = None):
+        TodoService._validate_todo_id(todo_id)
+
+        async def load():
+            todo = await TodoService._repository().find_by_id(todo_id)
+            if not todo:
+                raise TodoNotFoundException(f"Todo with id {todo_id} not found")
+            return todo
+
+        return await TodoService._cached_read(lambda version: TodoCache.todo_key(version, todo_id), load, version)
+
+    @staticmethod
+    @timed_phase("service")
+    async def count_todos(filters: Optional[TodoFilter] = None, version: Optional[str] = None) -> int:
+        await TodoService._check_unindexed_scan(filters)
+        return await TodoService._count(filters, version)
     
     @staticmethod
+    @timed_phase("service")
+    async def search_todos(
+        query: str, limit: int = AppConfig.TODO_PAGE_SIZE_DEFAULT, offset: int = 0, version: Optional[str] = None
+    ):
+        terms, prefix = parse_query(query)
+        if not terms and not prefix:
+            raise InvalidTodoQueryException("Search query must contain at least one word")
+        if not 1 <= limit <= AppConfig.TODO_PAGE_SIZE_MAX:
+            raise InvalidTodoQueryException(f"limit must be between 1 and {AppConfig.TODO_PAGE_SIZE_MAX}")
+        if offset < 0:
+            raise InvalidTodoQueryException("offset must not be negative")
+        # Only the newest TODO_SEARCH_MAX_CANDIDATES matches are ranked; pages past them would be empty.
+        if offset + limit > AppConfig.TODO_SEARCH_MAX_CANDIDATES:
+            raise InvalidTodoQueryException(f"offset + limit must not exceed {AppConfig.TODO_SEARCH_MAX_CANDIDATES}")
+        if prefix and not terms and len(prefix) < AppConfig.TODO_SEARCH_PREFIX_MIN_LENGTH:
+            raise InvalidTodoQueryException(
+                f"A search for a prefix alone needs at least {AppConfig.TODO_SEARCH_PREFIX_MIN_LENGTH} characters"
+            )
+        if prefix:
+            prefix = prefix[:AppConfig.TODO_SEARCH_PREFIX_MAX_LENGTH]
+
+        async def load():
+            todos = await TodoService._repository().search(terms, prefix, take=limit + 1, skip=offset)
+            has_more = len(todos) > limit
+            return {
+                "todos": todos[:limit],
+                "next_offset": offset + limit if has_more else None,
+                "matched_prefix": prefix,
+                "candidate_limit": AppConfig.TODO_SEARCH_MAX_CANDIDATES,
+            }
+
+        return await TodoService._cached_read(
+            lambda version: TodoCache.list_key(version, "search", terms, prefix, limit, offset), load, version
+        )
+
+    @staticmethod
+    @timed_phase("service")
+    @database_limiter.limit
+    async def get_changes(since: Optional[str] = None, limit: int = AppConfig.TODO_PAGE_SIZE_DEFAULT):
+        if not 1 <= limit <= AppConfig.TODO_PAGE_SIZE_MAX:
+            raise InvalidTodoQueryException(f"limit must be between 1 and {AppConfig.TODO_PAGE_SIZE_MAX}")
+        position = TodoService._decode_change_token(since) if since else None
+
+        now = int(time.time() * 1000)
+        if position and position[0] < now - AppConfig.TODO_TOMBSTONE_RETENTION_SECONDS * 1000:
+            raise TodoChangesExpiredException(f"Sync token {since} is older than the tombstone retention")
+
+        # Writes stamped in the last moments may still be committing with an earlier timestamp
+        # than ones already visible, so the feed stops short of them rather than skip them.
+        until = now - int(AppConfig.TODO_CHANGES_SETTLE_SECONDS * 1000)
+        changes = await TodoService._repository().changes(position, until=until, take=limit + 1)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        return {
+            "changes": [{"id": change.id, "deleted": change.todo is None, "todo": change.todo} for change in changes],
+            "next_token": TodoService._encode_change_token(changes[-1].position) if changes else since,
+            "has_more": has_more,
+        }
+
+    @staticmethod
+    @timed_phase("service")
+    @database_limiter.limit
+    async def get_collection_version() -> str:
+        # Never cached or shared between requests: it is what tells other workers' writes apart.
+        return await TodoService._repository().collection_version()
+
+    @staticmethod
+    async def iter_todo_batches(batch_size: int = AppConfig.TODO_EXPORT_BATCH_SIZE):
+        last_id = None
+        while True:
+            todos = await TodoService._repository().find_page(take=batch_size, after=last_id)
+            if todos:
+                yield todos
+            if len(todos) < batch_size:
+                return
+            last_id = todos[-1].id
+
+    @staticmethod
+    @timed_phase("service")
+    @database_limiter.limit
     async def create_todo(todo: CreateTodoRequestModel):
-        return await DatabaseRepository.get_client().todo.create(data=todo.to_dict())
+        if AppConfig.TODO_CREATE_BATCHING_ENABLED:
+            created = await TodoService._create_batcher().submit({"id": new_object_id(), **todo.to_dict()})
+        else:
+            created = await TodoService._repository().create(todo.to_dict())
+        TodoEvents.publish("created", created.id, created)
+        return created
     
     @staticmethod
+    @timed_phase("service")
+    @database_limiter.limit
     async def update_todo(todo_id: str, todo: UpdateTodoRequestModel):
-        await TodoService._get_todo_by_id(todo_id)
-        return await DatabaseRepository.get_client().todo.update(where={"id": todo_id}, data=todo.to_dict())
+        TodoService._validate_todo_id(todo_id)
+        updated = await TodoService._repository().update(todo_id, todo.to_dict())
+        if not updated:
+            raise TodoNotFoundException(f"Todo with id {todo_id} not found")
+        TodoEvents.publish("updated", todo_id, updated)
+        return updated
     
     @staticmethod
+    @timed_phase("service")
+    @database_limiter.limit
     async def delete_todo(todo_id: str):
-        await TodoService._get_todo_by_id(todo_id)
-        return await DatabaseRepository.get_client().todo.delete(where={"id": todo_id})
+        TodoService._validate_todo_id(todo_id)
+        deleted = await TodoService._repository().delete(todo_id)
+        if not deleted:
+            raise TodoNotFoundException(f"Todo with id {todo_id} not found")
+        TodoEvents.publish("deleted", todo_id)
+        return deleted
     
     @staticmethod
-    async def _get_todo_by_id(todo_id: str):
-        todo = await DatabaseRepository.get_client().todo.find_unique(where={"id": todo_id})
-        if not todo:
-            raise TodoNotFoundException(f"Todo with id {todo_id} not found")
-        return todo
-    
\ No newline at end of file
+    @timed_phase("service")
+    @database_limiter.limit
+    async def create_todos(todos: List[CreateTodoRequestModel]) -> List[Dict[str, Any]]:
+        # Ids are generated here so a single create_many can still report each new todo.
+        # Titles repeated within the request are rejected up front; a title that already exists
+        # fails only its own item (see _insert_rows).
+        requested: List[Optional[Dict[str, Any]]] = []
+        rows = []
+        titles = set()
+        for todo in todos:
+            if todo.title in titles:
+                requested.append(None)
+                continue
+            titles.add(todo.title)
+            row = {"id": new_object_id(), **todo.to_dict()}
+            requested.append(row)
+            rows.append(row)
+
+        failures = await TodoService._insert_rows(rows)
+        for row in rows:
+            if row["id"] not in failures:
+                TodoEvents.publish("created", row["id"], row)
+        return [
+            TodoService._bulk_result(None, TodoAlreadyExistsException)
+            if row is None or row["id"] in failures
+            else TodoService._bulk_result(row["id"], data=row)
+            for row in requested
+        ]
+
+    @staticmethod
+    @timed_phase("service")
+    @database_limiter.limit
+    async def update_todos(todos: List[BulkUpdateTodoItemRequestModel]) -> List[Dict[str, Any]]:
+        existing = await TodoService._find_existing([todo.id for todo in todos])
+
+        results = []
+        positions: Dict[str, int] = {}
+        updates = []
+        titles = set()
+        for todo in todos:
+            if not is_object_id(todo.id):
+                results.append(TodoService._bulk_result(todo.id, InvalidTodoIdException))
+                continue
+            if todo.id in positions:
+                # One write per todo: a repeated id is rejected rather than merged into the first.
+                results.append(TodoService._bulk_result(todo.id, DuplicateTodoIdException))
+                continue
+            if todo.id not in existing:
+                results.append(TodoService._bulk_result(todo.id, TodoNotFoundException))
+                continue
+            if todo.title is not None:
+                if todo.title in titles:
+                    results.append(TodoService._bulk_result(todo.id, TodoAlreadyExistsException))
+                    continue
+                titles.add(todo.title)
+
+            data = {key: value for key, value in todo.to_dict().items() if key != "id" and value is not None}
+            positions[todo.id] = len(results)
+            results.append(None)
+            updates.append((todo.id, data))
+
+        if updates:
+            outcomes = await TodoService._update_rows(updates)
+            for todo_id, _ in updates:
+                outcome = outcomes.get(todo_id) or TodoNotFoundException(f"Todo with id {todo_id} not found")
+                if isinstance(outcome, Exception):
+                    results[positions[todo_id]] = TodoService._bulk_result(todo_id, type(outcome))
+                    continue
+                results[positions[todo_id]] = TodoService._bulk_result(todo_id, data=outcome)
+                TodoEvents.publish("updated", todo_id, outcome)
+        return results
+
+    @staticmethod
+    @timed_phase("service")
+    @database_limiter.limit
+    async def delete_todos(todo_ids: List[str]) -> List[Dict[str, Any]]:
+        existing = await TodoService._find_existing(todo_ids)
+
+        results = []
+        for todo_id in todo_ids:
+            if not is_object_id(todo_id):
+                results.append(TodoService._bulk_result(todo_id, InvalidTodoIdException))
+            elif todo_id not in existing:
+                results.append(TodoService._bulk_result(todo_id, TodoNotFoundException))
+            else:
+                results.append(TodoService._bulk_result(todo_id, data=existing.pop(todo_id)))
+
+        deleted_ids = [result["id"] for result in results if result["status_code"] == 200]
+        if deleted_ids:
+            await TodoService._repository().delete_many(deleted_ids)
+            for todo_id in deleted_ids:
+                TodoEvents.publish("deleted", todo_id)
+        return results
+
+    @staticmethod
+    async def _cached_read(
+        make_key: Callable[[str], str], load: Callable[[], Awaitable[Any]], version: Optional[str] = None
+    ) -> Any:
+        """Serve a read from TodoCache, else load it, with concurrent identical reads sharing one
+        load. Both are keyed by the collection version, read before the load unless the caller
+        already has it: once a write commits on any worker, later reads use new keys and never
+        join a load that started before it."""
+        if not TodoCache.enabled and not AppConfig.TODO_READ_COALESCING_ENABLED:
+            return await database_limiter.limit(load)()
+        if version is None:
+            version = await database_limiter.limit(TodoService._repository().collection_version)()
+        cache_key = make_key(version)
+        cached = TodoCache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        async def load_and_cache():
+            result = await database_limiter.limit(load)()
+            TodoCache.set(cache_key, result)
+            return result
+
+        if not AppConfig.TODO_READ_COALESCING_ENABLED:
+            return await load_and_cache()
+        return await TodoService.reads.do(cache_key, load_and_cache)
+
+    @staticmethod
+    async def _count(filters: Optional[TodoFilter], version: Optional[str] = None) -> int:
+        return await TodoService._cached_read(
+            lambda version: TodoCache.list_key(version, "count", filters),
+            lambda: TodoService._repository().count(filters),
+            version,
+        )
+
+    @staticmethod
+    async def _check_unindexed_scan(filters: Optional[TodoFilter]):
+        """Content matching has no index to use: unless a title filter narrows it first, it scans
+        every todo, so it is refused once the collection is larger than the configured limit."""
+        if filters is None or filters.content_contains is None:
+            return
+        if filters.title is not None or filters.title_prefix is not None:
+            return
+        if await TodoService._count(None) > AppConfig.TODO_UNINDEXED_SCAN_MAX_TODOS:
+            raise InvalidTodoQueryException(
+                f"content_contains needs a title or title_prefix filter on more than "
+                f"{AppConfig.TODO_UNINDEXED_SCAN_MAX_TODOS} todos"
+            )
+
+    @staticmethod
+    def _create_batcher() -> WriteBatcher:
+        if TodoService.create_batcher is None:
+            TodoService.create_batcher = WriteBatcher(
+                TodoService._create_batch,
+                max_batch=AppConfig.TODO_CREATE_BATCH_MAX_SIZE,
+                max_delay=AppConfig.TODO_CREATE_BATCH_MAX_DELAY_SECONDS,
+            )
+        return TodoService.create_batcher
+
+    @staticmethod
+    async def _create_batch(rows: List[Dict[str, Any]]) -> List[Any]:
+        """Insert concurrent create_todo calls with one create_many, then read them back so each
+        caller gets its stored todo. Two round-trips per batch, whatever its size. A row that is
+        not read back fails only its own caller."""
+        repository = TodoService._repository()
+        failures: Dict[str, Exception] = {}
+        titles = set()
+        for row in rows:
+            if row["title"] in titles:
+                failures[row["id"]] = TodoAlreadyExistsException(f"Todo with title {row['title']} already exists")
+            titles.add(row["title"])
+        insert = [row for row in rows if row["id"] not in failures]
+        failures.update(await TodoService._insert_rows(insert))
+
+        created = await repository.find_by_ids([row["id"] for row in insert if row["id"] not in failures])
+        created = {todo.id: todo for todo in created}
+        return [
+            failures.get(row["id"])
+            or created.get(row["id"])
+            or TodoNotFoundException(f"Todo with id {row['id']} was not found after it was created")
+            for row in rows
+        ]
+
+    @staticmethod
+    async def _insert_rows(rows: List[Dict[str, Any]]) -> Dict[str, Exception]:
+        """create_many, and when some title is taken, the failing rows by id. An ordered insert
+        may have stored the rows up to the failing one, so those are kept and the rest are
+        created one by one: only the rows with a taken title fail."""
+        if not rows:
+            return {}
+        repository = TodoService._repository()
+        try:
+            await repository.create_many(rows)
+            return {}
+        except TodoAlreadyExistsException:
+            pass
+
+        failures: Dict[str, Exception] = {}
+        inserted = {todo.id for todo in await repository.find_by_ids([row["id"] for row in rows])}
+        for row in rows:
+            if row["id"] in inserted:
+                continue
+            try:
+                await repository.create(row)
+            except TodoAlreadyExistsException as e:
+                failures[row["id"]] = e
+        return failures
+
+    @staticmethod
+    async def _update_rows(updates: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """update_many, and when it fails on a taken title or a todo deleted since it was read,
+        one update per todo instead. update_many is atomic, so nothing was applied yet. Returns
+        the outcome by id: the updated todo as stored, or the exception."""
+        repository = TodoService._repository()
+        try:
+            return {todo.id: todo for todo in await repository.update_many(updates)}
+        except (TodoAlreadyExistsException, TodoNotFoundException):
+            pass
+
+        outcomes: Dict[str, Any] = {}
+        for todo_id, data in updates:
+            try:
+                updated = await repository.update(todo_id, data)
+            except TodoAlreadyExistsException as e:
+                outcomes[todo_id] = e
+                continue
+            outcomes[todo_id] = updated if updated is not None else TodoNotFoundException(f"Todo with id {todo_id} not found")
+        return outcomes
+
+    @staticmethod
+    async def _find_existing(todo_ids: List[str]) -> Dict[str, Any]:
+        valid_ids = list({todo_id for todo_id in todo_ids if is_object_id(todo_id)})
+        if not valid_ids:
+            return {}
+        todos = await TodoService._repository().find_by_ids(valid_ids)
+        return {todo.id: todo for todo in todos}
+
+    @staticmethod
+    def _repository() -> TodoRepository:
+        return TodoRepositoryProvider.get_repository()
+
+    @staticmethod
+    def _bulk_result(todo_id: str, exception: Optional[type] = None, data: Any = None) -> Dict[str, Any]:
+        if exception:
+            return {"id": todo_id, "status_code": exception.status_code, "msg": exception.msg, "data": None}
+        return {"id": todo_id, "status_code": 200, "msg": "succeed", "data": data}
+
+    @staticmethod
+    def _validate_todo_id(todo_id: str):
+        if not is_object_id(todo_id):
+            raise InvalidTodoIdException(f"Invalid todo id {todo_id}")
+
+    @staticmethod
+    def _encode_change_token(position: Tuple[int, str]) -> str:
+        return TodoService._encode_cursor(f"{position[0]}.{position[1]}")
+
+    @staticmethod
+    def _decode_change_token(token: str) -> Tuple[int, str]:
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            millis, todo_id = base64.urlsafe_b64decode(padded.encode()).decode().split(".")
+            position = (int(millis), todo_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise InvalidTodoQueryException(f"Invalid sync token {token}")
+        if not is_object_id(todo_id):
+            raise InvalidTodoQueryException(f"Invalid sync token {token}")
+        return position
+
+    @staticmethod
+    def _encode_cursor(todo_id: str) -> str:
+        return base64.urlsafe_b64encode(todo_id.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str, object_id: bool = True) -> str:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            key = base64.urlsafe_b64decode(padded.encode()).decode()
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise InvalidTodoQueryException(f"Invalid cursor {cursor}")
+        if object_id and not is_object_id(key):
+            raise InvalidTodoQueryException(f"Invalid cursor {cursor}")
+        return key
@@ -0,0 +1,55 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+class WriteBatcher:
+    """Groups concurrent submissions into one `flush` call (group commit).
+
+    A batch is flushed once it holds `max_batch` items or `max_delay` seconds after its
+    first item arrived, whichever comes first. `flush` returns one result per item, in
+    order; an Exception in that list is raised to that item's caller only, while an
+    exception raised by `flush` itself fails the whole batch.
+    """
+
+    def __init__(self, flush: Callable[[List[Any]], Awaitable[List[Any]]], max_batch: int, max_delay: float):
+        self.flush = flush
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.pending: List[Tuple[Any, asyncio.Future]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.flushing: Set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((item, future))
+        if len(self.pending) >= self.max_batch:
+            self._flush_pending()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.max_delay, self._flush_pending)
+        return await future
+
+    def _flush_pending(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self.flushing.add(task)
+            task.add_done_callback(self.flushing.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]):
+        try:
+            results = await self.flush([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
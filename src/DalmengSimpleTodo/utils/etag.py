@@ -0,0 +1,21 @@
+import hashlib
+from typing import Optional
+
+def make_etag(*parts: str) -> str:
+    """Strong ETag for a response that is fully determined by `parts`."""
+    digest = hashlib.sha1("\x00".join(parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses the weak comparison (RFC 9110 13.1.2), so W/ prefixes are ignored."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
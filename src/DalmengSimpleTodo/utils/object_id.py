@@ -0,0 +1,28 @@
+import os
+import random
+import re
+import threading
+import time
+
+OBJECT_ID_PATTERN = re.compile(r"[0-9a-fA-F]{24}")
+
+_lock = threading.Lock()
+_pid = None
+_process_unique = b""
+_counter = 0
+
+def is_object_id(value: str) -> bool:
+    return OBJECT_ID_PATTERN.fullmatch(value) is not None
+
+def new_object_id() -> str:
+    """Generate a MongoDB ObjectId (timestamp, per-process random, counter) without a database round-trip."""
+    global _pid, _process_unique, _counter
+    with _lock:
+        # Re-seed after fork so worker processes never hand out the same ids.
+        if _pid != os.getpid():
+            _pid = os.getpid()
+            _process_unique = os.urandom(5)
+            _counter = random.randint(0, 0xFFFFFF)
+        _counter = (_counter + 1) % 0x1000000
+        counter = _counter
+    return (int(time.time()).to_bytes(4, "big") + _process_unique + counter.to_bytes(3, "big")).hex()
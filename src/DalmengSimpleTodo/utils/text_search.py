@@ -0,0 +1,54 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"\w+")
+TITLE_WEIGHT = 2
+CONTENT_WEIGHT = 1
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+def prefixes(text: Optional[str], max_length: int, min_length: int = 1) -> List[str]:
+    """Every prefix, from `min_length` up to `max_length` characters, of the words in `text`."""
+    return sorted({
+        term[:length] for term in tokenize(text) for length in range(min_length, min(len(term), max_length) + 1)
+    })
+
+def parse_query(query: str) -> Tuple[List[str], Optional[str]]:
+    """Split a search query into exact terms and a trailing prefix term.
+
+    The last word is matched as a prefix (search-as-you-type) unless the query ends with a space.
+    """
+    tokens = tokenize(query)
+    if not tokens or query[-1:].isspace():
+        return tokens, None
+    return tokens[:-1], tokens[-1]
+
+def term_weights(title: Optional[str], content: Optional[str]) -> Dict[str, int]:
+    weights: Dict[str, int] = {}
+    for term in tokenize(title):
+        weights[term] = weights.get(term, 0) + TITLE_WEIGHT
+    for term in tokenize(content):
+        weights[term] = weights.get(term, 0) + CONTENT_WEIGHT
+    return weights
+
+def score(todo: Any, terms: List[str], prefix: Optional[str]) -> int:
+    """Sum of term weights when the todo matches every term (and the prefix), else 0."""
+    weights = term_weights(todo.title, todo.content)
+    total = 0
+    for term in terms:
+        if term not in weights:
+            return 0
+        total += weights[term]
+    if prefix:
+        prefix_weight = sum(weight for term, weight in weights.items() if term.startswith(prefix))
+        if not prefix_weight:
+            return 0
+        total += prefix_weight
+    return total
+
+def rank(todos: List[Any], terms: List[str], prefix: Optional[str]) -> List[Any]:
+    scored = [(score(todo, terms, prefix), todo) for todo in todos]
+    scored = [(todo_score, todo) for todo_score, todo in scored if todo_score]
+    scored.sort(key=lambda item: (-item[0], item[1].id))
+    return [todo for _, todo in scored]
@@ -0,0 +1,54 @@
+import pytest
+from fastapi import Request
+from httpx import ASGITransport, AsyncClient
+
+from DalmengSimpleTodo.admission.body_size_limit_middleware import BodySizeLimitMiddleware
+from DalmengSimpleTodo.models.base_model import BaseResponseModel
+
+async def echo_app(scope, receive, send):
+    body = await Request(scope, receive).body()
+    await BaseResponseModel.succeed(data=len(body))(scope, receive, send)
+
+def client_for(max_bytes):
+    return AsyncClient(transport=ASGITransport(app=BodySizeLimitMiddleware(echo_app, max_bytes=max_bytes)),
+                       base_url="http://test")
+
+async def chunks(*parts):
+    for part in parts:
+        yield part
+
+class TestBodySizeLimitMiddleware:
+    @pytest.mark.asyncio
+    async def test_body_within_limit_is_passed_on(self):
+        async with client_for(10) as client:
+            response = await client.post("/", content=b"x" * 10)
+
+        assert response.json()["data"] == 10
+
+    @pytest.mark.asyncio
+    async def test_declared_length_over_limit_is_rejected(self):
+        async with client_for(10) as client:
+            response = await client.post("/", content=b"x" * 11)
+
+        assert response.status_code == 413
+        assert response.json() == {"status_code": 413, "msg": "Request body too large.", "data": None}
+
+    @pytest.mark.asyncio
+    async def test_streamed_body_over_limit_is_rejected(self):
+        async with client_for(10) as client:
+            response = await client.post("/", content=chunks(b"x" * 6, b"x" * 6))
+
+        assert response.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_streamed_body_over_limit_is_rejected_by_the_app(self, test_client):
+        # FastAPI's body parsing turns errors raised while reading into a 400, so the 413 has
+        # to come from the middleware itself.
+        from DalmengSimpleTodo.config.app_config import AppConfig
+        half = b" " * (AppConfig.REQUEST_BODY_MAX_BYTES // 2 + 1)
+
+        response = await test_client.post("/api/v1/todo/bulk", content=chunks(b'{"todos": [', half, half, b"]}"),
+                                          headers={"Content-Type": "application/json"})
+
+        assert response.status_code == 413
+        assert response.json() == {"status_code": 413, "msg": "Request body too large.", "data": None}
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from DalmengSimpleTodo.admission.concurrency_limiter import ConcurrencyLimiter
+from DalmengSimpleTodo.exceptions.admission_exception import ServiceOverloadedException
+
+def limited_sleep(limiter):
+    @limiter.limit
+    async def call(seconds):
+        await asyncio.sleep(seconds)
+        return seconds
+    return call
+
+class TestConcurrencyLimiter:
+    @pytest.mark.asyncio
+    async def test_waiting_callers_get_the_released_slots(self):
+        limiter = ConcurrencyLimiter(max_concurrency=2, max_queue=10, queue_timeout=1)
+        call = limited_sleep(limiter)
+
+        calls = [asyncio.ensure_future(call(0.01)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert limiter.stats() == {"in_flight": 2, "waiting": 3, "rejected": 0}
+
+        assert await asyncio.gather(*calls) == [0.01] * 5
+        assert limiter.stats() == {"in_flight": 0, "waiting": 0, "rejected": 0}
+
+    @pytest.mark.asyncio
+    async def test_full_queue_is_rejected_at_once(self):
+        limiter = ConcurrencyLimiter(max_concurrency=1, max_queue=1, queue_timeout=1, retry_after=3)
+        call = limited_sleep(limiter)
+
+        running = [asyncio.ensure_future(call(0.01)) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceOverloadedException) as error:
+            await call(0)
+
+        assert error.value.retry_after == 3
+        await asyncio.gather(*running)
+        assert limiter.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_is_rejected(self):
+        limiter = ConcurrencyLimiter(max_concurrency=1, max_queue=10, queue_timeout=0.01)
+        call = limited_sleep(limiter)
+
+        running = asyncio.ensure_future(call(0.1))
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceOverloadedException):
+            await call(0)
+
+        await running
+        assert limiter.stats() == {"in_flight": 0, "waiting": 0, "rejected": 1}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_a_slot(self):
+        limiter = ConcurrencyLimiter(max_concurrency=1, max_queue=10, queue_timeout=1)
+        call = limited_sleep(limiter)
+
+        running = asyncio.ensure_future(call(0.01))
+        waiter = asyncio.ensure_future(call(0))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await running
+
+        assert await call(0) == 0
+        assert limiter.stats() == {"in_flight": 0, "waiting": 0, "rejected": 0}
+
+    @pytest.mark.asyncio
+    async def test_zero_disables_the_limit(self):
+        limiter = ConcurrencyLimiter(max_concurrency=0, max_queue=0, queue_timeout=0)
+
+        assert await asyncio.gather(*(limited_sleep(limiter)(0) for _ in range(10))) == [0] * 10
@@ -0,0 +1,100 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from DalmengSimpleTodo.admission.rate_limit_middleware import RateLimitMiddleware, RateLimitRule
+from DalmengSimpleTodo.admission.token_bucket import TokenBucketLimiter
+from DalmengSimpleTodo.models.base_model import BaseResponseModel
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+async def ok_app(scope, receive, send):
+    await BaseResponseModel.succeed()(scope, receive, send)
+
+def client_for(middleware):
+    return AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test")
+
+class TestTokenBucketLimiter:
+    def test_burst_then_refill(self):
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(clock=clock)
+
+        assert [limiter.acquire("client", rate=2, burst=3) for _ in range(3)] == [0, 0, 0]
+        assert limiter.acquire("client", rate=2, burst=3) == pytest.approx(0.5)
+
+        clock.now = 0.5
+        assert limiter.acquire("client", rate=2, burst=3) == 0
+        assert limiter.acquire("other", rate=2, burst=3) == 0
+
+    def test_least_recently_used_client_is_dropped(self):
+        limiter = TokenBucketLimiter(max_keys=2, clock=FakeClock())
+        for key in ("a", "b", "a", "c"):
+            limiter.acquire(key, rate=1, burst=5)
+
+        assert list(limiter.buckets) == ["a", "c"]
+
+    def test_zero_rate_is_rejected(self):
+        with pytest.raises(ValueError):
+            TokenBucketLimiter(clock=FakeClock()).acquire("client", rate=0, burst=1)
+        with pytest.raises(ValueError):
+            RateLimitRule.parse("POST /api/v1/todo=0/10")
+
+class TestRateLimitMiddleware:
+    def test_parse_rules(self):
+        rules = RateLimitRule.parse("POST /api/v1/todo=10/20; * /api/v1/todo/{todo_id}=0.5/1")
+
+        assert rules == [
+            RateLimitRule("POST", ("api", "v1", "todo"), 10, 20),
+            RateLimitRule("*", ("api", "v1", "todo", "*"), 0.5, 1),
+        ]
+        assert rules[1].matches("DELETE", ("api", "v1", "todo", "67e42cbd23fd49969709329a"))
+        assert not rules[0].matches("GET", ("api", "v1", "todo"))
+
+    @pytest.mark.asyncio
+    async def test_rejects_with_retry_after_once_the_bucket_is_empty(self):
+        middleware = RateLimitMiddleware(ok_app, rules=RateLimitRule.parse("POST /api/v1/todo=0.5/2"), default_rate=0)
+
+        async with client_for(middleware) as client:
+            statuses = [(await client.post("/api/v1/todo")).status_code for _ in range(2)]
+            rejected = await client.post("/api/v1/todo")
+            unlimited = await client.get("/api/v1/todo")
+
+        assert statuses == [200, 200]
+        assert rejected.status_code == 429
+        assert rejected.headers["retry-after"] == "2"
+        assert rejected.json()["status_code"] == 429
+        assert unlimited.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_clients_are_limited_separately(self):
+        middleware = RateLimitMiddleware(
+            ok_app, rules=[], default_rate=1, default_burst=1, client_header="X-Forwarded-For", trusted_proxies=1
+        )
+
+        async with client_for(middleware) as client:
+            first = await client.get("/api/v1/todo", headers={"X-Forwarded-For": "10.0.0.9, 10.0.0.1"})
+            second = await client.get("/api/v1/todo", headers={"X-Forwarded-For": "10.0.0.2"})
+            repeated = await client.get("/api/v1/todo", headers={"X-Forwarded-For": "10.0.0.1"})
+            health = await client.get("/health/live", headers={"X-Forwarded-For": "10.0.0.1"})
+
+        assert [first.status_code, second.status_code, repeated.status_code, health.status_code] == [200, 200, 429, 200]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("trusted_proxies", [0, 2])
+    async def test_spoofed_forwarded_for_entries_do_not_bypass_the_limit(self, trusted_proxies):
+        middleware = RateLimitMiddleware(
+            ok_app, rules=[], default_rate=1, default_burst=1, client_header="X-Forwarded-For",
+            trusted_proxies=trusted_proxies,
+        )
+
+        async with client_for(middleware) as client:
+            statuses = [
+                (await client.get("/api/v1/todo", headers={"X-Forwarded-For": f"1.1.1.{i}, 10.0.0.1, 10.0.0.254"})).status_code
+                for i in range(3)
+            ]
+
+        assert statuses == [200, 429, 429]
@@ -1,21 +1,88 @@
+import json
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
+
+from DalmengSimpleTodo.exceptions.todo_exception import InvalidTodoIdException, TodoNotFoundException
+
+COLLECTION_VERSION = "DalmengSimpleTodo.service.todo_service.TodoService.get_collection_version"
 
 class TestTodo:
+    # ==============================================================
+    # [GET] /health/live, /health/ready
+    # ==============================================================
+
+    @pytest.mark.asyncio
+    async def test_health_live(self, test_client):
+        response = await test_client.get("/health/live")
+
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.is_ready")
+    async def test_health_ready(self, mock_is_ready, test_client):
+        mock_is_ready.return_value = True
+
+        response = await test_client.get("/health/ready")
+
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.is_ready")
+    async def test_health_ready_failed_with_database_down(self, mock_is_ready, test_client):
+        mock_is_ready.return_value = False
+
+        response = await test_client.get("/health/ready")
+        response = response.json()
+
+        assert response["status_code"] == 503
+
+    # ==============================================================
+    # [GET] /metrics
+    # ==============================================================
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_metrics_records_request_phases(self, mock_get_client, test_client):
+        from unittest.mock import AsyncMock
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.find_many.return_value = []
+        mock_prisma.todo.find_first.return_value = None
+        mock_prisma.todotombstone.find_first.return_value = None
+
+        await test_client.get("/api/v1/todo")
+        await test_client.get("/api/v1/todo?limit=0")
+        response = await test_client.get("/metrics")
+
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'http_requests_total{method="GET",route="/api/v1/todo",status_code="200"}' in response.text
+        assert 'http_requests_total{method="GET",route="/api/v1/todo",status_code="422"}' in response.text
+        for phase in ("service", "serialization", "framework_overhead"):
+            assert f'route="/api/v1/todo",phase="{phase}",le="+Inf"' in response.text
+        assert 'http_response_size_bytes_count{method="GET",route="/api/v1/todo"}' in response.text
+        assert "todo_cache_misses_total" in response.text
+        assert "todo_read_dedup_ratio" in response.text
+        assert "/metrics" not in response.text
+
     # ==============================================================
     # [GET] /api/v1/todo
     # ==============================================================
 
     @pytest.mark.asyncio
+    @patch(COLLECTION_VERSION, AsyncMock(return_value="v1"))
     @patch("DalmengSimpleTodo.service.todo_service.TodoService.get_todos")
     async def test_get_todos_success(self, mock_get_todos, test_client):
-        mock_get_todos.return_value = [
-            {
-                "id": "67e42cbd23fd49969709329a",
-                "title": "Test",
-                "content": "Mocked content"
-            }
-        ]
+        mock_get_todos.return_value = {
+            "todos": [
+                {
+                    "id": "67e42cbd23fd49969709329a",
+                    "title": "Test",
+                    "content": "Mocked content"
+                }
+            ],
+            "next_cursor": None,
+            "prev_cursor": None
+        }
 
         response = await test_client.get("/api/v1/todo")
         response = response.json()
@@ -24,6 +91,81 @@ class TestTodo:
         assert response["data"] == mock_get_todos.return_value
 
     @pytest.mark.asyncio
+    @patch(COLLECTION_VERSION, AsyncMock(return_value="v1"))
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.get_todos")
+    async def test_get_todos_with_pagination_and_fields(self, mock_get_todos, test_client):
+        mock_get_todos.return_value = {
+            "todos": [{"id": "67e42cbd23fd49969709329a", "title": "Test"}],
+            "next_cursor": "NjdlNDJjYmQyM2ZkNDk5Njk3MDkzMjlh",
+            "prev_cursor": None
+        }
+
+        response = await test_client.get("/api/v1/todo?limit=1&after=abc&fields=id,title")
+        response = response.json()
+
+        mock_get_todos.assert_awaited_once_with(
+            limit=1, after="abc", before=None, fields=["id", "title"], filters=None, sort="id", version="v1"
+        )
+        assert response["status_code"] == 200
+        assert response["data"]["next_cursor"] == "NjdlNDJjYmQyM2ZkNDk5Njk3MDkzMjlh"
+
+    @pytest.mark.asyncio
+    @patch(COLLECTION_VERSION, AsyncMock(return_value="v1"))
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.get_todos")
+    async def test_get_todos_with_filters_and_sort(self, mock_get_todos, test_client):
+        from DalmengSimpleTodo.database.todo_repository import TodoFilter
+        mock_get_todos.return_value = {"todos": [], "next_cursor": None, "prev_cursor": None}
+
+        response = await test_client.get("/api/v1/todo?title_prefix=Work&content_contains=milk&sort=-title")
+
+        mock_get_todos.assert_awaited_once_with(
+            limit=50, after=None, before=None, fields=None,
+            filters=TodoFilter(title_prefix="Work", content_contains="milk"), sort="-title", version="v1",
+        )
+        assert response.json()["status_code"] == 200
+
+    @pytest.mark.asyncio
+    @patch(COLLECTION_VERSION, AsyncMock(return_value="v1"))
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.count_todos")
+    async def test_get_todos_count_only(self, mock_count_todos, test_client):
+        from DalmengSimpleTodo.database.todo_repository import TodoFilter
+        mock_count_todos.return_value = 7
+
+        response = await test_client.get("/api/v1/todo?count_only=true&title=Work")
+
+        mock_count_todos.assert_awaited_once_with(TodoFilter(title="Work"), version="v1")
+        assert response.json()["data"] == {"count": 7}
+        assert response.headers["etag"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query", ["sort=content", "title=", "title_prefix=" + "x" * 201])
+    async def test_get_todos_failed_with_invalid_filter(self, test_client, query):
+        response = await test_client.get(f"/api/v1/todo?{query}")
+        response = response.json()
+
+        assert response["status_code"] == 422
+
+    @pytest.mark.asyncio
+    async def test_get_todos_failed_with_limit_out_of_range(self, test_client):
+        response = await test_client.get("/api/v1/todo?limit=0")
+        response = response.json()
+
+        assert response["status_code"] == 422
+
+    @pytest.mark.asyncio
+    @patch(COLLECTION_VERSION, AsyncMock(return_value="v1"))
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.get_todos")
+    async def test_get_todos_failed_with_invalid_query(self, mock_get_todos, test_client):
+        from DalmengSimpleTodo.exceptions.todo_exception import InvalidTodoQueryException
+        mock_get_todos.side_effect = InvalidTodoQueryException("Invalid cursor")
+
+        response = await test_client.get("/api/v1/todo?after=not-a-cursor")
+        response = response.json()
+
+        assert response["status_code"] == 400
+
+    @pytest.mark.asyncio
+    @patch(COLLECTION_VERSION, AsyncMock(return_value="v1"))
     @patch("DalmengSimpleTodo.service.todo_service.TodoService.get_todos")
     async def test_get_todos_failed_with_prisma_error(self, mock_get_todos, test_client):
         mock_get_todos.side_effect = Exception("Prisma Error")
@@ -33,6 +175,197 @@ class TestTodo:
 
         assert response["status_code"] == 500
 
+    @pytest.mark.asyncio
+    @patch(COLLECTION_VERSION, AsyncMock(return_value="v1"))
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.get_todos")
+    async def test_get_todos_returns_etag_and_not_modified(self, mock_get_todos, test_client):
+        mock_get_todos.return_value = {"todos": [], "next_cursor": None, "prev_cursor": None}
+
+        response = await test_client.get("/api/v1/todo?limit=10")
+        etag = response.headers["etag"]
+        not_modified = await test_client.get("/api/v1/todo?limit=10", headers={"If-None-Match": f'W/{etag}, "other"'})
+        other_page = await test_client.get("/api/v1/todo?limit=20", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+        assert other_page.status_code == 200
+        assert other_page.headers["etag"] != etag
+        assert mock_get_todos.await_count == 2
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.get_todos")
+    async def test_get_todos_etag_changes_with_collection_version(self, mock_get_todos, test_client):
+        mock_get_todos.return_value = {"todos": [], "next_cursor": None, "prev_cursor": None}
+
+        with patch(COLLECTION_VERSION, AsyncMock(return_value="v1")):
+            etag = (await test_client.get("/api/v1/todo")).headers["etag"]
+        with patch(COLLECTION_VERSION, AsyncMock(return_value="v2")):
+            response = await test_client.get("/api/v1/todo", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    # ==============================================================
+    # [GET] /api/v1/todo/search
+    # ==============================================================
+
+    @pytest.mark.asyncio
+    @patch(COLLECTION_VERSION, AsyncMock(return_value="v1"))
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.search_todos")
+    async def test_search_todos_success(self, mock_search_todos, test_client):
+        mock_search_todos.return_value = {
+            "todos": [{"id": "67e42cbd23fd49969709329a", "title": "Buy milk", "content": "Content"}],
+            "next_offset": None,
+            "matched_prefix": "milk",
+            "candidate_limit": 1000,
+        }
+
+        response = await test_client.get("/api/v1/todo/search?q=milk&limit=5&offset=10")
+        response = response.json()
+
+        mock_search_todos.assert_awaited_once_with("milk", limit=5, offset=10, version="v1")
+        assert response["status_code"] == 200
+        assert response["data"] == mock_search_todos.return_value
+
+    @pytest.mark.asyncio
+    async def test_search_todos_failed_with_missing_query(self, test_client):
+        response = await test_client.get("/api/v1/todo/search")
+        response = response.json()
+
+        assert response["status_code"] == 422
+
+    @pytest.mark.asyncio
+    @patch(COLLECTION_VERSION, AsyncMock(return_value="v1"))
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.search_todos")
+    async def test_search_todos_failed_with_invalid_query(self, mock_search_todos, test_client):
+        from DalmengSimpleTodo.exceptions.todo_exception import InvalidTodoQueryException
+        mock_search_todos.side_effect = InvalidTodoQueryException("Search query must contain at least one word")
+
+        response = await test_client.get("/api/v1/todo/search?q=!!")
+        response = response.json()
+
+        assert response["status_code"] == 400
+
+    @pytest.mark.asyncio
+    @patch(COLLECTION_VERSION, AsyncMock(return_value="v1"))
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.search_todos")
+    async def test_search_todos_failed_with_prisma_error(self, mock_search_todos, test_client):
+        mock_search_todos.side_effect = Exception("Prisma Error")
+
+        response = await test_client.get("/api/v1/todo/search?q=milk")
+        response = response.json()
+
+        assert response["status_code"] == 500
+
+    # ==============================================================
+    # [GET] /api/v1/todo/changes
+    # ==============================================================
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.get_changes")
+    async def test_get_changes_success(self, mock_get_changes, test_client):
+        mock_get_changes.return_value = {
+            "changes": [{"id": "67e42cbd23fd49969709329a", "deleted": True, "todo": None}],
+            "next_token": "token",
+            "has_more": False
+        }
+
+        response = await test_client.get("/api/v1/todo/changes?since=abc&limit=5")
+        response = response.json()
+
+        mock_get_changes.assert_awaited_once_with(since="abc", limit=5)
+        assert response["status_code"] == 200
+        assert response["data"] == mock_get_changes.return_value
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.get_changes")
+    async def test_get_changes_failed_with_invalid_token(self, mock_get_changes, test_client):
+        from DalmengSimpleTodo.exceptions.todo_exception import InvalidTodoQueryException
+        mock_get_changes.side_effect = InvalidTodoQueryException("Invalid sync token")
+
+        response = await test_client.get("/api/v1/todo/changes?since=abc")
+        response = response.json()
+
+        assert response["status_code"] == 400
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.get_changes")
+    async def test_get_changes_failed_with_expired_token(self, mock_get_changes, test_client):
+        from DalmengSimpleTodo.exceptions.todo_exception import TodoChangesExpiredException
+        mock_get_changes.side_effect = TodoChangesExpiredException("Sync token expired")
+
+        response = await test_client.get("/api/v1/todo/changes?since=abc")
+        response = response.json()
+
+        assert response["status_code"] == 410
+
+    # ==============================================================
+    # [GET] /api/v1/todo/events
+    # ==============================================================
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.events.todo_events.TodoEvents.listen")
+    async def test_todo_events_stream(self, mock_listen, test_client):
+        from DalmengSimpleTodo.events.event_broker import TodoEvent
+
+        async def batches():
+            yield [TodoEvent("created", "67e42cbd23fd49969709329a", {"id": "67e42cbd23fd49969709329a", "title": "Test"})]
+            yield []
+            yield [TodoEvent("deleted", "67e42cbd23fd49969709329a")]
+        mock_listen.return_value = batches()
+
+        response = await test_client.get("/api/v1/todo/events")
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = response.text.split("\n\n")
+        assert frames[0].startswith("event: created\ndata: ")
+        assert json.loads(frames[0].split("data: ", 1)[1])["todo"]["title"] == "Test"
+        assert frames[1] == ": keepalive"
+        assert frames[2] == 'event: deleted\ndata: {"id": "67e42cbd23fd49969709329a", "todo": null}'
+
+    # ==============================================================
+    # [GET] /api/v1/todo/export
+    # ==============================================================
+
+    @staticmethod
+    async def _export_batches():
+        yield [
+            {"id": "67e42cbd23fd49969709329a", "title": "First", "content": "Content"},
+            {"id": "67e42cbd23fd49969709329b", "title": "Second", "content": "Content"},
+        ]
+        yield [{"id": "67e42cbd23fd49969709329c", "title": "Third", "content": "Content"}]
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.iter_todo_batches")
+    async def test_export_todos_ndjson(self, mock_iter_todo_batches, test_client):
+        mock_iter_todo_batches.return_value = self._export_batches()
+
+        response = await test_client.get("/api/v1/todo/export")
+        lines = response.text.splitlines()
+
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line)["title"] for line in lines] == ["First", "Second", "Third"]
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.iter_todo_batches")
+    async def test_export_todos_json_matches_envelope(self, mock_iter_todo_batches, test_client):
+        from DalmengSimpleTodo.models.base_model import BaseResponseModel
+        mock_iter_todo_batches.return_value = self._export_batches()
+
+        response = await test_client.get("/api/v1/todo/export?format=json")
+
+        rows = [row async for batch in self._export_batches() for row in batch]
+        assert response.content == BaseResponseModel.succeed(data=rows).body
+
+    @pytest.mark.asyncio
+    async def test_export_todos_failed_with_unknown_format(self, test_client):
+        response = await test_client.get("/api/v1/todo/export?format=xml")
+        response = response.json()
+
+        assert response["status_code"] == 422
+
     # ==============================================================
     # [POST] /api/v1/todo
     # ==============================================================
@@ -86,6 +419,158 @@ class TestTodo:
 
         assert response["status_code"] == 400
 
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.create_todo")
+    async def test_create_todo_failed_with_service_overloaded(self, mock_create_todo, test_client):
+        from DalmengSimpleTodo.exceptions.admission_exception import ServiceOverloadedException
+        mock_create_todo.side_effect = ServiceOverloadedException("queue is full")
+
+        response = await test_client.post("/api/v1/todo", json={"title": "Test", "content": "Content"})
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        assert response.json()["msg"] == "Service is overloaded. Try again later."
+
+    # ==============================================================
+    # [POST|PUT] /api/v1/todo/bulk, [POST] /api/v1/todo/bulk/delete
+    # ==============================================================
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.create_todos")
+    async def test_create_todos_success(self, mock_create_todos, test_client):
+        mock_create_todos.return_value = [
+            {"id": "67e42cbd23fd49969709329a", "status_code": 200, "msg": "succeed", "data": {"title": "Test"}}
+        ]
+
+        response = await test_client.post("/api/v1/todo/bulk", json={"todos": [{"title": "Test", "content": "Content"}]})
+        response = response.json()
+
+        assert response["status_code"] == 200
+        assert response["data"] == mock_create_todos.return_value
+
+    @pytest.mark.asyncio
+    async def test_create_todos_failed_with_empty_batch(self, test_client):
+        response = await test_client.post("/api/v1/todo/bulk", json={"todos": []})
+        response = response.json()
+
+        assert response["status_code"] == 422
+
+    @pytest.mark.asyncio
+    async def test_create_todos_reports_a_capped_number_of_validation_errors(self, test_client):
+        from DalmengSimpleTodo.config.app_config import AppConfig
+
+        response = await test_client.post("/api/v1/todo/bulk", json={"todos": [{}] * 20})
+        response = response.json()
+
+        assert response["status_code"] == 422
+        assert response["msg"].count("Field required") == AppConfig.VALIDATION_MAX_ERRORS
+        assert response["msg"].endswith(f"and {40 - AppConfig.VALIDATION_MAX_ERRORS} more errors")
+
+    @pytest.mark.asyncio
+    async def test_create_todos_failed_with_oversized_body(self, test_client):
+        from DalmengSimpleTodo.config.app_config import AppConfig
+        content = "x" * AppConfig.REQUEST_BODY_MAX_BYTES
+
+        response = await test_client.post("/api/v1/todo/bulk", json={"todos": [{"title": "Test", "content": content}]})
+
+        assert response.status_code == 413
+        assert response.json()["msg"] == "Request body too large."
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.create_todos")
+    async def test_create_todos_failed_with_prisma_error(self, mock_create_todos, test_client):
+        mock_create_todos.side_effect = Exception("Prisma Error")
+
+        response = await test_client.post("/api/v1/todo/bulk", json={"todos": [{"title": "Test", "content": "Content"}]})
+        response = response.json()
+
+        assert response["status_code"] == 500
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.create_todos")
+    async def test_create_todos_failed_with_todo_already_exists(self, mock_create_todos, test_client):
+        from DalmengSimpleTodo.exceptions.todo_exception import TodoAlreadyExistsException
+        mock_create_todos.side_effect = TodoAlreadyExistsException("Todo already exists")
+
+        response = await test_client.post("/api/v1/todo/bulk", json={"todos": [{"title": "Test", "content": "Content"}]})
+        response = response.json()
+
+        assert response["status_code"] == 400
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.update_todos")
+    async def test_update_todos_success(self, mock_update_todos, test_client):
+        mock_update_todos.return_value = [
+            {"id": "67e42cbd23fd49969709329a", "status_code": 404, "msg": "Todo not found", "data": None}
+        ]
+
+        response = await test_client.put("/api/v1/todo/bulk", json={"todos": [{"id": "67e42cbd23fd49969709329a", "title": "Test"}]})
+        response = response.json()
+
+        assert response["status_code"] == 200
+        assert response["data"][0]["status_code"] == 404
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.update_todos")
+    async def test_update_todos_failed_with_prisma_error(self, mock_update_todos, test_client):
+        mock_update_todos.side_effect = Exception("Prisma Error")
+
+        response = await test_client.put("/api/v1/todo/bulk", json={"todos": [{"id": "67e42cbd23fd49969709329a", "title": "Test"}]})
+        response = response.json()
+
+        assert response["status_code"] == 500
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.delete_todos")
+    async def test_delete_todos_success(self, mock_delete_todos, test_client):
+        mock_delete_todos.return_value = [
+            {"id": "67e42cbd23fd49969709329a", "status_code": 200, "msg": "succeed", "data": None}
+        ]
+
+        response = await test_client.post("/api/v1/todo/bulk/delete", json={"ids": ["67e42cbd23fd49969709329a"]})
+        response = response.json()
+
+        mock_delete_todos.assert_awaited_once_with(["67e42cbd23fd49969709329a"])
+        assert response["status_code"] == 200
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.delete_todos")
+    async def test_delete_todos_failed_with_prisma_error(self, mock_delete_todos, test_client):
+        mock_delete_todos.side_effect = Exception("Prisma Error")
+
+        response = await test_client.post("/api/v1/todo/bulk/delete", json={"ids": ["67e42cbd23fd49969709329a"]})
+        response = response.json()
+
+        assert response["status_code"] == 500
+
+    # ==============================================================
+    # [GET] /api/v1/todo/{todo_id}
+    # ==============================================================
+
+    @pytest.mark.asyncio
+    @patch(COLLECTION_VERSION, AsyncMock(return_value="v1"))
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.get_todo")
+    async def test_get_todo_success(self, mock_get_todo, test_client):
+        mock_get_todo.return_value = {"id": "67e42cbd23fd49969709329a", "title": "Test", "content": "Content"}
+
+        response = await test_client.get("/api/v1/todo/67e42cbd23fd49969709329a")
+
+        mock_get_todo.assert_awaited_once_with("67e42cbd23fd49969709329a", version="v1")
+        assert response.json()["data"] == mock_get_todo.return_value
+        not_modified = await test_client.get(
+            "/api/v1/todo/67e42cbd23fd49969709329a", headers={"If-None-Match": response.headers["etag"]}
+        )
+        assert not_modified.status_code == 304
+
+    @pytest.mark.asyncio
+    @patch(COLLECTION_VERSION, AsyncMock(return_value="v1"))
+    @pytest.mark.parametrize("exception", [TodoNotFoundException, InvalidTodoIdException])
+    async def test_get_todo_failed(self, exception, test_client):
+        with patch("DalmengSimpleTodo.service.todo_service.TodoService.get_todo", AsyncMock(side_effect=exception())):
+            response = await test_client.get("/api/v1/todo/67e42cbd23fd49969709329a")
+
+        assert response.json()["status_code"] == exception.status_code
+
     # ==============================================================
     # [PUT] /api/v1/todo/{todo_id}
     # ==============================================================
@@ -179,6 +664,17 @@ class TestTodo:
 
         assert response["status_code"] == 404
 
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.update_todo")
+    async def test_update_todo_failed_with_todo_already_exists(self, mock_update_todo, test_client):
+        from DalmengSimpleTodo.exceptions.todo_exception import TodoAlreadyExistsException
+        mock_update_todo.side_effect = TodoAlreadyExistsException("Todo already exists")
+
+        response = await test_client.put("/api/v1/todo/67e42cbd23fd49969709329a", json={"title": "Taken Title"})
+        response = response.json()
+
+        assert response["status_code"] == 400
+
     # ==============================================================
     # [DELETE] /api/v1/todo/{todo_id}
     # ==============================================================
@@ -222,6 +718,20 @@ class TestTodo:
 
         assert response["status_code"] == 500
 
+    @pytest.mark.asyncio
+    async def test_delete_todo_failed_with_malformed_id(self, test_client):
+        response = await test_client.delete("/api/v1/todo/adf")
+        response = response.json()
+
+        assert response["status_code"] == 400
+
+    @pytest.mark.asyncio
+    async def test_update_todo_failed_with_malformed_id(self, test_client):
+        response = await test_client.put("/api/v1/todo/adf", json={"title": "Updated Title"})
+        response = response.json()
+
+        assert response["status_code"] == 400
+
     @pytest.mark.asyncio
     @patch("DalmengSimpleTodo.service.todo_service.TodoService.delete_todo")
     async def test_delete_todo_failed_with_not_found(self, mock_delete_todo, test_client):
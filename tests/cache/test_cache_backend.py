@@ -0,0 +1,42 @@
+from DalmengSimpleTodo.cache.cache_backend import LRUTTLCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_lru_ttl_cache_hit_and_miss():
+    cache = LRUTTLCache(max_entries=2, ttl=10, clock=FakeClock())
+
+    assert cache.get("a") is None
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_lru_ttl_cache_evicts_least_recently_used():
+    cache = LRUTTLCache(max_entries=2, ttl=10, clock=FakeClock())
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+def test_lru_ttl_cache_expires_entries():
+    clock = FakeClock()
+    cache = LRUTTLCache(max_entries=2, ttl=10, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 10
+
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["entries"] == 0
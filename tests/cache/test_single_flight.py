@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from DalmengSimpleTodo.cache.single_flight import SingleFlight
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_load(self):
+        flight = SingleFlight()
+        loads = []
+
+        async def load():
+            loads.append(1)
+            await asyncio.sleep(0.01)
+            return object()
+
+        first, second, third = await asyncio.gather(*(flight.do("key", load) for _ in range(3)))
+        other = await flight.do("other", load)
+
+        assert first is second is third and other is not first
+        assert len(loads) == 2
+        assert flight.stats() == {"leaders": 2, "followers": 2, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_failure_is_shared_and_not_remembered(self):
+        flight = SingleFlight()
+        outcomes = [RuntimeError("down"), "ok"]
+
+        async def load():
+            await asyncio.sleep(0)
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        results = await asyncio.gather(flight.do("key", load), flight.do("key", load), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert await flight.do("key", load) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        flight = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        leader = asyncio.ensure_future(flight.do("key", load))
+        follower = asyncio.ensure_future(flight.do("key", load))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "done"
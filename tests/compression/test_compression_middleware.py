@@ -0,0 +1,114 @@
+import gzip
+from unittest.mock import patch
+
+import pytest
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from DalmengSimpleTodo.compression.codecs import CODECS, negotiate
+from DalmengSimpleTodo.compression.compression_middleware import CompressionMiddleware
+from DalmengSimpleTodo.models.base_model import BaseResponseModel
+
+TODOS = [{"id": f"{i:024x}", "title": f"Todo {i}", "content": "Content"} for i in range(100)]
+
+async def list_app(scope, receive, send):
+    size = int(scope["query_string"].decode() or len(TODOS))
+    headers = {"ETag": '"v1"'} if scope["path"] == "/tagged" else None
+    await BaseResponseModel.succeed(data=TODOS[:size], headers=headers)(scope, receive, send)
+
+async def streaming_app(scope, receive, send):
+    async def body():
+        yield b"x" * 2000
+        yield b"y" * 2000
+    await StreamingResponse(body(), media_type="application/x-ndjson")(scope, receive, send)
+
+def client_for(app):
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+class TestNegotiate:
+    def test_picks_first_preferred_accepted_encoding(self):
+        assert negotiate("gzip, deflate", ("zstd", "br", "gzip")) == "gzip"
+        assert negotiate("gzip;q=0, *", ("gzip",)) is None
+        assert negotiate("*", ("gzip",)) == "gzip"
+        assert negotiate("identity", ("gzip",)) is None
+        assert negotiate("", ("gzip",)) is None
+
+class TestCompressionMiddleware:
+    @pytest.mark.asyncio
+    async def test_large_body_is_gzipped(self):
+        async with client_for(CompressionMiddleware(list_app, minimum_size=500, encodings=("gzip",))) as client:
+            response = await client.get("/", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(BaseResponseModel.succeed(data=TODOS).body)
+        assert response.json()["data"] == TODOS
+
+    @pytest.mark.asyncio
+    async def test_small_body_and_identity_are_left_alone(self):
+        async with client_for(CompressionMiddleware(list_app, minimum_size=500, encodings=("gzip",))) as client:
+            small = await client.get("/?1", headers={"Accept-Encoding": "gzip"})
+            identity = await client.get("/", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in small.headers
+        assert "content-encoding" not in identity.headers
+        assert identity.json()["data"] == TODOS
+
+    @pytest.mark.asyncio
+    async def test_streamed_body_passes_through(self):
+        async with client_for(CompressionMiddleware(streaming_app, minimum_size=500, encodings=("gzip",))) as client:
+            response = await client.get("/", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.content == b"x" * 2000 + b"y" * 2000
+
+    @pytest.mark.asyncio
+    async def test_compressed_body_is_cached_per_etag(self):
+        calls = []
+
+        def counting_gzip(data):
+            calls.append(len(data))
+            return gzip.compress(data)
+
+        middleware = CompressionMiddleware(list_app, minimum_size=500, encodings=("gzip",))
+        with patch.dict(CODECS, {"gzip": counting_gzip}):
+            async with client_for(middleware) as client:
+                tagged = [await client.get("/tagged", headers={"Accept-Encoding": "gzip"}) for _ in range(3)]
+                untagged = [await client.get("/", headers={"Accept-Encoding": "gzip"}) for _ in range(2)]
+
+        assert len(calls) == 3
+        assert all(response.json()["data"] == TODOS for response in tagged + untagged)
+        assert tagged[0].headers["etag"] == 'W/"v1"'
+        assert middleware.cache.stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_event_stream_headers_are_sent_at_once(self):
+        # The first event or keepalive may be seconds away; EventSource clients need the
+        # status and headers before that.
+        import asyncio
+        from DalmengSimpleTodo.main import app
+        started = asyncio.Event()
+        messages = []
+
+        async def receive():
+            await asyncio.Event().wait()
+
+        async def send(message):
+            messages.append(message)
+            started.set()
+
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+            "path": "/api/v1/todo/events", "raw_path": b"/api/v1/todo/events", "root_path": "", "query_string": b"",
+            "headers": [(b"host", b"test"), (b"accept-encoding", b"gzip")], "client": ("127.0.0.1", 1), "server": ("test", 80),
+        }
+        request = asyncio.ensure_future(app(scope, receive, send))
+        try:
+            await asyncio.wait_for(started.wait(), 1)
+        finally:
+            request.cancel()
+
+        assert messages[0]["type"] == "http.response.start"
+        headers = dict(messages[0]["headers"])
+        assert headers[b"content-type"].startswith(b"text/event-stream")
+        assert b"content-encoding" not in headers
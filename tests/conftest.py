@@ -1,7 +1,14 @@
+import pytest
 import pytest_asyncio
+from unittest.mock import AsyncMock, patch
 from httpx import ASGITransport, AsyncClient
 from asgi_lifespan import LifespanManager
 from DalmengSimpleTodo.main import app
+from DalmengSimpleTodo.cache.cache_backend import LRUTTLCache
+from DalmengSimpleTodo.cache.todo_cache import TodoCache
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.events.event_backend import LocalEventBackend
+from DalmengSimpleTodo.events.todo_events import TodoEvents
 
 @pytest_asyncio.fixture
 async def test_client():
@@ -9,4 +16,27 @@ async def test_client():
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
         ) as ac:
-            yield ac
\ No newline at end of file
+            yield ac
+
+@pytest.fixture
+def collection_version():
+    """Stands in for the version the database reports; a test moves it on to model a committed write."""
+    with patch(
+        "DalmengSimpleTodo.database.prisma_todo_repository.PrismaTodoRepository.collection_version",
+        AsyncMock(return_value="v1"),
+    ) as version:
+        yield version
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_todo_cache():
+    TodoCache.set_backend(
+        LRUTTLCache(max_entries=AppConfig.TODO_CACHE_MAX_ENTRIES, ttl=AppConfig.TODO_CACHE_TTL_SECONDS)
+    )
+    yield
+    TodoCache.clear()
+
+@pytest_asyncio.fixture(autouse=True)
+async def reset_todo_events():
+    TodoEvents.set_backend(LocalEventBackend())
+    yield
+    TodoEvents.close()
@@ -0,0 +1,259 @@
+import asyncio
+
+import pytest
+
+from DalmengSimpleTodo.database.memory_todo_repository import MemoryTodoRepository, TodoRecord
+from DalmengSimpleTodo.database.todo_repository import TodoFilter
+from DalmengSimpleTodo.exceptions.todo_exception import TodoAlreadyExistsException, TodoNotFoundException
+from DalmengSimpleTodo.utils.object_id import new_object_id
+
+async def seed(repository, count):
+    return [await repository.create({"title": f"Todo {i}", "content": "Content"}) for i in range(count)]
+
+class TestMemoryTodoRepository:
+    @pytest.mark.asyncio
+    async def test_find_page_walks_forward_and_backward(self):
+        repository = MemoryTodoRepository()
+        todos = await seed(repository, 5)
+
+        assert await repository.find_page(take=2) == todos[:2]
+        assert await repository.find_page(take=2, after=todos[1].id) == todos[2:4]
+        assert await repository.find_page(take=2, before=todos[3].id) == [todos[2], todos[1]]
+
+    @pytest.mark.asyncio
+    async def test_find_page_filters_todos(self):
+        repository = MemoryTodoRepository()
+        todos = await seed(repository, 12)
+        await repository.update(todos[3].id, {"content": "Needle"})
+
+        by_prefix = await repository.find_page(take=10, filters=TodoFilter(title_prefix="Todo 1"))
+        by_title = await repository.find_page(take=10, filters=TodoFilter(title="Todo 2"))
+        by_content = await repository.find_page(take=10, filters=TodoFilter(content_contains="eed"))
+
+        assert by_prefix == [todos[1], todos[10], todos[11]]
+        assert by_title == [todos[2]]
+        assert [todo.id for todo in by_content] == [todos[3].id]
+        assert await repository.find_page(take=10, filters=TodoFilter(title="Todo 2", content_contains="eed")) == []
+
+    @pytest.mark.asyncio
+    async def test_find_page_sorts_by_title_in_both_directions(self):
+        repository = MemoryTodoRepository()
+        todos = await seed(repository, 3)
+        await repository.update(todos[0].id, {"title": "Zebra"})
+        todos[0] = await repository.find_by_id(todos[0].id)
+
+        ascending = await repository.find_page(take=2, sort="title")
+        descending = await repository.find_page(take=3, sort="title", descending=True)
+        after = await repository.find_page(take=2, after="Todo 1", sort="title")
+        before = await repository.find_page(take=2, before="Zebra", sort="title")
+
+        assert ascending == [todos[1], todos[2]]
+        assert descending == [todos[0], todos[2], todos[1]]
+        assert after == [todos[2], todos[0]]
+        assert before == [todos[2], todos[1]]
+
+    @pytest.mark.asyncio
+    async def test_find_page_walks_ids_descending(self):
+        repository = MemoryTodoRepository()
+        todos = await seed(repository, 4)
+
+        assert await repository.find_page(take=2, descending=True) == [todos[3], todos[2]]
+        assert await repository.find_page(take=2, after=todos[2].id, descending=True) == [todos[1], todos[0]]
+        assert await repository.find_page(take=2, before=todos[1].id, descending=True) == [todos[2], todos[3]]
+
+    @pytest.mark.asyncio
+    async def test_count(self):
+        repository = MemoryTodoRepository()
+        await seed(repository, 12)
+
+        assert await repository.count() == 12
+        assert await repository.count(TodoFilter(title_prefix="Todo 1")) == 3
+        assert await repository.count(TodoFilter(title="Todo 5")) == 1
+        assert await repository.count(TodoFilter(title="Missing")) == 0
+
+    @pytest.mark.asyncio
+    async def test_find_page_skips_deleted_todos(self):
+        repository = MemoryTodoRepository()
+        todos = await seed(repository, 4)
+
+        await repository.delete(todos[1].id)
+
+        assert await repository.find_page(take=2) == [todos[0], todos[2]]
+
+    @pytest.mark.asyncio
+    async def test_recreating_a_deleted_id_does_not_duplicate_the_index(self):
+        repository = MemoryTodoRepository()
+        todo = (await seed(repository, 1))[0]
+
+        await repository.delete(todo.id)
+        await repository.create(todo.to_dict())
+
+        assert [todo.id for todo in await repository.find_page(take=10)] == [todo.id]
+
+    @pytest.mark.asyncio
+    async def test_index_is_compacted_after_many_deletes(self):
+        repository = MemoryTodoRepository()
+        repository.COMPACT_MIN_TOMBSTONES = 2
+        todos = await seed(repository, 4)
+
+        await repository.delete_many([todo.id for todo in todos[:2]])
+
+        assert repository.index == [todo.id for todo in todos[2:]]
+        assert not repository.tombstones
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_ids_are_kept_sorted(self):
+        repository = MemoryTodoRepository()
+        later, earlier = new_object_id(), "000000000000000000000001"
+
+        await repository.create_many([
+            {"id": later, "title": "Later", "content": "Content"},
+            {"id": earlier, "title": "Earlier", "content": "Content"},
+        ])
+
+        assert [todo.title for todo in await repository.find_page(take=10)] == ["Earlier", "Later"]
+
+    @pytest.mark.asyncio
+    async def test_update_ignores_unset_fields(self):
+        repository = MemoryTodoRepository()
+        todo = (await seed(repository, 1))[0]
+
+        updated = await repository.update(todo.id, {"title": "Updated", "content": None})
+
+        assert (updated.id, updated.title, updated.content, updated.revision) == (todo.id, "Updated", "Content", 1)
+        assert updated.updatedAt >= todo.updatedAt
+        assert await repository.update(new_object_id(), {"title": "Missing"}) is None
+
+    @pytest.mark.asyncio
+    async def test_update_many_is_all_or_nothing(self):
+        repository = MemoryTodoRepository()
+        todo = (await seed(repository, 1))[0]
+
+        with pytest.raises(TodoNotFoundException):
+            await repository.update_many([(todo.id, {"title": "Updated"}), (new_object_id(), {"title": "Missing"})])
+
+        assert (await repository.find_by_id(todo.id)).title == "Todo 0"
+
+    @pytest.mark.asyncio
+    async def test_append_only_log_is_replayed(self, tmp_path):
+        path = str(tmp_path / "todos.log")
+        repository = MemoryTodoRepository(persist_path=path)
+        todos = await seed(repository, 3)
+        await repository.update(todos[0].id, {"title": "Updated"})
+        await repository.delete(todos[1].id)
+        await repository.disconnect()
+
+        reopened = MemoryTodoRepository(persist_path=path)
+
+        assert [todo.title for todo in await reopened.find_page(take=10)] == ["Updated", "Todo 2"]
+        await reopened.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_compact_log_keeps_live_todos(self, tmp_path):
+        path = str(tmp_path / "todos.log")
+        repository = MemoryTodoRepository(persist_path=path)
+        todos = await seed(repository, 3)
+        await repository.delete(todos[0].id)
+
+        repository.compact_log()
+        await repository.create({"title": "After compaction", "content": "Content"})
+        await repository.disconnect()
+
+        with open(path) as log:
+            assert len(log.readlines()) == 4
+        reopened = MemoryTodoRepository(persist_path=path)
+        assert [todo.title for todo in await reopened.find_page(take=10)] == ["Todo 1", "Todo 2", "After compaction"]
+        assert reopened.deleted == repository.deleted
+        await reopened.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_titles_are_unique(self):
+        repository = MemoryTodoRepository()
+        first, second = await seed(repository, 2)
+
+        with pytest.raises(TodoAlreadyExistsException):
+            await repository.create({"title": "Todo 0", "content": "Content"})
+        with pytest.raises(TodoAlreadyExistsException):
+            await repository.create_many([{"id": new_object_id(), "title": "New", "content": "Content"},
+                                          {"id": new_object_id(), "title": "New", "content": "Content"}])
+        with pytest.raises(TodoAlreadyExistsException):
+            await repository.update(second.id, {"title": "Todo 0"})
+        with pytest.raises(TodoAlreadyExistsException):
+            await repository.update_many([(first.id, {"title": "Todo 1"}), (second.id, {"title": "Todo 0"})])
+
+        assert [todo.title for todo in await repository.find_page(take=10)] == ["Todo 0", "Todo 1"]
+
+    @pytest.mark.asyncio
+    async def test_title_index_survives_replay(self, tmp_path):
+        path = str(tmp_path / "todos.log")
+        repository = MemoryTodoRepository(persist_path=path)
+        todos = await seed(repository, 2)
+        await repository.update(todos[0].id, {"title": "Renamed"})
+        await repository.delete(todos[1].id)
+        await repository.disconnect()
+
+        reopened = MemoryTodoRepository(persist_path=path)
+
+        assert reopened.titles == {"Renamed": todos[0].id}
+
+    def test_millis_reads_z_suffixed_timestamps(self):
+        assert MemoryTodoRepository._millis("2026-01-01T00:00:00.123000Z") == 1767225600123
+        assert MemoryTodoRepository._millis("2026-01-01T00:00:00Z") == 1767225600000
+        assert MemoryTodoRepository._millis(None) == 0
+
+    @pytest.mark.asyncio
+    async def test_collection_version_changes_on_every_write(self):
+        repository = MemoryTodoRepository()
+        versions = [await repository.collection_version()]
+
+        todo = (await seed(repository, 1))[0]
+        versions.append(await repository.collection_version())
+        await repository.update(todo.id, {"content": "Changed"})
+        versions.append(await repository.collection_version())
+        await repository.delete(todo.id)
+        versions.append(await repository.collection_version())
+
+        assert len(set(versions)) == 4
+        assert await repository.collection_version() == versions[-1]
+        assert await MemoryTodoRepository().collection_version() != versions[0]
+
+    @pytest.mark.asyncio
+    async def test_changes_report_latest_state_in_order(self):
+        repository = MemoryTodoRepository()
+        todos = await seed(repository, 3)
+        await asyncio.sleep(0.002)
+        await repository.update(todos[0].id, {"title": "Updated"})
+        await asyncio.sleep(0.002)
+        await repository.delete(todos[1].id)
+
+        changes = await repository.changes(None, until=2**62, take=10)
+
+        assert [change.id for change in changes] == [todos[2].id, todos[0].id, todos[1].id]
+        assert changes[1].todo.title == "Updated"
+        assert changes[2].todo is None
+        assert [change.position for change in changes] == sorted(change.position for change in changes)
+
+    @pytest.mark.asyncio
+    async def test_changes_resume_after_position_and_stop_at_until(self):
+        repository = MemoryTodoRepository()
+        await seed(repository, 3)
+        first = await repository.changes(None, until=2**62, take=2)
+
+        rest = await repository.changes(first[-1].position, until=2**62, take=10)
+        settled = await repository.changes(None, until=first[0].position[0] - 1, take=10)
+
+        assert len(rest) == 1 and rest[0].id not in {change.id for change in first}
+        assert settled == []
+
+    @pytest.mark.asyncio
+    async def test_expired_tombstones_are_purged_on_compaction(self, monkeypatch):
+        from DalmengSimpleTodo.config.app_config import AppConfig
+        repository = MemoryTodoRepository()
+        todo = (await seed(repository, 1))[0]
+        await repository.delete(todo.id)
+
+        monkeypatch.setattr(AppConfig, "TODO_TOMBSTONE_RETENTION_SECONDS", -1)
+        repository._compact_changes()
+
+        assert repository.deleted == {}
+        assert await repository.changes(None, until=2**62, take=10) == []
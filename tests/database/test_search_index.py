@@ -0,0 +1,54 @@
+from DalmengSimpleTodo.database.memory_todo_repository import TodoRecord
+from DalmengSimpleTodo.database.search_index import InvertedIndex
+
+def make_index(*todos, max_candidates=1000):
+    index = InvertedIndex(max_candidates=max_candidates)
+    for todo in todos:
+        index.update(todo.id, todo)
+    return index
+
+FIRST = TodoRecord(id="67e42cbd23fd49969709329a", title="Buy milk", content="From the store")
+SECOND = TodoRecord(id="67e42cbd23fd49969709329b", title="Store receipts", content="Milk and bread")
+
+def test_search_ranks_title_matches_first():
+    index = make_index(FIRST, SECOND)
+
+    assert index.search(["milk"], None, take=10) == [FIRST.id, SECOND.id]
+    assert index.search(["store"], None, take=10) == [SECOND.id, FIRST.id]
+
+def test_search_requires_every_term():
+    index = make_index(FIRST, SECOND)
+
+    assert index.search(["milk", "bread"], None, take=10) == [SECOND.id]
+    assert index.search(["milk", "eggs"], None, take=10) == []
+
+def test_search_expands_prefix():
+    index = make_index(FIRST, SECOND)
+
+    assert index.search([], "rec", take=10) == [SECOND.id]
+    assert index.search([], "bre", take=10) == [SECOND.id]
+    assert index.search(["buy"], "mi", take=10) == [FIRST.id]
+    assert index.search([], "zzz", take=10) == []
+
+def test_search_paginates():
+    index = make_index(FIRST, SECOND)
+
+    assert index.search(["milk"], None, take=1) == [FIRST.id]
+    assert index.search(["milk"], None, take=1, skip=1) == [SECOND.id]
+
+def test_updates_are_indexed_on_the_next_search():
+    index = make_index(FIRST, SECOND)
+    index.search(["milk"], None, take=10)
+
+    index.update(FIRST.id, TodoRecord(id=FIRST.id, title="Buy eggs", content="Later"))
+    index.update(SECOND.id, None)
+
+    assert index.search(["milk"], None, take=10) == []
+    assert index.search(["eggs"], None, take=10) == [FIRST.id]
+    assert "receipts" not in index.postings
+    assert "receipts" not in index.vocabulary
+
+def test_only_the_newest_matches_are_ranked():
+    index = make_index(FIRST, SECOND, max_candidates=1)
+
+    assert index.search([], "mil", take=10) == [SECOND.id]
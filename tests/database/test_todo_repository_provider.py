@@ -0,0 +1,13 @@
+import pytest
+
+from DalmengSimpleTodo.database.memory_todo_repository import MemoryTodoRepository
+from DalmengSimpleTodo.database.prisma_todo_repository import PrismaTodoRepository
+from DalmengSimpleTodo.database.todo_repository import TodoRepositoryProvider
+
+def test_create_repository_by_backend_name():
+    assert isinstance(TodoRepositoryProvider.create_repository("prisma"), PrismaTodoRepository)
+    assert isinstance(TodoRepositoryProvider.create_repository("memory"), MemoryTodoRepository)
+
+def test_create_repository_failed_with_unknown_backend():
+    with pytest.raises(ValueError):
+        TodoRepositoryProvider.create_repository("sqlite")
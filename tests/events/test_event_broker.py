@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from DalmengSimpleTodo.events.event_backend import LocalEventBackend
+from DalmengSimpleTodo.events.event_broker import EventBroker, RESYNC, TodoEvent
+
+def make_broker(max_pending=10):
+    return EventBroker(LocalEventBackend(), max_pending=max_pending)
+
+def event(event_type, todo_id, title="Todo"):
+    return TodoEvent(event_type, todo_id, {"id": todo_id, "title": title})
+
+class TestEventBroker:
+    @pytest.mark.asyncio
+    async def test_publish_reaches_every_subscriber(self):
+        broker = make_broker()
+        first, second = broker.subscribe(), broker.subscribe()
+
+        broker.publish(event("created", "a"))
+
+        first_batch = await first.next_batch(timeout=1)
+        second_batch = await second.next_batch(timeout=1)
+        assert [e.type for e in first_batch] == [e.type for e in second_batch] == ["created"]
+        # Encoded once, shared by both subscribers.
+        assert first_batch[0].data is second_batch[0].data
+        assert broker.stats() == {"subscribers": 2, "published": 1, "delivered": 2, "coalesced": 0, "overflowed": 0}
+
+    @pytest.mark.asyncio
+    async def test_pending_events_are_coalesced_per_todo(self):
+        broker = make_broker()
+        subscription = broker.subscribe()
+
+        broker.publish(event("created", "a", "First"))
+        broker.publish(event("updated", "b"))
+        broker.publish(event("updated", "a", "Second"))
+        broker.publish(event("updated", "b"))
+        broker.publish(event("deleted", "b"))
+
+        batch = await subscription.next_batch(timeout=1)
+        assert [(e.type, e.id) for e in batch] == [("created", "a"), ("deleted", "b")]
+        assert batch[0].todo["title"] == "Second"
+        assert broker.stats()["coalesced"] == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_overflows_to_resync(self):
+        broker = make_broker(max_pending=2)
+        slow = broker.subscribe()
+
+        for todo_id in "abcd":
+            broker.publish(event("created", todo_id))
+
+        assert await slow.next_batch(timeout=1) == [RESYNC]
+        broker.publish(event("created", "e"))
+        assert [e.id for e in await slow.next_batch(timeout=1)] == ["e"]
+
+    @pytest.mark.asyncio
+    async def test_idle_subscriber_gets_empty_batch_on_timeout(self):
+        subscription = make_broker().subscribe()
+
+        assert await subscription.next_batch(timeout=0.01) == []
+
+    @pytest.mark.asyncio
+    async def test_waiting_subscriber_wakes_on_publish_and_close(self):
+        broker = make_broker()
+        subscription = broker.subscribe()
+
+        waiting = asyncio.create_task(subscription.next_batch(timeout=10))
+        await asyncio.sleep(0)
+        broker.publish(event("created", "a"))
+        assert [e.id for e in await waiting] == ["a"]
+
+        waiting = asyncio.create_task(subscription.next_batch(timeout=10))
+        await asyncio.sleep(0)
+        broker.close()
+        assert await waiting is None
+        assert broker.stats()["subscribers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unsubscribed_subscription_gets_nothing(self):
+        broker = make_broker()
+        subscription = broker.subscribe()
+        broker.unsubscribe(subscription)
+
+        broker.publish(event("created", "a"))
+
+        assert subscription.pending == {}
@@ -0,0 +1,56 @@
+from DalmengSimpleTodo.metrics.metrics_registry import Counter, Gauge, Histogram, MetricsRegistry
+
+def test_counter_and_gauge_render():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("requests_total", "Requests.", ("status_code",)))
+    gauge = registry.register(Gauge("in_flight", "In flight."))
+
+    counter.inc(("200",))
+    counter.inc(("200",))
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+
+    rendered = registry.render()
+
+    assert "# TYPE requests_total counter" in rendered
+    assert 'requests_total{status_code="200"} 2' in rendered
+    assert "in_flight 1" in rendered
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.register(Histogram("latency_seconds", "Latency.", (0.1, 1), ("route",)))
+
+    histogram.observe(("/todo",), 0.05)
+    histogram.observe(("/todo",), 0.5)
+    histogram.observe(("/todo",), 5)
+
+    rendered = registry.render()
+
+    assert 'latency_seconds_bucket{route="/todo",le="0.1"} 1' in rendered
+    assert 'latency_seconds_bucket{route="/todo",le="1"} 2' in rendered
+    assert 'latency_seconds_bucket{route="/todo",le="+Inf"} 3' in rendered
+    assert 'latency_seconds_sum{route="/todo"} 5.55' in rendered
+    assert 'latency_seconds_count{route="/todo"} 3' in rendered
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("errors_total", "Errors.", ("msg",)))
+
+    counter.inc(('say "hi"\n',))
+
+    assert 'errors_total{msg="say \\"hi\\"\\n"} 1' in registry.render()
+
+def test_collectors_are_rendered_at_scrape_time():
+    registry = MetricsRegistry()
+    value = {"hits": 0}
+
+    def collector():
+        counter = Counter("cache_hits_total", "Hits.")
+        counter.inc((), value["hits"])
+        return [counter]
+
+    registry.register_collector(collector)
+    value["hits"] = 7
+
+    assert "cache_hits_total 7" in registry.render()
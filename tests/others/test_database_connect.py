@@ -0,0 +1,97 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.database.database_repository import DatabaseRepository
+
+def make_client(connected=False):
+    client = MagicMock()
+    client.is_connected.return_value = connected
+    client.connect = AsyncMock()
+    client.disconnect = AsyncMock()
+    client.todo.find_first = AsyncMock()
+    return client
+
+@pytest.fixture(autouse=True)
+def reset_database_repository():
+    client, client_pid = DatabaseRepository.client, DatabaseRepository.client_pid
+    DatabaseRepository.client, DatabaseRepository.client_pid = None, None
+    yield
+    DatabaseRepository.client, DatabaseRepository.client_pid = client, client_pid
+
+@patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.create_client")
+def test_get_client_is_created_once_per_process(mock_create_client):
+    mock_create_client.side_effect = [make_client(), make_client()]
+
+    first = DatabaseRepository.get_client()
+    assert DatabaseRepository.get_client() is first
+
+    with patch("DalmengSimpleTodo.database.database_repository.os.getpid", return_value=-1):
+        assert DatabaseRepository.get_client() is not first
+
+def test_build_datasource_url_with_pool_size(monkeypatch):
+    monkeypatch.setenv(AppConfig.DATABASE_URL_ENV, "mongodb://localhost:27017/todo?authSource=admin")
+    monkeypatch.setattr(AppConfig, "DATABASE_POOL_SIZE", 20)
+
+    assert DatabaseRepository.build_datasource_url() == "mongodb://localhost:27017/todo?authSource=admin&maxPoolSize=20"
+
+def test_build_datasource_url_without_pool_size(monkeypatch):
+    monkeypatch.setenv(AppConfig.DATABASE_URL_ENV, "mongodb://localhost:27017/todo")
+    monkeypatch.setattr(AppConfig, "DATABASE_POOL_SIZE", 0)
+
+    assert DatabaseRepository.build_datasource_url() == "mongodb://localhost:27017/todo"
+
+@pytest.mark.asyncio
+@patch("DalmengSimpleTodo.database.database_repository.asyncio.sleep", new_callable=AsyncMock)
+@patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.create_client")
+async def test_connect_retries_with_backoff(mock_create_client, mock_sleep):
+    client = make_client()
+    client.connect.side_effect = [Exception("engine down"), Exception("engine down"), None]
+    mock_create_client.return_value = client
+
+    await DatabaseRepository.connect(retries=3)
+
+    assert client.connect.await_count == 3
+    delays = [call.args[0] for call in mock_sleep.await_args_list]
+    assert delays == [AppConfig.DATABASE_CONNECT_BACKOFF_SECONDS, AppConfig.DATABASE_CONNECT_BACKOFF_SECONDS * 2]
+
+@pytest.mark.asyncio
+@patch("DalmengSimpleTodo.database.database_repository.asyncio.sleep", new_callable=AsyncMock)
+@patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.create_client")
+async def test_connect_failed_after_retries(mock_create_client, mock_sleep):
+    client = make_client()
+    client.connect.side_effect = Exception("engine down")
+    mock_create_client.return_value = client
+
+    with pytest.raises(Exception):
+        await DatabaseRepository.connect(retries=2)
+
+    assert client.connect.await_count == 3
+
+@pytest.mark.asyncio
+@patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.create_client")
+async def test_is_ready(mock_create_client):
+    client = make_client(connected=True)
+    mock_create_client.return_value = client
+
+    assert await DatabaseRepository.is_ready()
+
+    client.todo.find_first.side_effect = Exception("connection reset")
+    assert not await DatabaseRepository.is_ready()
+
+    client.is_connected.return_value = False
+    assert not await DatabaseRepository.is_ready()
+
+@pytest.mark.asyncio
+@patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.create_client")
+async def test_watch_reconnects_when_not_ready(mock_create_client):
+    client = make_client(connected=False)
+    mock_create_client.return_value = client
+
+    watcher = asyncio.create_task(DatabaseRepository.watch(interval=0))
+    await asyncio.sleep(0.01)
+    watcher.cancel()
+
+    client.connect.assert_awaited()
@@ -0,0 +1,96 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from asgi_lifespan import LifespanManager
+from httpx import ASGITransport, AsyncClient
+
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.database.database_startup import DatabaseStartup
+from DalmengSimpleTodo.database.startup_gate_middleware import StartupGateMiddleware
+from DalmengSimpleTodo.database.todo_repository import TodoRepositoryProvider
+from DalmengSimpleTodo.main import app
+from DalmengSimpleTodo.models.base_model import BaseResponseModel
+
+class SlowRepository:
+    def __init__(self, failures=0):
+        self.released = asyncio.Event()
+        self.failures = failures
+        self.connect_calls = 0
+        self.disconnect = AsyncMock()
+        self.is_ready = AsyncMock(return_value=True)
+
+    async def connect(self):
+        self.connect_calls += 1
+        await self.released.wait()
+        if self.connect_calls <= self.failures:
+            raise ConnectionError("engine down")
+
+async def ok_app(scope, receive, send):
+    await BaseResponseModel.succeed()(scope, receive, send)
+
+@pytest.fixture(autouse=True)
+def slow_repository():
+    previous = TodoRepositoryProvider.repository
+    repository = SlowRepository()
+    TodoRepositoryProvider.set_repository(repository)
+    yield repository
+    TodoRepositoryProvider.set_repository(previous)
+    DatabaseStartup.task = None
+
+def client_for(asgi_app):
+    return AsyncClient(transport=ASGITransport(app=asgi_app), base_url="http://test")
+
+class TestDatabaseStartup:
+    @pytest.mark.asyncio
+    async def test_lifespan_does_not_wait_for_background_connect(self, monkeypatch, slow_repository):
+        monkeypatch.setattr(AppConfig, "DATABASE_CONNECT_IN_BACKGROUND", True)
+
+        async with LifespanManager(app):
+            async with client_for(app) as client:
+                live = await client.get("/health/live")
+                not_ready = await client.get("/health/ready")
+                slow_repository.released.set()
+                await DatabaseStartup.wait(timeout=1)
+                ready = await client.get("/health/ready")
+
+        assert [live.status_code, not_ready.status_code, ready.status_code] == [200, 503, 200]
+        slow_repository.disconnect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_gate_holds_requests_until_connected(self, slow_repository):
+        DatabaseStartup.start()
+
+        async with client_for(StartupGateMiddleware(ok_app, timeout=1)) as client:
+            pending = asyncio.ensure_future(client.get("/api/v1/todo"))
+            await asyncio.sleep(0.01)
+            assert not pending.done()
+            slow_repository.released.set()
+            response = await pending
+
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_gate_times_out_with_503_and_retries_after_failure(self, slow_repository):
+        slow_repository.failures = 1
+        DatabaseStartup.start()
+
+        async with client_for(StartupGateMiddleware(ok_app, timeout=0.01)) as client:
+            timed_out = await client.get("/api/v1/todo")
+            slow_repository.released.set()
+            await asyncio.sleep(0)
+            retried = await client.get("/api/v1/todo")
+
+        assert timed_out.status_code == 503
+        assert timed_out.headers["retry-after"] == str(AppConfig.ADMISSION_RETRY_AFTER_SECONDS)
+        assert retried.status_code == 200
+        assert slow_repository.connect_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_a_pending_connect(self, slow_repository):
+        DatabaseStartup.start()
+        await asyncio.sleep(0)
+
+        await DatabaseStartup.stop()
+
+        assert DatabaseStartup.task is None and DatabaseStartup.connected()
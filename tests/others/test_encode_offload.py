@@ -0,0 +1,88 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from DalmengSimpleTodo.admission.concurrency_limiter import ConcurrencyLimiter
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.database.memory_todo_repository import TodoRecord
+from DalmengSimpleTodo.models.base_model import BaseResponseModel, OffloadedResponse
+from DalmengSimpleTodo.models.encode_offload import EncodeOffload, count_items
+from DalmengSimpleTodo.models.response_encoder import encode_envelope
+
+COLLECTION_VERSION = "DalmengSimpleTodo.service.todo_service.TodoService.get_collection_version"
+
+TODOS = {
+    "todos": [TodoRecord(id=f"67e42cbd23fd49969709329{i}", title=f"Todo {i}", content="Content") for i in range(3)],
+    "next_cursor": None,
+    "prev_cursor": None,
+}
+
+@pytest.fixture
+def offload(monkeypatch):
+    monkeypatch.setattr(AppConfig, "RESPONSE_ENCODE_OFFLOAD", "thread")
+    monkeypatch.setattr(AppConfig, "RESPONSE_ENCODE_OFFLOAD_MIN_ITEMS", 3)
+    yield
+    EncodeOffload.shutdown()
+
+class TestEncodeOffload:
+    def test_count_items(self):
+        assert count_items(TODOS) == 3
+        assert count_items([1, 2]) == 2
+        assert count_items(None) == 0
+
+    def test_small_or_disabled_payloads_stay_inline(self, offload, monkeypatch):
+        assert isinstance(BaseResponseModel.succeed(data=TODOS), OffloadedResponse)
+        assert not isinstance(BaseResponseModel.succeed(data={"todos": TODOS["todos"][:2]}), OffloadedResponse)
+
+        monkeypatch.setattr(AppConfig, "RESPONSE_ENCODE_OFFLOAD", "off")
+
+        assert not isinstance(BaseResponseModel.succeed(data=TODOS), OffloadedResponse)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("shared", [False, True])
+    async def test_offloaded_body_matches_inline_encoding(self, offload, shared):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        await BaseResponseModel.succeed(data=TODOS, headers={"ETag": '"v1"'}, shared=shared)({"type": "http"}, None, send)
+
+        body = encode_envelope(200, "succeed", TODOS)
+        assert messages[1]["body"] == body
+        assert (b"content-length", str(len(body)).encode()) in messages[0]["headers"]
+        assert (b"etag", b'"v1"') in messages[0]["headers"]
+
+    @pytest.mark.asyncio
+    @patch(COLLECTION_VERSION, AsyncMock(return_value="v1"))
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.get_todos")
+    async def test_list_route_offloads_large_pages(self, mock_get_todos, offload, test_client):
+        # A fresh object each time: a body already encoded for a shared result is reused as is.
+        mock_get_todos.return_value = dict(TODOS)
+        offloaded = EncodeOffload.offloaded
+
+        response = await test_client.get("/api/v1/todo")
+
+        assert response.content == encode_envelope(200, "succeed", TODOS)
+        assert EncodeOffload.offloaded == offloaded + 1
+
+    @pytest.mark.asyncio
+    @patch(COLLECTION_VERSION, AsyncMock(return_value="v1"))
+    @patch("DalmengSimpleTodo.service.todo_service.TodoService.get_todos")
+    async def test_full_encode_queue_is_rejected(self, mock_get_todos, offload, test_client, monkeypatch):
+        mock_get_todos.return_value = dict(TODOS)
+        limiter = ConcurrencyLimiter(max_concurrency=1, max_queue=0, queue_timeout=1, retry_after=2)
+        monkeypatch.setattr(EncodeOffload, "limiter", limiter)
+        await limiter.acquire()
+
+        response = await test_client.get("/api/v1/todo")
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "2"
+        assert limiter.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_process_pool_encodes_the_same_bytes(self, offload, monkeypatch):
+        monkeypatch.setattr(AppConfig, "RESPONSE_ENCODE_OFFLOAD", "process")
+
+        assert await EncodeOffload.encode(200, "succeed", TODOS) == encode_envelope(200, "succeed", TODOS)
+        assert EncodeOffload.stats()["in_flight"] == 0
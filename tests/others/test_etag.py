@@ -0,0 +1,18 @@
+from DalmengSimpleTodo.utils.etag import etag_matches, make_etag
+
+def test_make_etag_is_strong_and_stable():
+    etag = make_etag("v1", "/api/v1/todo", "limit=10")
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag("v1", "/api/v1/todo", "limit=10")
+    assert etag != make_etag("v2", "/api/v1/todo", "limit=10")
+    assert etag != make_etag("v1", "/api/v1/todo", "limit=20")
+
+def test_etag_matches_if_none_match_lists():
+    etag = make_etag("v1")
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
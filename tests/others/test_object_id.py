@@ -0,0 +1,13 @@
+from DalmengSimpleTodo.utils.object_id import is_object_id, new_object_id
+
+def test_new_object_id_is_valid_and_unique():
+    ids = [new_object_id() for _ in range(1000)]
+
+    assert all(is_object_id(object_id) for object_id in ids)
+    assert len(set(ids)) == len(ids)
+
+def test_is_object_id_rejects_malformed_ids():
+    assert not is_object_id("123")
+    assert not is_object_id("67e42cbd23fd49969709329z")
+    assert not is_object_id("67e42cbd23fd49969709329a\n")
+    assert is_object_id("67e42cbd23fd49969709329a")
@@ -0,0 +1,49 @@
+import json
+from datetime import datetime
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from DalmengSimpleTodo.models.response.todo_response_model import TodoResponseModel
+from DalmengSimpleTodo.models.response_encoder import ENCODERS, encode_envelope, encode_error, encode_shared_envelope, get_encoder
+
+def legacy_envelope(status_code, msg, data):
+    content = {"status_code": status_code, "msg": msg, "data": data}
+    return json.dumps(jsonable_encoder(content)).encode()
+
+@pytest.mark.parametrize("data", [
+    None,
+    [],
+    TodoResponseModel(id="67e42cbd23fd49969709329a", title="Title", content="Content"),
+    [TodoResponseModel(id="67e42cbd23fd49969709329a", title="할 일", content="Ünïcode \"quoted\"")],
+    {"todos": [TodoResponseModel(id="67e42cbd23fd49969709329a", title="Title", content="Content")], "next_cursor": None},
+    {"created_at": datetime(2025, 3, 26, 12, 0, 0), "count": 3, "ratio": 0.5, "tags": ("a", "b")},
+])
+def test_encode_envelope_matches_jsonable_encoder_output(data):
+    assert encode_envelope(200, "succeed", data) == legacy_envelope(200, "succeed", data)
+
+def test_encode_envelope_with_failed_message():
+    assert encode_envelope(404, "Todo not found") == legacy_envelope(404, "Todo not found", None)
+
+def test_get_encoder_failed_with_unknown_encoder():
+    with pytest.raises(ValueError):
+        get_encoder("pickle")
+
+@pytest.mark.skipif("orjson" not in ENCODERS, reason="orjson is not installed")
+def test_orjson_encoder_is_json_equivalent():
+    data = [TodoResponseModel(id="67e42cbd23fd49969709329a", title="할 일", content="Content")]
+
+    assert json.loads(get_encoder("orjson")(data)) == json.loads(get_encoder("stdlib")(data))
+
+def test_encode_error_is_a_cached_template():
+    assert encode_error(404, "Todo not found") == legacy_envelope(404, "Todo not found", None)
+    assert encode_error(404, "Todo not found") is encode_error(404, "Todo not found")
+
+def test_encode_shared_envelope_encodes_each_object_once():
+    data = {"todos": [{"id": "67e42cbd23fd49969709329a", "title": "Title"}]}
+
+    first = encode_shared_envelope(200, "succeed", data)
+
+    assert first == encode_envelope(200, "succeed", data)
+    assert encode_shared_envelope(200, "succeed", data) is first
+    assert encode_shared_envelope(200, "succeed", dict(data)) is not first
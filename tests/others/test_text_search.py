@@ -0,0 +1,39 @@
+from DalmengSimpleTodo.models.response.todo_response_model import TodoResponseModel
+from DalmengSimpleTodo.utils.text_search import parse_query, prefixes, rank, score, tokenize
+
+def make_todo(todo_id, title, content):
+    return TodoResponseModel(id=todo_id, title=title, content=content)
+
+def test_tokenize_lowercases_words():
+    assert tokenize("Buy MILK, then eggs!") == ["buy", "milk", "then", "eggs"]
+    assert tokenize(None) == []
+
+def test_prefixes_are_cut_to_max_length():
+    assert prefixes("Buy MILK", 3) == ["b", "bu", "buy", "m", "mi", "mil"]
+    assert prefixes(None, 3) == []
+
+def test_prefixes_skip_those_shorter_than_min_length():
+    assert prefixes("Buy MILK", 3, 2) == ["bu", "buy", "mi", "mil"]
+
+def test_parse_query_treats_last_word_as_prefix():
+    assert parse_query("buy mil") == (["buy"], "mil")
+    assert parse_query("buy milk ") == (["buy", "milk"], None)
+    assert parse_query("  ") == ([], None)
+
+def test_score_weights_title_over_content():
+    todo = make_todo("67e42cbd23fd49969709329a", "Buy milk", "milk from the store")
+
+    assert score(todo, ["milk"], None) == 3
+    assert score(todo, ["buy"], "sto") == 3
+    assert score(todo, ["eggs"], None) == 0
+    assert score(todo, [], "egg") == 0
+
+def test_rank_orders_by_score_then_id():
+    title_match = make_todo("67e42cbd23fd49969709329c", "Milk", "")
+    content_match = make_todo("67e42cbd23fd49969709329a", "Groceries", "milk")
+    other_content_match = make_todo("67e42cbd23fd49969709329b", "Shopping", "milk")
+    no_match = make_todo("67e42cbd23fd49969709329d", "Eggs", "")
+
+    ranked = rank([content_match, no_match, other_content_match, title_match], ["milk"], None)
+
+    assert ranked == [title_match, content_match, other_content_match]
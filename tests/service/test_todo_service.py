@@ -1,65 +1,386 @@
+from DalmengSimpleTodo.config.app_config import AppConfig
 from DalmengSimpleTodo.service.todo_service import TodoService
-from DalmengSimpleTodo.models.request.todo_request_model import CreateTodoRequestModel
+from DalmengSimpleTodo.utils.text_search import prefixes
+from DalmengSimpleTodo.models.request.todo_request_model import CreateTodoRequestModel, UpdateTodoRequestModel
+from DalmengSimpleTodo.models.response.todo_response_model import TodoResponseModel
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
+import time
 
 class TestTodoService:
     @pytest.mark.asyncio
-    @patch("DalmengSimpleTodo.service.todo_service.DatabaseRepository.get_client")
-    async def test_get_todos(self, mock_get_client):
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_get_todos(self, mock_get_client, collection_version):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        todo = TodoResponseModel(id="67e42cbd23fd49969709329a", title="Test Title", content="Test Content")
+        mock_prisma.todo.find_many.return_value = [todo]
+
+        result = await TodoService.get_todos()
+
+        mock_prisma.todo.find_many.assert_awaited_once_with(take=51, order={"id": "asc"})
+        assert result == {"todos": [todo], "next_cursor": None, "prev_cursor": None}
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_get_todos_with_next_page(self, mock_get_client, collection_version):
         mock_prisma = AsyncMock()
         mock_get_client.return_value = mock_prisma
         mock_prisma.todo.find_many.return_value = [
-            {"id": "123", "title": "Test Title", "content": "Test Content"}
+            TodoResponseModel(id="67e42cbd23fd49969709329a", title="First", content="Content"),
+            TodoResponseModel(id="67e42cbd23fd49969709329b", title="Second", content="Content"),
         ]
 
-        result = await TodoService.get_todos()
-        assert result == [
-            {"id": "123", "title": "Test Title", "content": "Test Content"}
+        result = await TodoService.get_todos(limit=1)
+
+        assert [todo.title for todo in result["todos"]] == ["First"]
+        assert result["prev_cursor"] is None
+
+        mock_prisma.todo.find_many.return_value = [
+            TodoResponseModel(id="67e42cbd23fd49969709329b", title="Second", content="Content"),
         ]
+        result = await TodoService.get_todos(limit=1, after=result["next_cursor"])
+
+        mock_prisma.todo.find_many.assert_awaited_with(
+            take=2, order={"id": "asc"}, where={"id": {"gt": "67e42cbd23fd49969709329a"}}
+        )
+        assert [todo.title for todo in result["todos"]] == ["Second"]
+        assert result["next_cursor"] is None
+        assert TodoService._decode_cursor(result["prev_cursor"]) == "67e42cbd23fd49969709329b"
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_get_todos_with_before_cursor(self, mock_get_client, collection_version):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.find_many.return_value = [
+            TodoResponseModel(id="67e42cbd23fd49969709329b", title="Second", content="Content"),
+            TodoResponseModel(id="67e42cbd23fd49969709329a", title="First", content="Content"),
+        ]
+
+        cursor = TodoService._encode_cursor("67e42cbd23fd49969709329c")
+        result = await TodoService.get_todos(limit=5, before=cursor)
+
+        mock_prisma.todo.find_many.assert_awaited_once_with(
+            take=6, order={"id": "desc"}, where={"id": {"lt": "67e42cbd23fd49969709329c"}}
+        )
+        assert [todo.title for todo in result["todos"]] == ["First", "Second"]
+        assert TodoService._decode_cursor(result["next_cursor"]) == "67e42cbd23fd49969709329b"
+        assert result["prev_cursor"] is None
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_get_todos_with_fields(self, mock_get_client, collection_version):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.find_many.return_value = [
+            TodoResponseModel(id="67e42cbd23fd49969709329a", title="Test Title", content="Test Content")
+        ]
+
+        result = await TodoService.get_todos(fields=["id", "title"])
+
+        assert result["todos"] == [{"id": "67e42cbd23fd49969709329a", "title": "Test Title"}]
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_get_todos_with_filters_and_sort(self, mock_get_client, collection_version):
+        from DalmengSimpleTodo.database.todo_repository import TodoFilter
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.find_many.return_value = [
+            TodoResponseModel(id="67e42cbd23fd49969709329b", title="Work B", content="Content"),
+            TodoResponseModel(id="67e42cbd23fd49969709329a", title="Work A", content="Content"),
+        ]
+
+        result = await TodoService.get_todos(
+            limit=1,
+            after=TodoService._encode_cursor("Work C"),
+            filters=TodoFilter(title_prefix="Work"),
+            sort="-title",
+        )
+
+        mock_prisma.todo.find_many.assert_awaited_once_with(
+            take=2,
+            order={"title": "desc"},
+            where={"AND": [{"title": {"startsWith": "Work"}}, {"title": {"lt": "Work C"}}]},
+        )
+        assert TodoService._decode_cursor(result["next_cursor"], object_id=False) == "Work B"
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_count_todos(self, mock_get_client, collection_version):
+        from DalmengSimpleTodo.database.todo_repository import TodoFilter
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.count.return_value = 3
+
+        assert await TodoService.count_todos(TodoFilter(title="Work")) == 3
+        assert await TodoService.count_todos(TodoFilter(title="Work")) == 3
+
+        mock_prisma.todo.count.assert_awaited_once_with(where={"title": "Work"})
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_unindexed_scan_is_rejected_on_large_collections(self, mock_get_client, monkeypatch, collection_version):
+        from DalmengSimpleTodo.config.app_config import AppConfig
+        from DalmengSimpleTodo.database.todo_repository import TodoFilter
+        from DalmengSimpleTodo.exceptions.todo_exception import InvalidTodoQueryException
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.count.return_value = 11
+        mock_prisma.todo.find_many.return_value = []
+        monkeypatch.setattr(AppConfig, "TODO_UNINDEXED_SCAN_MAX_TODOS", 10)
+
+        with pytest.raises(InvalidTodoQueryException):
+            await TodoService.get_todos(filters=TodoFilter(content_contains="milk"))
+        with pytest.raises(InvalidTodoQueryException):
+            await TodoService.count_todos(TodoFilter(content_contains="milk"))
+        await TodoService.get_todos(filters=TodoFilter(title_prefix="Groceries", content_contains="milk"))
+
+        mock_prisma.todo.count.assert_awaited_once_with()
+        mock_prisma.todo.find_many.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("kwargs", [
+        {"after": "NjdlNDJjYmQyM2ZkNDk5Njk3MDkzMjlh", "before": "NjdlNDJjYmQyM2ZkNDk5Njk3MDkzMjlh"},
+        {"after": "not-a-cursor"},
+        {"limit": 0},
+        {"fields": ["password"]},
+        {"sort": "content"},
+    ])
+    async def test_get_todos_failed_with_invalid_query(self, kwargs):
+        from DalmengSimpleTodo.exceptions.todo_exception import InvalidTodoQueryException
+        with pytest.raises(InvalidTodoQueryException):
+            await TodoService.get_todos(**kwargs)
     
     @pytest.mark.asyncio
-    @patch("DalmengSimpleTodo.service.todo_service.DatabaseRepository.get_client")
-    async def test_get_todo_by_id(self, mock_get_client):
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_search_todos(self, mock_get_client, collection_version):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        title_match = TodoResponseModel(id="67e42cbd23fd49969709329b", title="Buy milk", content="Today")
+        content_match = TodoResponseModel(id="67e42cbd23fd49969709329a", title="Groceries", content="Buy milk")
+        mock_prisma.todo.find_many.return_value = [content_match, title_match]
+
+        result = await TodoService.search_todos("buy mil", limit=1)
+
+        mock_prisma.todo.find_many.assert_awaited_once_with(
+            where={"AND": [
+                {"OR": [{"titleTerms": {"has": "buy"}}, {"contentTerms": {"has": "buy"}}]},
+                {"OR": [{"titlePrefixes": {"has": "mil"}}, {"contentPrefixes": {"has": "mil"}}]},
+            ]},
+            order={"id": "desc"},
+            take=1000,
+        )
+        assert result == {"todos": [title_match], "next_offset": 1, "matched_prefix": "mil", "candidate_limit": 1000}
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_search_todos_with_long_prefix_uses_stored_prefix_length(self, mock_get_client, monkeypatch, collection_version):
+        monkeypatch.setattr(AppConfig, "TODO_SEARCH_PREFIX_MAX_LENGTH", 4)
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        content_match = TodoResponseModel(id="67e42cbd23fd49969709329a", title="Groceries", content="Buy Milkshakes")
+        mock_prisma.todo.find_many.return_value = [content_match]
+
+        result = await TodoService.search_todos("MILKSH")
+
+        conditions = mock_prisma.todo.find_many.await_args.kwargs["where"]["AND"]
+        assert conditions == [{"OR": [{"titlePrefixes": {"has": "milk"}}, {"contentPrefixes": {"has": "milk"}}]}]
+        assert result["todos"] == [content_match]
+        assert result["matched_prefix"] == "milk"
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_search_todos_ranks_a_prefix_too_short_to_be_stored(self, mock_get_client, collection_version):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        match = TodoResponseModel(id="67e42cbd23fd49969709329a", title="Buy milk", content="Content")
+        miss = TodoResponseModel(id="67e42cbd23fd49969709329b", title="Buy eggs", content="Content")
+        mock_prisma.todo.find_many.return_value = [match, miss]
+
+        result = await TodoService.search_todos("buy m")
+
+        conditions = mock_prisma.todo.find_many.await_args.kwargs["where"]["AND"]
+        assert conditions == [{"OR": [{"titleTerms": {"has": "buy"}}, {"contentTerms": {"has": "buy"}}]}]
+        assert result["todos"] == [match]
+
+    @pytest.mark.asyncio
+    async def test_search_todos_rejects_a_one_character_prefix_alone(self):
+        from DalmengSimpleTodo.exceptions.todo_exception import InvalidTodoQueryException
+        with pytest.raises(InvalidTodoQueryException):
+            await TodoService.search_todos("m")
+
+    @pytest.mark.asyncio
+    async def test_search_todos_rejects_pages_past_the_candidate_window(self, monkeypatch):
+        from DalmengSimpleTodo.exceptions.todo_exception import InvalidTodoQueryException
+        monkeypatch.setattr(AppConfig, "TODO_SEARCH_MAX_CANDIDATES", 100)
+
+        with pytest.raises(InvalidTodoQueryException):
+            await TodoService.search_todos("milk", limit=20, offset=90)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("kwargs", [{"query": "  !? "}, {"query": "milk", "limit": 0}, {"query": "milk", "offset": -1}])
+    async def test_search_todos_failed_with_invalid_query(self, kwargs):
+        from DalmengSimpleTodo.exceptions.todo_exception import InvalidTodoQueryException
+        with pytest.raises(InvalidTodoQueryException):
+            await TodoService.search_todos(**kwargs)
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_get_changes(self, mock_get_client):
+        from datetime import datetime, timezone
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        updated = TodoResponseModel(
+            id="67e42cbd23fd49969709329b", title="Title", content="Content",
+            updatedAt=datetime(2026, 1, 1, 0, 0, 2, tzinfo=timezone.utc), revision=1,
+        )
+        tombstone = MagicMock(id="67e42cbd23fd49969709329a", deletedAt=datetime(2026, 1, 1, 0, 0, 1, tzinfo=timezone.utc))
+        mock_prisma.todo.find_many.return_value = [updated]
+        mock_prisma.todotombstone.find_many.return_value = [tombstone]
+        since = TodoService._encode_change_token((int(time.time() * 1000) - 5000, "67e42cbd23fd49969709329a"))
+
+        result = await TodoService.get_changes(since=since, limit=10)
+
+        query = mock_prisma.todo.find_many.await_args.kwargs
+        assert query["order"] == [{"updatedAt": "asc"}, {"id": "asc"}]
+        assert query["take"] == 11
+        assert query["where"]["OR"][1]["id"] == {"gt": "67e42cbd23fd49969709329a"}
+        assert mock_prisma.todotombstone.find_many.await_args.kwargs["order"] == [{"deletedAt": "asc"}, {"id": "asc"}]
+        assert [(change["id"], change["deleted"]) for change in result["changes"]] == [
+            ("67e42cbd23fd49969709329a", True), ("67e42cbd23fd49969709329b", False),
+        ]
+        assert TodoService._decode_change_token(result["next_token"]) == (1767225602000, "67e42cbd23fd49969709329b")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("since", ["not-a-token", "MTIzNC5ub3QtYW4taWQ"])
+    async def test_get_changes_failed_with_invalid_token(self, since):
+        from DalmengSimpleTodo.exceptions.todo_exception import InvalidTodoQueryException
+        with pytest.raises(InvalidTodoQueryException):
+            await TodoService.get_changes(since=since)
+
+    @pytest.mark.asyncio
+    async def test_get_changes_failed_with_expired_token(self):
+        from DalmengSimpleTodo.exceptions.todo_exception import TodoChangesExpiredException
+        since = TodoService._encode_change_token((0, "67e42cbd23fd49969709329a"))
+
+        with pytest.raises(TodoChangesExpiredException):
+            await TodoService.get_changes(since=since)
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_delete_todo_leaves_tombstone(self, mock_get_client):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.delete.return_value = TodoResponseModel(id="67e42cbd23fd49969709329a", title="Title", content="Content")
+
+        await TodoService.delete_todo("67e42cbd23fd49969709329a")
+
+        upsert = mock_prisma.todotombstone.upsert.await_args.kwargs
+        assert upsert["where"] == {"id": "67e42cbd23fd49969709329a"}
+        assert upsert["data"]["create"]["id"] == "67e42cbd23fd49969709329a"
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_get_collection_version(self, mock_get_client):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todocollectionversion.find_unique.return_value = MagicMock(value=7)
+
+        assert await TodoService.get_collection_version() == "7"
+        mock_prisma.todocollectionversion.find_unique.assert_awaited_once_with(where={"id": "todos"})
+        mock_prisma.todo.count.assert_not_awaited()
+
+        mock_prisma.todocollectionversion.find_unique.return_value = None
+
+        assert await TodoService.get_collection_version() == "0"
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_collection_version_changes_on_same_timestamp_writes(self, mock_get_client):
+        from datetime import datetime, timezone
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        counter = MagicMock(value=0)
+
+        async def upsert(where, data):
+            counter.value += 1
+
+        mock_prisma.todocollectionversion.upsert.side_effect = upsert
+        mock_prisma.todocollectionversion.find_unique.return_value = counter
+        # Both writes land in the same millisecond, the second on the smaller id.
+        moment = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        mock_prisma.todo.update.side_effect = [
+            TodoResponseModel(id="67e42cbd23fd49969709329b", title="B", content="Content", updatedAt=moment, revision=1),
+            TodoResponseModel(id="67e42cbd23fd49969709329a", title="A", content="Content", updatedAt=moment, revision=1),
+        ]
+
+        versions = [await TodoService.get_collection_version()]
+        for todo_id in ("67e42cbd23fd49969709329b", "67e42cbd23fd49969709329a"):
+            await TodoService.update_todo(todo_id, UpdateTodoRequestModel(content="Content"))
+            versions.append(await TodoService.get_collection_version())
+
+        assert len(set(versions)) == 3
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_iter_todo_batches(self, mock_get_client):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        first = TodoResponseModel(id="67e42cbd23fd49969709329a", title="First", content="Content")
+        second = TodoResponseModel(id="67e42cbd23fd49969709329b", title="Second", content="Content")
+        mock_prisma.todo.find_many.side_effect = [[first, second], []]
+
+        batches = [batch async for batch in TodoService.iter_todo_batches(batch_size=2)]
+
+        assert batches == [[first, second]]
+        mock_prisma.todo.find_many.assert_awaited_with(
+            take=2, order={"id": "asc"}, where={"id": {"gt": "67e42cbd23fd49969709329b"}}
+        )
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_get_todo(self, mock_get_client, collection_version):
         mock_prisma = AsyncMock()
         mock_get_client.return_value = mock_prisma  
         mock_prisma.todo.find_unique.return_value = {
-            "id": "123",
+            "id": "67e42cbd23fd49969709329a",
             "title": "Test Title",
             "content": "Test Content"
         }
 
-        result = await TodoService._get_todo_by_id("123")
+        result = await TodoService.get_todo("67e42cbd23fd49969709329a")
         assert result == {
-            "id": "123",
+            "id": "67e42cbd23fd49969709329a",
             "title": "Test Title",
             "content": "Test Content"
         }
 
     @pytest.mark.asyncio
-    @patch("DalmengSimpleTodo.service.todo_service.DatabaseRepository.get_client")
-    async def test_get_todo_by_id_failed_with_todo_not_found(self, mock_get_client):
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_get_todo_failed_with_todo_not_found(self, mock_get_client, collection_version):
         mock_prisma = AsyncMock()
         mock_get_client.return_value = mock_prisma
         mock_prisma.todo.find_unique.return_value = None
 
         from DalmengSimpleTodo.exceptions.todo_exception import TodoNotFoundException
         with pytest.raises(TodoNotFoundException):
-            await TodoService._get_todo_by_id("123")
+            await TodoService.get_todo("67e42cbd23fd49969709329a")
         
     
     @pytest.mark.asyncio
-    @patch("DalmengSimpleTodo.service.todo_service.DatabaseRepository.get_client")
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
     async def test_create_todo(self, mock_get_client):
         # Arrange
         mock_prisma = AsyncMock()
         mock_get_client.return_value = mock_prisma
-        mock_prisma.todo.create.return_value = {
-            "id": "123",
-            "title": "Test Title",
-            "content": "Test Content"
-        }
+        mock_prisma.todo.create.return_value = TodoResponseModel(
+            id="67e42cbd23fd49969709329a",
+            title="Test Title",
+            content="Test Content"
+        )
 
         request = CreateTodoRequestModel(title="Test Title", content="Test Content")
 
@@ -67,16 +388,49 @@ class TestTodoService:
         result = await TodoService.create_todo(request)
 
         # Assert
-        mock_prisma.todo.create.assert_awaited_once_with(data=request.to_dict())
-        assert result["title"] == "Test Title"
+        mock_prisma.todo.create.assert_awaited_once_with(data={
+            **request.to_dict(), "titleTerms": ["test", "title"], "contentTerms": ["content", "test"],
+            "titlePrefixes": prefixes("Test Title", 10, 2), "contentPrefixes": prefixes("Test Content", 10, 2),
+        })
+        assert result.title == "Test Title"
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_create_todo_failed_with_duplicate_title(self, mock_get_client):
+        from prisma.errors import UniqueViolationError
+        from DalmengSimpleTodo.exceptions.todo_exception import TodoAlreadyExistsException
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.create.side_effect = UniqueViolationError({"user_facing_error": {"error_code": "P2002"}})
+
+        with pytest.raises(TodoAlreadyExistsException):
+            await TodoService.create_todo(CreateTodoRequestModel(title="Test Title", content="Test Content"))
+
+        mock_prisma.todo.create.assert_awaited_once()
+        mock_prisma.todo.find_first.assert_not_awaited()
+        mock_prisma.todo.find_many.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_update_todo_failed_with_duplicate_title(self, mock_get_client):
+        from prisma.errors import UniqueViolationError
+        from DalmengSimpleTodo.exceptions.todo_exception import TodoAlreadyExistsException
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.update.side_effect = UniqueViolationError({"user_facing_error": {"error_code": "P2002"}})
+
+        with pytest.raises(TodoAlreadyExistsException):
+            await TodoService.update_todo("67e42cbd23fd49969709329a", UpdateTodoRequestModel(title="Taken Title"))
+
+        mock_prisma.todo.update.assert_awaited_once()
 
     @pytest.mark.asyncio
-    @patch("DalmengSimpleTodo.service.todo_service.DatabaseRepository.get_client")
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
     async def test_update_todo(self, mock_get_client):
         mock_prisma = AsyncMock()
         mock_get_client.return_value = mock_prisma
         mock_prisma.todo.update.return_value = {
-            "id": "123",
+            "id": "67e42cbd23fd49969709329a",
             "title": "Updated Title",
             "content": "Updated Content"
         }
@@ -84,32 +438,70 @@ class TestTodoService:
         from DalmengSimpleTodo.models.request.todo_request_model import UpdateTodoRequestModel
         request = UpdateTodoRequestModel(title="Updated Title", content="Updated Content")
 
-        result = await TodoService.update_todo("123", request)
+        result = await TodoService.update_todo("67e42cbd23fd49969709329a", request)
 
-        mock_prisma.todo.update.assert_awaited_once_with(where={"id": "123"}, data=request.to_dict())
+        mock_prisma.todo.update.assert_awaited_once_with(where={"id": "67e42cbd23fd49969709329a"}, data={
+            **request.to_dict(), "titleTerms": ["title", "updated"], "contentTerms": ["content", "updated"],
+            "titlePrefixes": prefixes("Updated Title", 10, 2), "contentPrefixes": prefixes("Updated Content", 10, 2),
+            "revision": {"increment": 1},
+        })
+        mock_prisma.todo.find_unique.assert_not_awaited()
         assert result["title"] == "Updated Title"
 
     @pytest.mark.asyncio
-    @patch("DalmengSimpleTodo.service.todo_service.DatabaseRepository.get_client")
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
     async def test_delete_todo(self, mock_get_client):
         mock_prisma = AsyncMock()
         mock_get_client.return_value = mock_prisma
         mock_prisma.todo.delete.return_value = {
-            "id": "123",
+            "id": "67e42cbd23fd49969709329a",
             "title": "Test Title",
             "content": "Test Content"
         }
 
-        result = await TodoService.delete_todo("123")
+        result = await TodoService.delete_todo("67e42cbd23fd49969709329a")
 
-        mock_prisma.todo.delete.assert_awaited_once_with(where={"id": "123"})
+        mock_prisma.todo.delete.assert_awaited_once_with(where={"id": "67e42cbd23fd49969709329a"})
+        mock_prisma.todo.find_unique.assert_not_awaited()
         assert result["title"] == "Test Title"
     
     @pytest.mark.asyncio
-    @patch("DalmengSimpleTodo.service.todo_service.TodoService._get_todo_by_id")
-    async def test_delete_todo_failed_with_todo_not_found(self, mock_get_todo_by_id):
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_delete_todo_failed_with_todo_not_found(self, mock_get_client):
+        from DalmengSimpleTodo.exceptions.todo_exception import TodoNotFoundException
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.delete.return_value = None
+
+        with pytest.raises(TodoNotFoundException):
+            await TodoService.delete_todo("67e42cbd23fd49969709329a")
+
+        mock_prisma.todo.find_unique.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_update_todo_failed_with_todo_not_found(self, mock_get_client):
         from DalmengSimpleTodo.exceptions.todo_exception import TodoNotFoundException
-        mock_get_todo_by_id.side_effect = TodoNotFoundException("Todo not found")
+        from DalmengSimpleTodo.models.request.todo_request_model import UpdateTodoRequestModel
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.update.return_value = None
 
         with pytest.raises(TodoNotFoundException):
-            await TodoService.delete_todo("123")
+            await TodoService.update_todo("67e42cbd23fd49969709329a", UpdateTodoRequestModel(title="Title"))
+
+        mock_prisma.todo.find_unique.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("call", [
+        lambda: TodoService.get_todo("123"),
+        lambda: TodoService.delete_todo("not-an-object-id"),
+        lambda: TodoService.update_todo("67e42cbd23fd49969709329z", UpdateTodoRequestModel(title="Title")),
+    ])
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_malformed_todo_id_failed_before_database_call(self, mock_get_client, call):
+        from DalmengSimpleTodo.exceptions.todo_exception import InvalidTodoIdException
+        with pytest.raises(InvalidTodoIdException):
+            await call()
+
+        mock_get_client.assert_not_called()
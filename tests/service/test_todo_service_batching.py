@@ -0,0 +1,108 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from DalmengSimpleTodo.config.app_config import AppConfig
+from DalmengSimpleTodo.database.memory_todo_repository import MemoryTodoRepository
+from DalmengSimpleTodo.database.todo_repository import TodoRepositoryProvider
+from DalmengSimpleTodo.exceptions.todo_exception import TodoAlreadyExistsException, TodoNotFoundException
+from DalmengSimpleTodo.models.request.todo_request_model import CreateTodoRequestModel
+from DalmengSimpleTodo.service.todo_service import TodoService
+from DalmengSimpleTodo.service.write_batcher import WriteBatcher
+
+@pytest.fixture(autouse=True)
+def memory_repository(monkeypatch):
+    previous = TodoRepositoryProvider.repository
+    repository = MemoryTodoRepository()
+    TodoRepositoryProvider.set_repository(repository)
+    monkeypatch.setattr(AppConfig, "TODO_CREATE_BATCHING_ENABLED", True)
+    monkeypatch.setattr(TodoService, "create_batcher", None)
+    yield repository
+    TodoRepositoryProvider.set_repository(previous)
+
+async def create(title):
+    return await TodoService.create_todo(CreateTodoRequestModel(title=title, content="Content"))
+
+class TestTodoServiceCreateBatching:
+    @pytest.mark.asyncio
+    async def test_concurrent_creates_share_one_create_many(self, memory_repository):
+        with patch.object(memory_repository, "create_many", wraps=memory_repository.create_many) as create_many, \
+             patch.object(memory_repository, "create", wraps=memory_repository.create) as create_one:
+            todos = await asyncio.gather(*(create(f"Todo {i}") for i in range(10)))
+
+        assert create_many.call_count == 1
+        create_one.assert_not_called()
+        assert [todo.title for todo in todos] == [f"Todo {i}" for i in range(10)]
+        assert len({todo.id for todo in todos}) == 10
+        assert await memory_repository.find_by_ids([todo.id for todo in todos]) == list(todos)
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_flushed_without_waiting(self, monkeypatch, memory_repository):
+        monkeypatch.setattr(AppConfig, "TODO_CREATE_BATCH_MAX_SIZE", 4)
+        monkeypatch.setattr(AppConfig, "TODO_CREATE_BATCH_MAX_DELAY_SECONDS", 60)
+
+        with patch.object(memory_repository, "create_many", wraps=memory_repository.create_many) as create_many:
+            await asyncio.wait_for(asyncio.gather(*(create(f"Todo {i}") for i in range(8))), timeout=1)
+
+        assert [len(call.args[0]) for call in create_many.call_args_list] == [4, 4]
+
+    @pytest.mark.asyncio
+    async def test_taken_title_fails_only_its_own_caller(self, memory_repository):
+        await memory_repository.create({"title": "Taken", "content": "Content"})
+
+        results = await asyncio.gather(create("First"), create("Taken"), create("Second"), create("First"),
+                                       return_exceptions=True)
+
+        assert [result.title for result in (results[0], results[2])] == ["First", "Second"]
+        assert isinstance(results[1], TodoAlreadyExistsException)
+        assert isinstance(results[3], TodoAlreadyExistsException)
+        assert [todo.title for todo in await memory_repository.find_page(take=10)] == ["Taken", "First", "Second"]
+
+    @pytest.mark.asyncio
+    async def test_row_not_read_back_fails_only_its_own_caller(self, monkeypatch, memory_repository):
+        find_by_ids = memory_repository.find_by_ids
+
+        async def find_by_ids_missing_lost(ids):
+            return [todo for todo in await find_by_ids(ids) if todo.title != "Lost"]
+
+        monkeypatch.setattr(memory_repository, "find_by_ids", find_by_ids_missing_lost)
+
+        results = await asyncio.gather(create("First"), create("Lost"), create("Second"), return_exceptions=True)
+
+        assert [result.title for result in (results[0], results[2])] == ["First", "Second"]
+        assert isinstance(results[1], TodoNotFoundException)
+
+    @pytest.mark.asyncio
+    async def test_batching_is_off_by_default(self, monkeypatch, memory_repository):
+        monkeypatch.setattr(AppConfig, "TODO_CREATE_BATCHING_ENABLED", False)
+
+        with patch.object(memory_repository, "create_many") as create_many:
+            await asyncio.gather(create("First"), create("Second"))
+
+        create_many.assert_not_called()
+        assert TodoService.create_batcher is None
+
+class TestWriteBatcher:
+    @pytest.mark.asyncio
+    async def test_flush_failure_fails_the_whole_batch(self):
+        async def flush(items):
+            raise RuntimeError("down")
+        batcher = WriteBatcher(flush, max_batch=10, max_delay=0)
+
+        results = await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_break_the_batch(self):
+        async def flush(items):
+            return [item * 2 for item in items]
+        batcher = WriteBatcher(flush, max_batch=10, max_delay=0.01)
+
+        cancelled = asyncio.ensure_future(batcher.submit(1))
+        kept = asyncio.ensure_future(batcher.submit(2))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await kept == 4
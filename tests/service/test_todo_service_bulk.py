@@ -0,0 +1,119 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from DalmengSimpleTodo.models.request.todo_request_model import CreateTodoRequestModel, BulkUpdateTodoItemRequestModel
+from DalmengSimpleTodo.models.response.todo_response_model import TodoResponseModel
+from DalmengSimpleTodo.service.todo_service import TodoService
+from DalmengSimpleTodo.utils.text_search import prefixes
+
+FIRST_ID = "67e42cbd23fd49969709329a"
+SECOND_ID = "67e42cbd23fd49969709329b"
+
+class TestTodoServiceBulk:
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_create_todos(self, mock_get_client):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+
+        results = await TodoService.create_todos([
+            CreateTodoRequestModel(title="First", content="Content"),
+            CreateTodoRequestModel(title="Second", content="Content"),
+        ])
+
+        rows = mock_prisma.todo.create_many.await_args.kwargs["data"]
+        mock_prisma.todo.create_many.assert_awaited_once()
+        assert [result["status_code"] for result in results] == [200, 200]
+        assert [result["id"] for result in results] == [row["id"] for row in rows]
+        assert [result["data"]["title"] for result in results] == ["First", "Second"]
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.events.todo_events.TodoEvents.publish")
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_create_todos_with_taken_title_after_partial_insert(self, mock_get_client, mock_publish):
+        from prisma.errors import UniqueViolationError
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.create_many.side_effect = UniqueViolationError({"user_facing_error": {"error_code": "P2002"}})
+
+        async def find_many(where, **kwargs):
+            # The ordered insert stored the first row before failing on the second.
+            rows = mock_prisma.todo.create_many.await_args.kwargs["data"]
+            return [TodoResponseModel(id=rows[0]["id"], title=rows[0]["title"], content="Content")]
+
+        mock_prisma.todo.find_many.side_effect = find_many
+        mock_prisma.todo.create.side_effect = [
+            UniqueViolationError({"user_facing_error": {"error_code": "P2002"}}),
+            TodoResponseModel(id=FIRST_ID, title="Last", content="Content"),
+        ]
+
+        results = await TodoService.create_todos([
+            CreateTodoRequestModel(title=title, content="Content") for title in ["First", "Taken", "Last"]
+        ])
+
+        assert [result["status_code"] for result in results] == [200, 400, 200]
+        assert [call.kwargs["data"]["title"] for call in mock_prisma.todo.create.await_args_list] == ["Taken", "Last"]
+        assert [call.args[1] for call in mock_publish.call_args_list] == [results[0]["id"], results[2]["id"]]
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_update_todos(self, mock_get_client):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        batcher = MagicMock()
+        batcher.commit = AsyncMock()
+        mock_prisma.batch_ = MagicMock(return_value=batcher)
+        mock_prisma.todo.find_many.side_effect = [
+            [TodoResponseModel(id=FIRST_ID, title="First", content="Content", revision=0)],
+            [TodoResponseModel(id=FIRST_ID, title="Updated", content="Content", revision=1)],
+        ]
+
+        results = await TodoService.update_todos([
+            BulkUpdateTodoItemRequestModel(id=FIRST_ID, title="Updated"),
+            BulkUpdateTodoItemRequestModel(id=SECOND_ID, title="Missing"),
+            BulkUpdateTodoItemRequestModel(id="123", title="Malformed"),
+        ])
+
+        batcher.todo.update.assert_called_once_with(where={"id": FIRST_ID}, data={"title": "Updated", "titleTerms": ["updated"], "titlePrefixes": prefixes("updated", 10, 2), "revision": {"increment": 1}})
+        batcher.commit.assert_awaited_once()
+        mock_prisma.todo.find_many.assert_awaited_with(where={"id": {"in": [FIRST_ID]}})
+        assert [result["status_code"] for result in results] == [200, 404, 400]
+        assert results[0]["data"] == TodoResponseModel(id=FIRST_ID, title="Updated", content="Content", revision=1)
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_update_todos_without_existing_todos_skips_commit(self, mock_get_client):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        batcher = MagicMock()
+        batcher.commit = AsyncMock()
+        mock_prisma.batch_ = MagicMock(return_value=batcher)
+        mock_prisma.todo.find_many.return_value = []
+
+        results = await TodoService.update_todos([BulkUpdateTodoItemRequestModel(id=FIRST_ID, title="Missing")])
+
+        batcher.commit.assert_not_awaited()
+        assert results[0]["status_code"] == 404
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_delete_todos(self, mock_get_client):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.find_many.return_value = [
+            TodoResponseModel(id=FIRST_ID, title="First", content="Content"),
+        ]
+
+        results = await TodoService.delete_todos([FIRST_ID, FIRST_ID, SECOND_ID, "123"])
+
+        mock_prisma.todo.delete_many.assert_awaited_once_with(where={"id": {"in": [FIRST_ID]}})
+        assert [result["status_code"] for result in results] == [200, 404, 404, 400]
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_delete_todos_with_only_malformed_ids(self, mock_get_client):
+        results = await TodoService.delete_todos(["123"])
+
+        mock_get_client.assert_not_called()
+        assert results[0]["status_code"] == 400
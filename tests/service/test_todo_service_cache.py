@@ -0,0 +1,148 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from DalmengSimpleTodo.cache.todo_cache import TodoCache
+from DalmengSimpleTodo.models.request.todo_request_model import CreateTodoRequestModel, UpdateTodoRequestModel
+from DalmengSimpleTodo.models.response.todo_response_model import TodoResponseModel
+from DalmengSimpleTodo.service.todo_service import TodoService
+
+TODO_ID = "67e42cbd23fd49969709329a"
+
+def make_todo(title):
+    return TodoResponseModel(id=TODO_ID, title=title, content="Content")
+
+class TestTodoServiceCache:
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_get_todos_is_served_from_cache(self, mock_get_client, collection_version):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.find_many.return_value = [make_todo("Cached")]
+
+        first = await TodoService.get_todos()
+        second = await TodoService.get_todos()
+
+        assert first == second
+        mock_prisma.todo.find_many.assert_awaited_once()
+        assert TodoCache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_get_todo_is_served_from_cache(self, mock_get_client, collection_version):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.find_unique.return_value = make_todo("Cached")
+
+        await TodoService.get_todo(TODO_ID)
+        result = await TodoService.get_todo(TODO_ID)
+
+        assert result.title == "Cached"
+        mock_prisma.todo.find_unique.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_create_is_never_followed_by_stale_list(self, mock_get_client, collection_version):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.find_many.return_value = []
+        await TodoService.get_todos()
+
+        mock_prisma.todo.create.return_value = make_todo("New")
+        await TodoService.create_todo(CreateTodoRequestModel(title="New", content="Content"))
+        collection_version.return_value = "v2"
+        mock_prisma.todo.find_many.return_value = [make_todo("New")]
+
+        result = await TodoService.get_todos()
+
+        assert [todo.title for todo in result["todos"]] == ["New"]
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_update_is_never_followed_by_stale_read(self, mock_get_client, collection_version):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.find_unique.return_value = make_todo("Old")
+        mock_prisma.todo.find_many.return_value = [make_todo("Old")]
+        await TodoService.get_todos()
+        await TodoService.get_todo(TODO_ID)
+
+        mock_prisma.todo.update.return_value = make_todo("New")
+        await TodoService.update_todo(TODO_ID, UpdateTodoRequestModel(title="New"))
+        collection_version.return_value = "v2"
+        mock_prisma.todo.find_unique.return_value = make_todo("New")
+        mock_prisma.todo.find_many.return_value = [make_todo("New")]
+
+        assert (await TodoService.get_todo(TODO_ID)).title == "New"
+        assert (await TodoService.get_todos())["todos"][0].title == "New"
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_delete_is_never_followed_by_stale_read(self, mock_get_client, collection_version):
+        from DalmengSimpleTodo.exceptions.todo_exception import TodoNotFoundException
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.find_unique.return_value = make_todo("Old")
+        await TodoService.get_todo(TODO_ID)
+
+        mock_prisma.todo.delete.return_value = make_todo("Old")
+        await TodoService.delete_todo(TODO_ID)
+        collection_version.return_value = "v2"
+        mock_prisma.todo.find_unique.return_value = None
+
+        with pytest.raises(TodoNotFoundException):
+            await TodoService.get_todo(TODO_ID)
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_read_racing_a_write_is_not_served_after_it(self, mock_get_client, collection_version):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        release_read = asyncio.Event()
+
+        async def slow_find_many(**kwargs):
+            await release_read.wait()
+            return [make_todo("Old")]
+
+        mock_prisma.todo.find_many.side_effect = slow_find_many
+        read = asyncio.create_task(TodoService.get_todos())
+        await asyncio.sleep(0)
+
+        mock_prisma.todo.create.return_value = make_todo("New")
+        await TodoService.create_todo(CreateTodoRequestModel(title="New", content="Content"))
+        collection_version.return_value = "v2"
+        release_read.set()
+        await read
+
+        mock_prisma.todo.find_many.side_effect = None
+        mock_prisma.todo.find_many.return_value = [make_todo("New")]
+        result = await TodoService.get_todos()
+
+        assert result["todos"][0].title == "New"
+
+    @pytest.mark.asyncio
+    @patch("DalmengSimpleTodo.database.database_repository.DatabaseRepository.get_client")
+    async def test_write_on_another_worker_is_never_followed_by_stale_read(self, mock_get_client, collection_version):
+        mock_prisma = AsyncMock()
+        mock_get_client.return_value = mock_prisma
+        mock_prisma.todo.find_many.return_value = [make_todo("Old")]
+        mock_prisma.todo.count.return_value = 1
+        await TodoService.get_todos()
+        await TodoService.count_todos()
+
+        # Committed by another process: nothing in this one is told about it.
+        collection_version.return_value = "v2"
+        mock_prisma.todo.find_many.return_value = [make_todo("New"), make_todo("Other")]
+        mock_prisma.todo.count.return_value = 2
+
+        assert [todo.title for todo in (await TodoService.get_todos())["todos"]] == ["New", "Other"]
+        assert await TodoService.count_todos() == 2
+
+    @pytest.mark.asyncio
+    async def test_collection_version_is_read_on_every_call(self, collection_version):
+        assert await TodoService.get_collection_version() == "v1"
+        collection_version.return_value = "v2"
+
+        assert await TodoService.get_collection_version() == "v2"
+        assert collection_version.await_count == 2
@@ -0,0 +1,61 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from DalmengSimpleTodo.cache.todo_cache import TodoCache
+from DalmengSimpleTodo.database.memory_todo_repository import MemoryTodoRepository
+from DalmengSimpleTodo.database.todo_repository import TodoRepositoryProvider
+from DalmengSimpleTodo.exceptions.todo_exception import TodoNotFoundException
+from DalmengSimpleTodo.models.request.todo_request_model import CreateTodoRequestModel
+from DalmengSimpleTodo.service.todo_service import TodoService
+from DalmengSimpleTodo.utils.object_id import new_object_id
+
+@pytest.fixture(autouse=True)
+def memory_repository():
+    previous = TodoRepositoryProvider.repository
+    repository = MemoryTodoRepository()
+    TodoRepositoryProvider.set_repository(repository)
+    yield repository
+    TodoRepositoryProvider.set_repository(previous)
+
+def slowed(method):
+    async def wrapper(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return await method(*args, **kwargs)
+    return wrapper
+
+class TestTodoServiceReadCoalescing:
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_reads_share_one_query(self, monkeypatch, memory_repository):
+        await memory_repository.create({"title": "Todo", "content": "Content"})
+        monkeypatch.setattr(TodoCache, "enabled", False)
+
+        with patch.object(memory_repository, "find_page", wraps=slowed(memory_repository.find_page)) as find_page:
+            results = await asyncio.gather(*(TodoService.get_todos(limit=10) for _ in range(20)))
+            other = await TodoService.get_todos(limit=5)
+
+        assert find_page.call_count == 2
+        assert all(result is results[0] for result in results)
+        assert [todo.title for todo in other["todos"]] == ["Todo"]
+
+    @pytest.mark.asyncio
+    async def test_read_started_after_a_write_does_not_join_an_older_flight(self, memory_repository):
+        with patch.object(memory_repository, "find_page", wraps=slowed(memory_repository.find_page)):
+            before_write = asyncio.ensure_future(TodoService.get_todos(limit=10))
+            await asyncio.sleep(0)
+            await TodoService.create_todo(CreateTodoRequestModel(title="New", content="Content"))
+            after_write = await TodoService.get_todos(limit=10)
+
+        assert [todo.title for todo in after_write["todos"]] == ["New"]
+        assert (await before_write)["todos"] in ([], after_write["todos"])
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_by_id_share_one_query_and_its_error(self, memory_repository):
+        missing = new_object_id()
+        with patch.object(memory_repository, "find_by_id", wraps=slowed(memory_repository.find_by_id)) as find_by_id:
+            results = await asyncio.gather(*(TodoService.get_todo(missing) for _ in range(5)),
+                                           return_exceptions=True)
+
+        assert find_by_id.call_count == 1
+        assert all(isinstance(result, TodoNotFoundException) for result in results)
@@ -0,0 +1,318 @@
+import asyncio
+
+import pytest
+
+from DalmengSimpleTodo.database.memory_todo_repository import MemoryTodoRepository
+from DalmengSimpleTodo.database.todo_repository import TodoRepositoryProvider
+from DalmengSimpleTodo.events.todo_events import TodoEvents
+from DalmengSimpleTodo.exceptions.todo_exception import TodoNotFoundException, TodoAlreadyExistsException
+from DalmengSimpleTodo.models.request.todo_request_model import CreateTodoRequestModel, UpdateTodoRequestModel, BulkUpdateTodoItemRequestModel
+from DalmengSimpleTodo.models.response.todo_response_model import TodoResponseModel
+from DalmengSimpleTodo.models.response_encoder import encode_json
+from DalmengSimpleTodo.service.todo_service import TodoService
+from DalmengSimpleTodo.utils.object_id import new_object_id
+
+@pytest.fixture(autouse=True)
+def memory_repository():
+    previous = TodoRepositoryProvider.repository
+    repository = MemoryTodoRepository()
+    TodoRepositoryProvider.set_repository(repository)
+    yield repository
+    TodoRepositoryProvider.set_repository(previous)
+
+async def create(title):
+    return await TodoService.create_todo(CreateTodoRequestModel(title=title, content="Content"))
+
+class TestTodoServiceWithMemoryRepository:
+    @pytest.mark.asyncio
+    async def test_page_through_todos_by_title(self):
+        from DalmengSimpleTodo.database.todo_repository import TodoFilter
+        for title in ["Work C", "Home", "Work A", "Work B"]:
+            await create(title)
+        filters = TodoFilter(title_prefix="Work")
+
+        first = await TodoService.get_todos(limit=2, filters=filters, sort="title")
+        second = await TodoService.get_todos(limit=2, after=first["next_cursor"], filters=filters, sort="title")
+        back = await TodoService.get_todos(limit=2, before=second["prev_cursor"], filters=filters, sort="title")
+
+        assert [todo.title for todo in first["todos"]] == ["Work A", "Work B"]
+        assert [todo.title for todo in second["todos"]] == ["Work C"]
+        assert [todo.title for todo in back["todos"]] == ["Work A", "Work B"]
+        assert await TodoService.count_todos(filters) == 3
+
+    @pytest.mark.asyncio
+    async def test_count_follows_writes(self):
+        await create("First")
+        assert await TodoService.count_todos() == 1
+
+        await create("Second")
+
+        assert await TodoService.count_todos() == 2
+
+    @pytest.mark.asyncio
+    async def test_create_and_page_through_todos(self):
+        for i in range(5):
+            await create(f"Todo {i}")
+
+        first = await TodoService.get_todos(limit=2)
+        second = await TodoService.get_todos(limit=2, after=first["next_cursor"])
+        back = await TodoService.get_todos(limit=2, before=second["prev_cursor"])
+
+        assert [todo.title for todo in first["todos"]] == ["Todo 0", "Todo 1"]
+        assert [todo.title for todo in second["todos"]] == ["Todo 2", "Todo 3"]
+        assert [todo.title for todo in back["todos"]] == ["Todo 0", "Todo 1"]
+
+    @pytest.mark.asyncio
+    async def test_get_todos_with_fields(self):
+        todo = await create("Todo")
+
+        result = await TodoService.get_todos(fields=["id", "title"])
+
+        assert result["todos"] == [{"id": todo.id, "title": "Todo"}]
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_todo(self):
+        todo = await create("Todo")
+
+        updated = await TodoService.update_todo(todo.id, UpdateTodoRequestModel(title="Updated"))
+        assert (updated.title, updated.content) == ("Updated", "Content")
+
+        await TodoService.delete_todo(todo.id)
+        with pytest.raises(TodoNotFoundException):
+            await TodoService.get_todo(todo.id)
+        with pytest.raises(TodoNotFoundException):
+            await TodoService.delete_todo(todo.id)
+        with pytest.raises(TodoNotFoundException):
+            await TodoService.update_todo(todo.id, UpdateTodoRequestModel(title="Updated"))
+
+    @pytest.mark.asyncio
+    async def test_bulk_operations(self):
+        created = await TodoService.create_todos([
+            CreateTodoRequestModel(title="First", content="Content"),
+            CreateTodoRequestModel(title="Second", content="Content"),
+        ])
+        first_id, second_id = [result["id"] for result in created]
+
+        updated = await TodoService.update_todos([
+            BulkUpdateTodoItemRequestModel(id=first_id, title="Updated"),
+            BulkUpdateTodoItemRequestModel(id=new_object_id(), title="Missing"),
+        ])
+        deleted = await TodoService.delete_todos([second_id, second_id])
+
+        assert [result["status_code"] for result in updated] == [200, 404]
+        assert (await TodoService.get_todo(first_id)).title == "Updated"
+        assert [result["status_code"] for result in deleted] == [200, 404]
+
+    @pytest.mark.asyncio
+    async def test_export_batches(self):
+        for i in range(5):
+            await create(f"Todo {i}")
+
+        batches = [batch async for batch in TodoService.iter_todo_batches(batch_size=2)]
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_records_encode_like_prisma_models(self):
+        todo = await create("Todo")
+
+        assert encode_json(todo) == encode_json(TodoResponseModel(**todo.to_dict()))
+
+    @pytest.mark.asyncio
+    async def test_search_todos_follows_writes(self):
+        milk = await create("Buy milk")
+        await create("Walk the dog")
+
+        assert [todo.id for todo in (await TodoService.search_todos("mil"))["todos"]] == [milk.id]
+
+        await TodoService.update_todo(milk.id, UpdateTodoRequestModel(title="Buy eggs"))
+        assert (await TodoService.search_todos("mil"))["todos"] == []
+        assert [todo.id for todo in (await TodoService.search_todos("eggs"))["todos"]] == [milk.id]
+
+        await TodoService.delete_todo(milk.id)
+        assert (await TodoService.search_todos("eggs"))["todos"] == []
+
+    @pytest.mark.asyncio
+    async def test_search_todos_paginates(self):
+        for i in range(3):
+            await create(f"Milk {i}")
+
+        first = await TodoService.search_todos("milk", limit=2)
+        second = await TodoService.search_todos("milk", limit=2, offset=first["next_offset"])
+
+        assert len(first["todos"]) == 2
+        assert len(second["todos"]) == 1
+        assert second["next_offset"] is None
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_keeps_rows_inserted_before_a_taken_title(self, memory_repository, monkeypatch):
+        await create("Taken")
+        create_many = memory_repository.create_many
+
+        async def ordered_create_many(rows):
+            # Like an ordered MongoDB insertMany: the rows before the clash stay inserted.
+            for row in rows:
+                await create_many([row])
+
+        monkeypatch.setattr(memory_repository, "create_many", ordered_create_many)
+        published = []
+        monkeypatch.setattr(TodoEvents, "publish", lambda event_type, todo_id, todo=None: published.append(todo_id))
+
+        results = await TodoService.create_todos([
+            CreateTodoRequestModel(title=title, content="Content") for title in ["First", "Taken", "Last"]
+        ])
+
+        assert [result["status_code"] for result in results] == [200, 400, 200]
+        assert [todo.title for todo in (await TodoService.get_todos())["todos"]] == ["Taken", "First", "Last"]
+        assert published == [results[0]["id"], results[2]["id"]]
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_reports_taken_titles_and_deleted_todos_per_item(self, memory_repository, monkeypatch):
+        first, second, third = [await create(title) for title in ["First", "Second", "Third"]]
+        find_by_ids = memory_repository.find_by_ids
+
+        async def find_then_delete(todo_ids):
+            # The third todo is deleted between the read and the update.
+            todos = await find_by_ids(todo_ids)
+            await memory_repository.delete(third.id)
+            return todos
+
+        monkeypatch.setattr(memory_repository, "find_by_ids", find_then_delete)
+        results = await TodoService.update_todos([
+            BulkUpdateTodoItemRequestModel(id=first.id, content="Updated"),
+            BulkUpdateTodoItemRequestModel(id=second.id, title="First"),
+            BulkUpdateTodoItemRequestModel(id=third.id, content="Updated"),
+        ])
+
+        assert [result["status_code"] for result in results] == [200, 400, 404]
+        assert results[0]["data"].content == "Updated"
+        assert (await TodoService.get_todo(second.id)).title == "Second"
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_returns_the_stored_todos(self, monkeypatch, memory_repository):
+        todo = await create("First")
+        find_by_ids = memory_repository.find_by_ids
+
+        async def find_then_update(todo_ids):
+            todos = await find_by_ids(todo_ids)
+            await memory_repository.update(todo.id, {"content": "Changed elsewhere"})
+            return todos
+
+        monkeypatch.setattr(memory_repository, "find_by_ids", find_then_update)
+        results = await TodoService.update_todos([BulkUpdateTodoItemRequestModel(id=todo.id, title="Updated")])
+
+        assert results[0]["data"] == await memory_repository.find_by_id(todo.id)
+        assert results[0]["data"].content == "Changed elsewhere"
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_rejects_a_repeated_id(self):
+        todo = await create("First")
+
+        results = await TodoService.update_todos([
+            BulkUpdateTodoItemRequestModel(id=todo.id, content="Once"),
+            BulkUpdateTodoItemRequestModel(id=todo.id, content="Twice"),
+        ])
+
+        assert [result["status_code"] for result in results] == [200, 400]
+        assert (await TodoService.get_todo(todo.id)).content == "Once"
+
+    @pytest.mark.asyncio
+    async def test_update_todo_to_taken_title_fails(self):
+        first = await create("First")
+        second = await create("Second")
+
+        with pytest.raises(TodoAlreadyExistsException):
+            await TodoService.update_todo(second.id, UpdateTodoRequestModel(title="First"))
+
+        assert (await TodoService.update_todo(first.id, UpdateTodoRequestModel(title="First", content="New"))).content == "New"
+        assert (await TodoService.get_todo(second.id)).title == "Second"
+
+    @pytest.mark.asyncio
+    async def test_deleted_title_can_be_reused(self):
+        todo = await create("Reused")
+        await TodoService.delete_todo(todo.id)
+
+        assert (await create("Reused")).title == "Reused"
+
+    @pytest.mark.asyncio
+    async def test_bulk_writes_reject_duplicate_titles(self):
+        results = await TodoService.create_todos([
+            CreateTodoRequestModel(title="First", content="Content"),
+            CreateTodoRequestModel(title="First", content="Content"),
+            CreateTodoRequestModel(title="Second", content="Content"),
+        ])
+        assert [result["status_code"] for result in results] == [200, 400, 200]
+
+        taken = await TodoService.create_todos([CreateTodoRequestModel(title="Second", content="Content")])
+        assert [result["status_code"] for result in taken] == [400]
+
+        first_id, second_id = results[0]["id"], results[2]["id"]
+        results = await TodoService.update_todos([
+            BulkUpdateTodoItemRequestModel(id=first_id, title="Third"),
+            BulkUpdateTodoItemRequestModel(id=second_id, title="Third"),
+        ])
+        assert [result["status_code"] for result in results] == [200, 400]
+
+        taken = await TodoService.update_todos([BulkUpdateTodoItemRequestModel(id=second_id, title="Third")])
+        assert [result["status_code"] for result in taken] == [400]
+        assert (await TodoService.get_todo(second_id)).title == "Second"
+
+    @pytest.mark.asyncio
+    async def test_get_changes_syncs_only_what_changed(self, monkeypatch):
+        from DalmengSimpleTodo.config.app_config import AppConfig
+        monkeypatch.setattr(AppConfig, "TODO_CHANGES_SETTLE_SECONDS", 0)
+        kept = await create("Kept")
+        removed = await create("Removed")
+
+        initial = await TodoService.get_changes()
+        assert [change["id"] for change in initial["changes"]] == [kept.id, removed.id]
+        assert initial["has_more"] is False
+        assert (await TodoService.get_changes(since=initial["next_token"]))["changes"] == []
+
+        await asyncio.sleep(0.002)
+        await TodoService.update_todo(kept.id, UpdateTodoRequestModel(content="Changed"))
+        await TodoService.delete_todo(removed.id)
+        delta = await TodoService.get_changes(since=initial["next_token"])
+
+        assert [(change["id"], change["deleted"]) for change in delta["changes"]] == [(kept.id, False), (removed.id, True)]
+        assert delta["changes"][0]["todo"].content == "Changed"
+
+    @pytest.mark.asyncio
+    async def test_get_changes_paginates(self, monkeypatch):
+        from DalmengSimpleTodo.config.app_config import AppConfig
+        monkeypatch.setattr(AppConfig, "TODO_CHANGES_SETTLE_SECONDS", 0)
+        for i in range(3):
+            await create(f"Todo {i}")
+
+        first = await TodoService.get_changes(limit=2)
+        second = await TodoService.get_changes(since=first["next_token"], limit=2)
+
+        assert first["has_more"] is True and len(first["changes"]) == 2
+        assert second["has_more"] is False and len(second["changes"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_changes_leaves_out_unsettled_writes(self, monkeypatch):
+        from DalmengSimpleTodo.config.app_config import AppConfig
+        monkeypatch.setattr(AppConfig, "TODO_CHANGES_SETTLE_SECONDS", 60)
+        await create("Too recent")
+
+        assert (await TodoService.get_changes())["changes"] == []
+
+    @pytest.mark.asyncio
+    async def test_writes_publish_events(self):
+        events = TodoEvents.listen(keepalive=1)
+        listening = asyncio.ensure_future(events.__anext__())
+        await asyncio.sleep(0)
+
+        todo = await create("Todo")
+        first = await listening
+        await TodoService.update_todo(todo.id, UpdateTodoRequestModel(title="Updated"))
+        [bulk] = await TodoService.create_todos([CreateTodoRequestModel(title="Bulk", content="Content")])
+        await TodoService.delete_todos([bulk["id"]])
+        await TodoService.delete_todo(todo.id)
+        second = await events.__anext__()
+        await events.aclose()
+
+        assert [(event.type, event.id) for event in first] == [("created", todo.id)]
+        assert [(event.type, event.id) for event in second] == [("deleted", bulk["id"]), ("deleted", todo.id)]
+        assert TodoEvents.stats()["subscribers"] == 0